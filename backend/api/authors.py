@@ -4,37 +4,59 @@ from backend.database.db_connection import get_connection
 from backend.utils.helpers import safe_get, format_date
 from backend.utils.validators import is_valid_email
 from backend.utils.logger import logger
-from backend.models.author_model import AuthorModel
+from backend.utils.metrics import instrumented
+from backend.models.author_model import AuthorModel, AuthorRecord
+from backend.models.records import to_dicts
+from backend.utils.pagination import keyset_query, page_rows, ranked_page
+from backend.utils.projection import select_list, pick
+from backend.search.book_index import book_index, get_book_index
+from backend.cache.catalog_cache import catalog_cache
 
 
+@instrumented
 class AuthorsAPI:
     """
     Local API class to manage authors.
     Provides CRUD + search functionality using AuthorModel.
+    Listing endpoints accept limit/after for keyset pagination, and an
+    optional fields list to select only those columns (e.g. without bio).
     """
 
-    def get_all(self):
+    SORT_COLUMNS = {"full_name": "full_name"}
+
+    # Author record key → column, for listings projected to a few fields
+    FIELD_COLUMNS = {f: f for f in ("author_id", "full_name", "country", "birth_year", "death_year", "bio", "created_at")}
+
+    def get_all(self, limit=None, after=None, order_by=None, descending=False, fields=None):
         """
-        Returns all authors. Optionally filter by search string in name or country.
+        Returns all authors, one page at a time when limit is given.
         """
+        try:
+            query, params, limit, key_fields = keyset_query(
+                self._select(fields, order_by), [], [], "author_id", None, self.SORT_COLUMNS,
+                limit, after, order_by, descending
+            )
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+
         conn = get_connection()
         if not conn:
             logger.error("DB connection failed in get_all()")
             return {"status": "error", "message": "DB connection failed"}
 
-        cursor = conn.cursor(dictionary=True)
+        cursor = conn.cursor()
         try:
-            query = "SELECT * FROM authors"
-            cursor.execute(query)
+            cursor.execute(query, params)
 
-            authors_rows = cursor.fetchall()
-            authors = [AuthorModel.from_db_row(row).to_dict() for row in authors_rows]
+            authors_rows, next_cursor, has_more = page_rows(AuthorRecord.read_all(cursor), limit, key_fields)
+            authors = self._project(authors_rows, fields)
 
-            logger.info(f"Fetched {len(authors)} authors from database")
-            return {"status": "success","message":"Fetched all authors", "data": authors}
+            logger.info("Fetched %s authors from database", len(authors))
+            return {"status": "success","message":"Fetched all authors", "data": authors,
+                    "next_cursor": next_cursor, "has_more": has_more}
 
         except Exception as e:
-            logger.error(f"Error fetching authors: {e}")
+            logger.error("Error fetching authors: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -56,14 +78,14 @@ class AuthorsAPI:
             row = cursor.fetchone()
             if row:
                 author = AuthorModel.from_db_row(row)
-                logger.info(f"Author fetched: {author_id}")
+                logger.info("Author fetched: %s", author_id)
                 return {"status": "success", "message":"Fetched author by id", "data": author.to_dict()}
             else:
-                logger.warning(f"Author not found: {author_id}")
+                logger.warning("Author not found: %s", author_id)
                 return {"status": "error", "message": "Author not found"}
 
         except Exception as e:
-            logger.error(f"Error fetching author by ID {author_id}: {e}")
+            logger.error("Error fetching author by ID %s: %s", author_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -99,7 +121,8 @@ class AuthorsAPI:
             conn.commit()
 
             author_id = cursor.lastrowid
-            logger.info(f"Author added: {author_id} - {full_name}")
+            logger.info("Author added: %s - %s", author_id, full_name)
+            book_index.index_entity("author", author_id, full_name)
 
             # Return the newly created AuthorModel instance
             new_author = AuthorModel(
@@ -113,7 +136,7 @@ class AuthorsAPI:
             return {"status": "success", "message": "Author added", "data": new_author.to_dict()}
 
         except Exception as e:
-            logger.error(f"Error adding author: {e}")
+            logger.error("Error adding author: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -140,14 +163,17 @@ class AuthorsAPI:
             query = f"UPDATE authors SET {fields} WHERE author_id=%s"
             cursor.execute(query, values)
             conn.commit()
-            logger.info(f"Author updated: {author_id}")
+            logger.info("Author updated: %s", author_id)
 
             # Return updated author instance
             updated_author = self.get_by_id(author_id)
+            if "full_name" in author_data:
+                book_index.index_entity("author", author_id, author_data["full_name"])
+                catalog_cache.invalidate_link("author_id", author_id)
             return {"status": "success", "message": "Author updated", "data": updated_author.get("data")}
 
         except Exception as e:
-            logger.error(f"Error updating author {author_id}: {e}")
+            logger.error("Error updating author %s: %s", author_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -166,17 +192,21 @@ class AuthorsAPI:
         try:
             cursor.execute("DELETE FROM authors WHERE author_id=%s", (author_id,))
             conn.commit()
-            logger.info(f"Author deleted: {author_id}")
+            logger.info("Author deleted: %s", author_id)
+            book_index.remove_entity("author", author_id)
+            # books cascade with their author
+            catalog_cache.invalidate_link("author_id", author_id, listings=True)
             return {"status": "success", "message": "Author deleted", "data": author_id}
 
         except Exception as e:
-            logger.error(f"Error deleting author {author_id}: {e}")
+            logger.error("Error deleting author %s: %s", author_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
             conn.close()
 
-    def search(self, field=None, query=None):
+    def search(self, field=None, query=None, limit=None, after=None, order_by=None, descending=False,
+               fields=None):
         """
         Dynamically search authors by any valid field.
 
@@ -184,52 +214,117 @@ class AuthorsAPI:
             search('country', 'India') → all Indian authors
             search('full_name', 'Vikram') → authors with 'Vikram' in name
             search(None, None) → all authors
+            search(None, 'India') → name, country or bio containing 'India'
+            search('name_prefix', 'vik se') → names matching every word as a prefix, best match first
         """
-        valid_fields = ["full_name", "country", "birth_year", "death_year", "bio"]
+        valid_fields = ["full_name", "country", "birth_year", "death_year", "bio", "name_prefix"]
 
         # Validate the field to prevent SQL injection
         if field is not None and field not in valid_fields:
             return {"status": "error", "message": f"Invalid search field '{field}'"}
 
+        if field == "name_prefix":
+            # Name words as prefixes in relevance order → search index
+            if query and not order_by:
+                index = get_book_index()
+                if index is not None:
+                    return self._ranked_search(index, query, limit, after, fields)
+            field = "full_name"
+
         conn = get_connection()
         if not conn:
             logger.error("DB connection failed in search()")
             return {"status": "error", "message": "DB connection failed"}
 
-        cursor = conn.cursor(dictionary=True)
+        cursor = conn.cursor()
         try:
             if field and query:
                 # Special case: numeric fields (year-based) should not use LIKE
                 if field in ["birth_year", "death_year"]:
-                    sql = f"SELECT * FROM authors WHERE {field} = %s"
-                    cursor.execute(sql, (query,))
+                    where, params = [f"{field} = %s"], [query]
                 else:
-                    sql = f"SELECT * FROM authors WHERE {field} LIKE %s"
-                    cursor.execute(sql, (f"%{query}%",))
+                    where, params = [f"{field} LIKE %s"], [f"%{query}%"]
             elif query:
                 # Universal search if only query provided (search across all text fields)
-                sql = """
-                    SELECT * FROM authors
-                    WHERE full_name LIKE %s
-                    OR country LIKE %s
-                    OR bio LIKE %s
-                """
                 like_value = f"%{query}%"
-                cursor.execute(sql, (like_value, like_value, like_value))
+                where = ["full_name LIKE %s OR country LIKE %s OR bio LIKE %s"]
+                params = [like_value, like_value, like_value]
             else:
                 # No field and no query → return all
-                sql = "SELECT * FROM authors"
-                cursor.execute(sql)
+                where, params = [], []
 
-            rows = cursor.fetchall()
-            authors = [AuthorModel.from_db_row(row).to_dict() for row in rows]
-            logger.info(f"Search returned {len(authors)} authors (field={field}, query={query})")
+            try:
+                sql, params, limit, key_fields = keyset_query(
+                    self._select(fields, order_by), where, params, "author_id", None, self.SORT_COLUMNS,
+                    limit, after, order_by, descending
+                )
+            except ValueError as e:
+                return {"status": "error", "message": str(e)}
 
-            return {"status": "success","message": "search results", "data": authors}
+            cursor.execute(sql, params)
+            rows, next_cursor, has_more = page_rows(AuthorRecord.read_all(cursor), limit, key_fields)
+            authors = self._project(rows, fields)
+            logger.info("Search returned %s authors (field=%s, query=%s)", len(authors), field, query)
+
+            return {"status": "success","message": "search results", "data": authors,
+                    "next_cursor": next_cursor, "has_more": has_more}
 
         except Exception as e:
-            logger.error(f"Error searching authors: {e}")
+            logger.error("Error searching authors: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
             conn.close()
+
+    def _ranked_search(self, index, query, limit=None, after=None, fields=None):
+        """
+        Answers a free-text name search from the search index; only the rows
+        of the returned page are read from the database.
+        """
+        try:
+            select = self._select(fields)
+            hits, total, next_cursor, has_more = ranked_page(
+                lambda n, after_key: index.search_entities("author", query, limit=n, after=after_key), limit, after
+            )
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+        exhaustive = index.is_exhaustive(query, "author")
+        if not hits:
+            return {"status": "success", "message": "search results", "data": [], "next_cursor": None, "has_more": False,
+                    "exhaustive": exhaustive}
+
+        conn = get_connection()
+        if not conn:
+            logger.error("DB connection failed in _ranked_search()")
+            return {"status": "error", "message": "DB connection failed"}
+
+        cursor = conn.cursor()
+        try:
+            ids = [author_id for author_id, _ in hits]
+            cursor.execute(f"{select} WHERE author_id IN ({', '.join(['%s'] * len(ids))})", ids)
+            by_id = {row["author_id"]: row for row in AuthorRecord.read_all(cursor)}
+            # Keep index order; skip authors deleted by another process
+            authors = self._project([by_id[i] for i in ids if i in by_id], fields)
+            logger.info("Ranked author search: '%s' → %s hits", query, total)
+            return {"status": "success", "message": "search results", "data": authors,
+                    "next_cursor": next_cursor, "has_more": has_more, "exhaustive": exhaustive}
+        except Exception as e:
+            logger.error("Error searching authors: %s", e)
+            return {"status": "error", "message": str(e)}
+        finally:
+            cursor.close()
+            conn.close()
+
+    def _select(self, fields=None, order_by=None):
+        """
+        Returns "SELECT ... FROM authors" for every column, or only the given
+        fields plus the paging keys. Raises ValueError for an unknown field.
+        """
+        if not fields:
+            return "SELECT * FROM authors"
+        key_fields = ["author_id"] + ([order_by] if order_by in self.SORT_COLUMNS else [])
+        return f"SELECT {select_list(fields, self.FIELD_COLUMNS, key_fields)} FROM authors"
+
+    @staticmethod
+    def _project(authors, fields=None):
+        return [pick(a, fields) for a in authors] if fields else to_dicts(authors)
@@ -1,7 +1,8 @@
 # backend/api/books.py
 
 from backend.database.db_connection import get_connection
-from backend.models.book_model import BookModel
+from backend.models.book_model import BookRecord
+from backend.models.records import to_dicts
 from backend.utils.helpers import safe_get, round_price
 from backend.utils.validators import (
     is_positive_number,
@@ -9,42 +10,125 @@ from backend.utils.validators import (
     is_valid_isbn
 )
 from backend.utils.logger import logger
+from backend.utils.metrics import instrumented
+from backend.utils.pagination import keyset_query, page_rows, ranked_page
+from backend.utils.projection import check_fields, select_list, pick
+from backend.search.book_index import book_index, get_book_index
+from backend.cache.catalog_cache import catalog_cache
+
+# Largest IN (...) list sent when fetching books by id
+FETCH_BY_ID_CHUNK = 1000
+
+# Book fields that decide the order of a listing; changing one invalidates cached listings
+LISTING_ORDER_FIELDS = {"title", "price", "created_at"}
+
+# Book record key → SELECT expression, for listings projected to a few fields
+FIELD_COLUMNS = {
+    "book_id": "b.book_id",
+    "title": "b.title",
+    "author_id": "b.author_id",
+    "author": "a.full_name AS author_name",
+    "publisher_id": "b.publisher_id",
+    "publisher_name": "p.name AS publisher_name",
+    "category_id": "b.category_id",
+    "genre": "c.name AS genre",
+    "language": "b.language",
+    "isbn": "b.isbn",
+    "publication_year": "b.publication_year",
+    "price": "b.price",
+    "stock": "b.stock",
+    "reorder_point": "b.reorder_point",
+    "description": "b.description",
+    "created_at": "b.created_at",
+    "updated_at": "b.updated_at"
+}
+
+BOOK_JOINS = """
+                FROM books b
+                LEFT JOIN authors a ON b.author_id = a.author_id
+                LEFT JOIN publishers p ON b.publisher_id = p.publisher_id
+                LEFT JOIN categories c ON b.category_id = c.category_id
+"""
 
 
+@instrumented
 class BookAPI:
     """
     Local API for managing books in the Bookshop Management System.
     Handles CRUD operations + dynamic search.
+    Listing endpoints accept limit/after for keyset pagination.
+    A search without a field is answered from the in-memory search index,
+    ranked by relevance.
+    get_all() / get_by_id() read through the in-memory catalog cache; every
+    write path that changes a book row invalidates it.
+    Listings and searches take an optional fields list: only the columns
+    those record keys need are selected, so e.g. a table listing does not
+    read every description.
+    Reads build BookRecords straight from the cursor's tuples (and cache
+    them); responses carry plain dict copies with the keys of
+    BookModel.to_dict().
     """
 
+    # Columns a listing may be sorted by (must be NOT NULL for keyset paging)
+    SORT_COLUMNS = {
+        "title": "b.title",
+        "price": "b.price",
+        "created_at": "b.created_at"
+    }
+
     # -------------------------------------------------------------
     # GET ALL BOOKS
     # -------------------------------------------------------------
-    def get_all(self):
+    def get_all(self, limit=None, after=None, order_by=None, descending=False, fields=None):
+        try:
+            sql, params, limit, key_fields = keyset_query(
+                self._select(fields, order_by), [], [], "book_id", "b.book_id", self.SORT_COLUMNS,
+                limit, after, order_by, descending)
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+
+        cache_key = (limit, after, order_by, bool(descending))
+        generation = catalog_cache.generation
+        listing = catalog_cache.get_listing(cache_key)
+        if listing is not None:
+            book_ids, next_cursor, has_more = listing
+            found, missing = catalog_cache.get_many(book_ids)
+            if not missing:
+                books = [found[i] for i in book_ids]
+                return {"status": "success", "data": self._project(books, fields),
+                        "next_cursor": next_cursor, "has_more": has_more}
+
         conn = get_connection()
         if not conn:
             return {"status": "error", "message": "DB connection failed"}
 
-        cursor = conn.cursor(dictionary=True)
+        cursor = conn.cursor()
         try:
-            cursor.execute("""
-                SELECT 
-                    b.*, 
-                    a.full_name AS author_name,
-                    p.name AS publisher_name,
-                    c.name AS genre
-                FROM books b
-                LEFT JOIN authors a ON b.author_id = a.author_id
-                LEFT JOIN publishers p ON b.publisher_id = p.publisher_id
-                LEFT JOIN categories c ON b.category_id = c.category_id
-            """)
-
-            rows = cursor.fetchall()
-            books = [BookModel.from_db_row(r).to_dict() for r in rows]
-            return {"status": "success", "data": books}
+            if listing is not None:
+                # Listing still valid, some rows evicted or invalidated: fetch just those
+                fetched = self._fetch_by_ids(cursor, missing)
+                catalog_cache.put_many(fetched.values(), generation)
+                found.update(fetched)
+                books = [found[i] for i in book_ids if i in found]
+                return {"status": "success", "data": self._project(books, fields),
+                        "next_cursor": next_cursor, "has_more": has_more}
+
+            cursor.execute(sql, params)
+
+            books, next_cursor, has_more = page_rows(BookRecord.read_all(cursor), limit, key_fields)
+            if fields:
+                # Partial rows are returned as they are and never cached
+                return {"status": "success", "data": self._project(books, fields),
+                        "next_cursor": next_cursor, "has_more": has_more}
+
+            if len(books) <= catalog_cache.max_rows:
+                # A larger (unpaged) listing would only churn the cache; it is re-run as one scan
+                catalog_cache.put_many(books, generation)
+                catalog_cache.put_listing(cache_key, [b["book_id"] for b in books], next_cursor, has_more, generation)
+            return {"status": "success", "data": to_dicts(books), "next_cursor": next_cursor, "has_more": has_more}
 
         except Exception as e:
-            logger.error(f"Error fetching books: {e}")
+            logger.error("Error fetching books: %s", e)
             return {"status": "error", "message": str(e)}
 
         finally:
@@ -54,34 +138,34 @@ class BookAPI:
     # -------------------------------------------------------------
     # GET BOOK BY ID
     # -------------------------------------------------------------
-    def get_by_id(self, book_id):
+    def get_by_id(self, book_id, fields=None):
+        try:
+            check_fields(fields or [], FIELD_COLUMNS)
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+
+        cached = catalog_cache.get(book_id)
+        if cached is not None:
+            return {"status": "success", "data": pick(cached, fields) if fields else cached.to_dict()}
+
+        generation = catalog_cache.generation
         conn = get_connection()
         if not conn:
             return {"status": "error", "message": "DB connection failed"}
 
-        cursor = conn.cursor(dictionary=True)
+        cursor = conn.cursor()
         try:
-            cursor.execute("""
-                SELECT 
-                    b.*, 
-                    a.full_name AS author_name,
-                    p.name AS publisher_name,
-                    c.name AS genre
-                FROM books b
-                LEFT JOIN authors a ON b.author_id = a.author_id
-                LEFT JOIN publishers p ON b.publisher_id = p.publisher_id
-                LEFT JOIN categories c ON b.category_id = c.category_id
-                WHERE b.book_id=%s
-            """, (book_id,))
+            cursor.execute(self._select() + "WHERE b.book_id=%s", (book_id,))
 
-            row = cursor.fetchone()
-            if not row:
+            book = BookRecord.read_one(cursor)
+            if book is None:
                 return {"status": "error", "message": "Book not found"}
 
-            return {"status": "success", "data": BookModel.from_db_row(row).to_dict()}
+            catalog_cache.put(book, generation)
+            return {"status": "success", "data": pick(book, fields) if fields else book.to_dict()}
 
         except Exception as e:
-            logger.error(f"Error fetching book {book_id}: {e}")
+            logger.error("Error fetching book %s: %s", book_id, e)
             return {"status": "error", "message": str(e)}
 
         finally:
@@ -108,6 +192,7 @@ class BookAPI:
         publication_year = safe_get(book_data, "publication_year")
         language = safe_get(book_data, "language", "English")
         stock = safe_get(book_data, "stock", 0)
+        reorder_point = safe_get(book_data, "reorder_point")
         description = safe_get(book_data, "description", "")
 
         if isbn and not is_valid_isbn(isbn):
@@ -116,6 +201,9 @@ class BookAPI:
         if not is_non_negative_integer(stock):
             return {"status": "error", "message": "Invalid stock amount"}
 
+        if reorder_point is not None and not is_non_negative_integer(reorder_point):
+            return {"status": "error", "message": "Invalid reorder point"}
+
         conn = get_connection()
         if not conn:
             return {"status": "error", "message": "DB connection failed"}
@@ -124,20 +212,24 @@ class BookAPI:
         try:
             cursor.execute("""
                 INSERT INTO books 
-                (title, isbn, author_id, publisher_id, category_id, publication_year, language, price, stock, description)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                (title, isbn, author_id, publisher_id, category_id, publication_year, language, price, stock, reorder_point, description)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """, (
                 title, isbn, author_id, publisher_id, category_id,
-                publication_year, language, round_price(price), stock, description
+                publication_year, language, round_price(price), stock, reorder_point, description
             ))
 
             conn.commit()
             book_id = cursor.lastrowid
+            catalog_cache.invalidate_books([], listings=True)
 
-            return self.get_by_id(book_id)
+            result = self.get_by_id(book_id)
+            if result["status"] == "success":
+                book_index.index_book(result["data"])
+            return result
 
         except Exception as e:
-            logger.error(f"Error adding book: {e}")
+            logger.error("Error adding book: %s", e)
             return {"status": "error", "message": str(e)}
 
         finally:
@@ -157,6 +249,9 @@ class BookAPI:
         if "stock" in book_data and not is_non_negative_integer(book_data["stock"]):
             return {"status": "error", "message": "Invalid stock"}
 
+        if book_data.get("reorder_point") is not None and not is_non_negative_integer(book_data["reorder_point"]):
+            return {"status": "error", "message": "Invalid reorder point"}
+
         if "price" in book_data and not is_positive_number(book_data["price"]):
             return {"status": "error", "message": "Invalid price"}
 
@@ -174,11 +269,15 @@ class BookAPI:
         try:
             cursor.execute(f"UPDATE books SET {fields} WHERE book_id=%s", values)
             conn.commit()
+            catalog_cache.invalidate_books([book_id], listings=bool(LISTING_ORDER_FIELDS & set(book_data)))
 
-            return self.get_by_id(book_id)
+            result = self.get_by_id(book_id)
+            if result["status"] == "success":
+                book_index.index_book(result["data"])
+            return result
 
         except Exception as e:
-            logger.error(f"Error updating {book_id}: {e}")
+            logger.error("Error updating %s: %s", book_id, e)
             return {"status": "error", "message": str(e)}
 
         finally:
@@ -197,11 +296,13 @@ class BookAPI:
         try:
             cursor.execute("DELETE FROM books WHERE book_id=%s", (book_id,))
             conn.commit()
+            book_index.remove_book(book_id)
+            catalog_cache.invalidate_books([book_id], listings=True)
 
             return {"status": "success", "message": "Book deleted"}
 
         except Exception as e:
-            logger.error(f"Error deleting book {book_id}: {e}")
+            logger.error("Error deleting book %s: %s", book_id, e)
             return {"status": "error", "message": str(e)}
 
         finally:
@@ -211,7 +312,8 @@ class BookAPI:
     # -------------------------------------------------------------
     # SEARCH
     # -------------------------------------------------------------
-    def search(self, field=None, query=None):
+    def search(self, field=None, query=None, limit=None, after=None, order_by=None, descending=False,
+               fields=None):
         FIELD_MAP = {
             # Books table
             "title": "b.title",
@@ -235,206 +337,63 @@ class BookAPI:
             "category_name": "c.name"
         }
 
-        conn = get_connection()
-        if not conn:
-            return {"status": "error", "message": "DB connection failed"}
-
-        cursor = conn.cursor(dictionary=True)
+        # Free-text query in relevance order → search index
+        if query and not field and not order_by:
+            index = get_book_index()
+            if index is not None:
+                return self._ranked_search(index, query, limit, after, fields)
 
         try:
-            base_sql = """
-                SELECT 
-                    b.*, 
-                    a.full_name AS author_name,
-                    p.name AS publisher_name,
-                    c.name AS genre
-                FROM books b
-                JOIN authors a ON b.author_id = a.author_id
-                JOIN publishers p ON b.publisher_id = p.publisher_id
-                JOIN categories c ON b.category_id = c.category_id
-            """
-
-            # No query → return all
-            if not query:
-                cursor.execute(base_sql)
-                rows = cursor.fetchall()
-                return {"status": "success", "data": [BookModel.from_db_row(r).to_dict() for r in rows]}
-
-            params = []
-            where_clauses = []
-
-            if field:
-                if field not in FIELD_MAP:
-                    return {"status": "error", "message": f"Invalid search field '{field}'"}
-
-                col = FIELD_MAP[field]
-                where_clauses.append(f"{col} LIKE %s")
-                params.append(f"%{query}%")
-
-            else:
-                SEARCHABLE = [
-                    "b.title", "b.isbn", "b.language", "b.description",
-                    "a.full_name", "p.name", "c.name"
-                ]
-
-                for col in SEARCHABLE:
-                    where_clauses.append(f"{col} LIKE %s")
-                    params.append(f"%{query}%")
-
-            final_sql = base_sql + " WHERE " + " OR ".join(f"({w})" for w in where_clauses)
-
-            cursor.execute(final_sql, params)
-            rows = cursor.fetchall()
-
-            return {"status": "success", "data": [BookModel.from_db_row(r).to_dict() for r in rows]}
-
-        except Exception as e:
-            logger.error(f"Search error: {e}")
+            base_sql = self._select(fields, order_by)
+        except ValueError as e:
             return {"status": "error", "message": str(e)}
 
-        finally:
-            cursor.close()
-            conn.close()
-# backend/api/books.py
-
-from backend.database.db_connection import get_connection
-from backend.models.book_model import BookModel
-from backend.utils.helpers import safe_get, round_price
-from backend.utils.validators import (
-    is_positive_number,
-    is_non_negative_integer,
-    is_valid_isbn
-)
-from backend.utils.logger import logger
-
-
-class BookAPI:
-    """
-    Local API for managing books in the Bookshop Management System.
-    Handles CRUD operations + dynamic search.
-    """
-
-    # -------------------------------------------------------------
-    # GET ALL BOOKS
-    # -------------------------------------------------------------
-    def get_all(self):
         conn = get_connection()
         if not conn:
             return {"status": "error", "message": "DB connection failed"}
 
-        cursor = conn.cursor(dictionary=True)
-        try:
-            cursor.execute("""
-                SELECT 
-                    b.*, 
-                    a.full_name AS author_name,
-                    p.name AS publisher_name,
-                    c.name AS genre
-                FROM books b
-                LEFT JOIN authors a ON b.author_id = a.author_id
-                LEFT JOIN publishers p ON b.publisher_id = p.publisher_id
-                LEFT JOIN categories c ON b.category_id = c.category_id
-            """)
-
-            rows = cursor.fetchall()
-            books = [BookModel.from_db_row(r).to_dict() for r in rows]
-            return {"status": "success", "data": books}
-
-        except Exception as e:
-            logger.error(f"Error fetching books: {e}")
-            return {"status": "error", "message": str(e)}
-
-        finally:
-            cursor.close()
-            conn.close()
-
-    # -------------------------------------------------------------
-    # GET BOOK BY ID
-    # -------------------------------------------------------------
-    def get_by_id(self, book_id):
-        conn = get_connection()
-        if not conn:
-            return {"status": "error", "message": "DB connection failed"}
+        cursor = conn.cursor()
 
-        cursor = conn.cursor(dictionary=True)
         try:
-            cursor.execute("""
-                SELECT 
-                    b.*, 
-                    a.full_name AS author_name,
-                    p.name AS publisher_name,
-                    c.name AS genre
-                FROM books b
-                LEFT JOIN authors a ON b.author_id = a.author_id
-                LEFT JOIN publishers p ON b.publisher_id = p.publisher_id
-                LEFT JOIN categories c ON b.category_id = c.category_id
-                WHERE b.book_id=%s
-            """, (book_id,))
-
-            row = cursor.fetchone()
-            if not row:
-                return {"status": "error", "message": "Book not found"}
-
-            return {"status": "success", "data": BookModel.from_db_row(row).to_dict()}
-
-        except Exception as e:
-            logger.error(f"Error fetching book {book_id}: {e}")
-            return {"status": "error", "message": str(e)}
-
-        finally:
-            cursor.close()
-            conn.close()
-
-    # -------------------------------------------------------------
-    # ADD NEW BOOK
-    # -------------------------------------------------------------
-    def add(self, book_data):
-        title = safe_get(book_data, "title")
-        author_id = safe_get(book_data, "author_id")
-        publisher_id = safe_get(book_data, "publisher_id")
-        category_id = safe_get(book_data, "category_id")  # correct field
-        price = safe_get(book_data, "price")
-
-        if not title or not author_id or not publisher_id or not category_id:
-            return {"status": "error", "message": "Missing required fields"}
-
-        if not is_positive_number(price):
-            return {"status": "error", "message": "Invalid price"}
-
-        isbn = safe_get(book_data, "isbn")
-        publication_year = safe_get(book_data, "publication_year")
-        language = safe_get(book_data, "language", "English")
-        stock = safe_get(book_data, "stock", 0)
-        description = safe_get(book_data, "description", "")
+            params = []
+            where_clauses = []
 
-        if isbn and not is_valid_isbn(isbn):
-            return {"status": "error", "message": "Invalid ISBN"}
+            # No query → return all
+            if query:
+                if field:
+                    if field not in FIELD_MAP:
+                        return {"status": "error", "message": f"Invalid search field '{field}'"}
 
-        if not is_non_negative_integer(stock):
-            return {"status": "error", "message": "Invalid stock amount"}
+                    col = FIELD_MAP[field]
+                    where_clauses.append(f"{col} LIKE %s")
+                    params.append(f"%{query}%")
 
-        conn = get_connection()
-        if not conn:
-            return {"status": "error", "message": "DB connection failed"}
+                else:
+                    SEARCHABLE = [
+                        "b.title", "b.isbn", "b.language", "b.description",
+                        "a.full_name", "p.name", "c.name"
+                    ]
 
-        cursor = conn.cursor()
-        try:
-            cursor.execute("""
-                INSERT INTO books 
-                (title, isbn, author_id, publisher_id, category_id, publication_year, language, price, stock, description)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                title, isbn, author_id, publisher_id, category_id,
-                publication_year, language, round_price(price), stock, description
-            ))
+                    where_clauses.append(" OR ".join(f"{col} LIKE %s" for col in SEARCHABLE))
+                    params.extend(f"%{query}%" for _ in SEARCHABLE)
 
-            conn.commit()
-            book_id = cursor.lastrowid
+            try:
+                final_sql, params, limit, key_fields = keyset_query(
+                    base_sql, where_clauses, params, "book_id", "b.book_id", self.SORT_COLUMNS,
+                    limit, after, order_by, descending
+                )
+            except ValueError as e:
+                return {"status": "error", "message": str(e)}
 
-            return self.get_by_id(book_id)
+            cursor.execute(final_sql, params)
+            rows, next_cursor, has_more = page_rows(BookRecord.read_all(cursor), limit, key_fields)
+            results = self._project(rows, fields)
+            logger.info("Search by %s: '%s' → %s results", field, query, len(results))
+            return {"status": "success", "message":"Search results", "data": results,
+                    "next_cursor": next_cursor, "has_more": has_more}
 
         except Exception as e:
-            logger.error(f"Error adding book: {e}")
+            logger.error("Search error: %s", e)
             return {"status": "error", "message": str(e)}
 
         finally:
@@ -442,63 +401,54 @@ class BookAPI:
             conn.close()
 
     # -------------------------------------------------------------
-    # UPDATE BOOK
+    # RANKED (INDEXED) SEARCH
     # -------------------------------------------------------------
-    def update(self, book_id, book_data):
-        if not book_data:
-            return {"status": "error", "message": "No update fields"}
-
-        if "isbn" in book_data and book_data["isbn"] and not is_valid_isbn(book_data["isbn"]):
-            return {"status": "error", "message": "Invalid ISBN"}
-
-        if "stock" in book_data and not is_non_negative_integer(book_data["stock"]):
-            return {"status": "error", "message": "Invalid stock"}
-
-        if "price" in book_data and not is_positive_number(book_data["price"]):
-            return {"status": "error", "message": "Invalid price"}
-
-        if "price" in book_data:
-            book_data["price"] = round_price(book_data["price"])
-
-        fields = ", ".join(f"{key}=%s" for key in book_data.keys())
-        values = list(book_data.values()) + [book_id]
-
-        conn = get_connection()
-        if not conn:
-            return {"status": "error", "message": "DB connection failed"}
-
-        cursor = conn.cursor()
+    def _ranked_search(self, index, query, limit=None, after=None, fields=None):
+        """
+        Answers a free-text search from the search index. The cursor holds the
+        (score, book_id) of the last hit on the previous page. Only the rows of
+        the returned page are read from the database. "exhaustive" tells whether
+        every prefix term was fully expanded (see BookSearchIndex.is_exhaustive).
+        """
         try:
-            cursor.execute(f"UPDATE books SET {fields} WHERE book_id=%s", values)
-            conn.commit()
-
-            return self.get_by_id(book_id)
-
-        except Exception as e:
-            logger.error(f"Error updating {book_id}: {e}")
+            check_fields(fields or [], FIELD_COLUMNS)
+            hits, total, next_cursor, has_more = ranked_page(
+                lambda n, after_key: index.search(query, limit=n, after=after_key), limit, after
+            )
+        except ValueError as e:
             return {"status": "error", "message": str(e)}
+        exhaustive = index.is_exhaustive(query)
 
-        finally:
-            cursor.close()
-            conn.close()
+        ids = [book_id for book_id, _ in hits]
+        generation = catalog_cache.generation
+        books_by_id, missing = catalog_cache.get_many(ids)
+        if not missing:
+            results = self._project([books_by_id[i] for i in ids], fields)
+            return {"status": "success", "message": "Search results", "data": results,
+                    "next_cursor": next_cursor, "has_more": has_more, "exhaustive": exhaustive}
 
-    # -------------------------------------------------------------
-    # DELETE BOOK
-    # -------------------------------------------------------------
-    def delete(self, book_id):
         conn = get_connection()
         if not conn:
             return {"status": "error", "message": "DB connection failed"}
 
         cursor = conn.cursor()
         try:
-            cursor.execute("DELETE FROM books WHERE book_id=%s", (book_id,))
-            conn.commit()
+            if fields:
+                # Fetch the missing hits partially, without caching
+                books_by_id.update(self._fetch_by_ids(cursor, missing, fields))
+            else:
+                fetched = self._fetch_by_ids(cursor, missing)
+                catalog_cache.put_many(fetched.values(), generation)
+                books_by_id.update(fetched)
 
-            return {"status": "success", "message": "Book deleted"}
+            # Keep index order; skip hits deleted by another process
+            results = self._project([books_by_id[i] for i in ids if i in books_by_id], fields)
+            logger.info("Ranked search: '%s' → %s hits", query, total)
+            return {"status": "success", "message": "Search results", "data": results,
+                    "next_cursor": next_cursor, "has_more": has_more, "exhaustive": exhaustive}
 
         except Exception as e:
-            logger.error(f"Error deleting book {book_id}: {e}")
+            logger.error("Search error: %s", e)
             return {"status": "error", "message": str(e)}
 
         finally:
@@ -506,91 +456,36 @@ class BookAPI:
             conn.close()
 
     # -------------------------------------------------------------
-    # SEARCH
+    # HELPERS
     # -------------------------------------------------------------
-    def search(self, field=None, query=None):
-        FIELD_MAP = {
-            # Books table
-            "title": "b.title",
-            "isbn": "b.isbn",
-            "language": "b.language",
-            "price": "b.price",
-            "description": "b.description",
-            "publication_year": "b.publication_year",
-
-            # Author
-            "author": "a.full_name",
-            "country": "a.country",
-
-            # Publisher
-            "publisher_name": "p.name",
-            "location": "p.location",
-
-            # Category
-            "genre": "c.name",
-            "category": "c.name",
-            "category_name": "c.name"
-        }
-
-        conn = get_connection()
-        if not conn:
-            return {"status": "error", "message": "DB connection failed"}
-
-        cursor = conn.cursor(dictionary=True)
-
-        try:
-            base_sql = """
-                SELECT 
-                    b.*, 
-                    a.full_name AS author_name,
-                    p.name AS publisher_name,
-                    c.name AS genre
-                FROM books b
-                LEFT JOIN authors a ON b.author_id = a.author_id
-                LEFT JOIN publishers p ON b.publisher_id = p.publisher_id
-                LEFT JOIN categories c ON b.category_id = c.category_id
-            """
-
-            # No query → return all
-            if not query:
-                cursor.execute(base_sql)
-                rows = cursor.fetchall()
-                return {"status": "success", "data": [BookModel.from_db_row(r).to_dict() for r in rows]}
-
-            params = []
-            where_clauses = []
-
-            if field:
-                if field not in FIELD_MAP:
-                    return {"status": "error", "message": f"Invalid search field '{field}'"}
-
-                col = FIELD_MAP[field]
-                where_clauses.append(f"{col} LIKE %s")
-                params.append(f"%{query}%")
-
-            else:
-                SEARCHABLE = [
-                    "b.title", "b.isbn", "b.language", "b.description",
-                    "a.full_name", "p.name", "c.name"
-                ]
-
-                for col in SEARCHABLE:
-                    where_clauses.append(f"{col} LIKE %s")
-                    params.append(f"%{query}%")
-
-            final_sql = base_sql + " WHERE (" + " OR ".join(f"({w})" for w in where_clauses) + ")"
-
-            cursor.execute(final_sql, params)
-            rows = cursor.fetchall()
-            print(len(rows))
-            results = [BookModel.from_db_row(r).to_dict() for r in rows]
-            logger.info(f"Search by {field}: '{query}' → {len(results)} results")
-            return {"status": "success", "message":"Search results", "data": results}
-
-        except Exception as e:
-            logger.error(f"Search error: {e}")
-            return {"status": "error", "message": str(e)}
-
-        finally:
-            cursor.close()
-            conn.close()
+    def _select(self, fields=None, order_by=None):
+        """
+        Returns the SELECT ... FROM ... joins for book rows: every column, or
+        only the columns the given fields need plus the paging keys.
+        Raises ValueError for an unknown field.
+        """
+        if not fields:
+            columns = "b.*, a.full_name AS author_name, p.name AS publisher_name, c.name AS genre"
+        else:
+            key_fields = ["book_id"] + ([order_by] if order_by in self.SORT_COLUMNS else [])
+            columns = select_list(fields, FIELD_COLUMNS, key_fields)
+        return f"SELECT {columns}{BOOK_JOINS}"
+
+    @staticmethod
+    def _project(books, fields=None):
+        return [pick(b, fields) for b in books] if fields else to_dicts(books)
+
+    def _fetch_by_ids(self, cursor, book_ids, fields=None):
+        """
+        Returns {book_id: BookRecord} for the given ids, in chunked IN (...) queries.
+        Ids that no longer exist are simply absent. With fields the values are
+        dicts holding only those keys.
+        """
+        books = {}
+        for i in range(0, len(book_ids), FETCH_BY_ID_CHUNK):
+            chunk = list(book_ids[i:i + FETCH_BY_ID_CHUNK])
+            placeholders = ", ".join(["%s"] * len(chunk))
+            cursor.execute(self._select(fields) + f"WHERE b.book_id IN ({placeholders})", chunk)
+            for book in BookRecord.read_all(cursor):
+                books[book["book_id"]] = pick(book, fields) if fields else book
+        return books
@@ -3,19 +3,35 @@
 from backend.database.db_connection import get_connection
 from backend.utils.helpers import safe_get, format_date
 from backend.utils.logger import logger
+from backend.utils.metrics import instrumented
 from backend.models.category_model import CategoryModel
+from backend.utils.pagination import keyset_query, page_rows
+from backend.search.book_index import book_index
+from backend.cache.catalog_cache import catalog_cache
 
 
+@instrumented
 class CategoriesAPI:
     """
     Local API class to manage book categories.
     Provides CRUD + search functionality using CategoryModel.
+    get_all() accepts limit/after for keyset pagination.
     """
 
-    def get_all(self):
+    SORT_COLUMNS = {"name": "name"}
+
+    def get_all(self, limit=None, after=None, order_by=None, descending=False):
         """
         Returns all categories
         """
+        try:
+            query, params, limit, key_fields = keyset_query(
+                "SELECT * FROM categories", [], [], "category_id", None, self.SORT_COLUMNS,
+                limit, after, order_by, descending
+            )
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+
         conn = get_connection()
         if not conn:
             logger.error("DB connection failed in get_all()")
@@ -23,15 +39,14 @@ class CategoriesAPI:
 
         cursor = conn.cursor(dictionary=True)
         try:
-            query = "SELECT * FROM categories"
-            cursor.execute(query)
-            rows = cursor.fetchall()
+            cursor.execute(query, params)
+            rows, next_cursor, has_more = page_rows(cursor.fetchall(), limit, key_fields)
             categories = [CategoryModel.from_db_row(row).to_dict() for row in rows]
-            logger.info(f"Fetched {len(categories)} categories")
-            return {"status": "success", "data": categories}
+            logger.info("Fetched %s categories", len(categories))
+            return {"status": "success", "data": categories, "next_cursor": next_cursor, "has_more": has_more}
 
         except Exception as e:
-            logger.error(f"Error fetching categories: {e}")
+            logger.error("Error fetching categories: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -53,14 +68,14 @@ class CategoriesAPI:
             row = cursor.fetchone()
             if row:
                 category = CategoryModel.from_db_row(row)
-                logger.info(f"Category fetched: {category_id}")
+                logger.info("Category fetched: %s", category_id)
                 return {"status": "success", "data": category.to_dict()}
             else:
-                logger.warning(f"Category not found: {category_id}")
+                logger.warning("Category not found: %s", category_id)
                 return {"status": "error", "message": "Category not found"}
 
         except Exception as e:
-            logger.error(f"Error fetching category by ID {category_id}: {e}")
+            logger.error("Error fetching category by ID %s: %s", category_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -89,7 +104,8 @@ class CategoriesAPI:
             cursor.execute(query, (name, description))
             conn.commit()
             category_id = cursor.lastrowid
-            logger.info(f"Category added: {category_id} - {name}")
+            logger.info("Category added: %s - %s", category_id, name)
+            book_index.index_entity("category", category_id, name)
 
             new_category = CategoryModel(
                 category_id=category_id,
@@ -99,7 +115,7 @@ class CategoriesAPI:
             return {"status": "success", "message": "Category added", "data": new_category.to_dict()}
 
         except Exception as e:
-            logger.error(f"Error adding category: {e}")
+            logger.error("Error adding category: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -126,13 +142,16 @@ class CategoriesAPI:
             query = f"UPDATE categories SET {fields} WHERE category_id=%s"
             cursor.execute(query, values)
             conn.commit()
-            logger.info(f"Category updated: {category_id}")
+            logger.info("Category updated: %s", category_id)
+            if "name" in category_data:
+                book_index.index_entity("category", category_id, category_data["name"])
+                catalog_cache.invalidate_link("category_id", category_id)
 
             updated_category = self.get_by_id(category_id)
             return {"status": "success", "message": "Category updated", "data": updated_category.get("data")}
 
         except Exception as e:
-            logger.error(f"Error updating category {category_id}: {e}")
+            logger.error("Error updating category %s: %s", category_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -151,11 +170,13 @@ class CategoriesAPI:
         try:
             cursor.execute("DELETE FROM categories WHERE category_id=%s", (category_id,))
             conn.commit()
-            logger.info(f"Category deleted: {category_id}")
+            logger.info("Category deleted: %s", category_id)
+            book_index.remove_entity("category", category_id)
+            catalog_cache.invalidate_link("category_id", category_id)
             return {"status": "success", "message": "Category deleted","data": f"{category_id}"}
 
         except Exception as e:
-            logger.error(f"Error deleting category {category_id}: {e}")
+            logger.error("Error deleting category %s: %s", category_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
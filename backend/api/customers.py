@@ -4,35 +4,49 @@ from backend.database.db_connection import get_connection
 from backend.utils.helpers import safe_get, format_date
 from backend.utils.validators import is_valid_email, is_non_empty_string
 from backend.utils.logger import logger
-from backend.models.customer_model import CustomerModel
+from backend.utils.metrics import instrumented
+from backend.models.customer_model import CustomerModel, CustomerRecord
+from backend.models.records import to_dicts
+from backend.utils.pagination import keyset_query, page_rows
 
 
+@instrumented
 class CustomersAPI:
     """
     Local API class to manage customers using CustomerModel.
     Provides CRUD + search functionality.
+    Listing endpoints accept limit/after for keyset pagination.
     """
 
-    def get_all(self):
+    SORT_COLUMNS = {"full_name": "full_name", "created_at": "created_at"}
+
+    def get_all(self, limit=None, after=None, order_by=None, descending=False):
         """
         Returns all customers
         """
+        try:
+            query, params, limit, key_fields = keyset_query(
+                "SELECT * FROM customers", [], [], "customer_id", None, self.SORT_COLUMNS,
+                limit, after, order_by, descending
+            )
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+
         conn = get_connection()
         if not conn:
             logger.error("DB connection failed in get_all()")
             return {"status": "error", "message": "DB connection failed"}
 
-        cursor = conn.cursor(dictionary=True)
+        cursor = conn.cursor()
         try:
-            query = "SELECT * FROM customers WHERE 1=1"
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            customers = [CustomerModel.from_db_row(row).to_dict() for row in rows]
-            logger.info(f"Fetched {len(customers)} customers")
-            return {"status": "success","message":"Fetched all customers", "data": customers}
+            cursor.execute(query, params)
+            customers, next_cursor, has_more = page_rows(CustomerRecord.read_all(cursor), limit, key_fields)
+            logger.info("Fetched %s customers", len(customers))
+            return {"status": "success","message":"Fetched all customers", "data": to_dicts(customers),
+                    "next_cursor": next_cursor, "has_more": has_more}
 
         except Exception as e:
-            logger.error(f"Error fetching customers: {e}")
+            logger.error("Error fetching customers: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -54,14 +68,14 @@ class CustomersAPI:
             row = cursor.fetchone()
             if row:
                 customer = CustomerModel.from_db_row(row)
-                logger.info(f"Customer fetched: {customer_id}")
+                logger.info("Customer fetched: %s", customer_id)
                 return {"status": "success","message":"Fetched customer by id", "data": customer.to_dict()}
             else:
-                logger.warning(f"Customer not found: {customer_id}")
+                logger.warning("Customer not found: %s", customer_id)
                 return {"status": "error", "message": "Customer not found"}
 
         except Exception as e:
-            logger.error(f"Error fetching customer by ID {customer_id}: {e}")
+            logger.error("Error fetching customer by ID %s: %s", customer_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -102,7 +116,7 @@ class CustomersAPI:
             cursor.execute(query, (full_name, email, phone, address, city, state, country, postal_code))
             conn.commit()
             customer_id = cursor.lastrowid
-            logger.info(f"Customer added: {customer_id} - {full_name}")
+            logger.info("Customer added: %s - %s", customer_id, full_name)
 
             new_customer = CustomerModel(
                 customer_id=customer_id,
@@ -118,7 +132,7 @@ class CustomersAPI:
             return {"status": "success", "message": "Customer added", "data": new_customer.to_dict()}
 
         except Exception as e:
-            logger.error(f"Error adding customer: {e}")
+            logger.error("Error adding customer: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -148,13 +162,13 @@ class CustomersAPI:
             query = f"UPDATE customers SET {fields} WHERE customer_id=%s"
             cursor.execute(query, values)
             conn.commit()
-            logger.info(f"Customer updated: {customer_id}")
+            logger.info("Customer updated: %s", customer_id)
 
             updated_customer = self.get_by_id(customer_id)
             return {"status": "success", "message": "Customer updated", "data": updated_customer.get("data")}
 
         except Exception as e:
-            logger.error(f"Error updating customer {customer_id}: {e}")
+            logger.error("Error updating customer %s: %s", customer_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -173,11 +187,11 @@ class CustomersAPI:
         try:
             cursor.execute("DELETE FROM customers WHERE customer_id=%s", (customer_id,))
             conn.commit()
-            logger.info(f"Customer deleted: {customer_id}")
+            logger.info("Customer deleted: %s", customer_id)
             return {"status": "success", "message": "Customer deleted", "data":customer_id}
 
         except Exception as e:
-            logger.error(f"Error deleting customer {customer_id}: {e}")
+            logger.error("Error deleting customer %s: %s", customer_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -186,13 +200,13 @@ class CustomersAPI:
     # ==========================================================
     # 🔍 New: Flexible smart search (for universal search router)
     # ==========================================================
-    def search_customers(self, by="any", value=None):
+    def search_customers(self, by="any", value=None, limit=None, after=None, order_by=None, descending=False):
         """
         Flexible search by field or universal match.
         `by` can be: 'full_name', 'email', 'city', 'state', 'any'
         """
         if not value:
-            return self.get_all()
+            return self.get_all(limit, after, order_by, descending)
 
         allowed_fields = ["full_name", "email", "city", "state"]
 
@@ -201,26 +215,33 @@ class CustomersAPI:
             logger.error("DB connection failed in search_customers()")
             return {"status": "error", "message": "DB connection failed"}
 
-        cursor = conn.cursor(dictionary=True)
+        cursor = conn.cursor()
         try:
             if by == "any":
-                query = "SELECT * FROM customers WHERE "
-                query += " OR ".join(f"{field} LIKE %s" for field in allowed_fields)
-                params = tuple(f"%{value}%" for _ in allowed_fields)
+                where = [" OR ".join(f"{field} LIKE %s" for field in allowed_fields)]
+                params = [f"%{value}%" for _ in allowed_fields]
             elif by in allowed_fields:
-                query = f"SELECT * FROM customers WHERE {by} LIKE %s"
-                params = (f"%{value}%",)
+                where = [f"{by} LIKE %s"]
+                params = [f"%{value}%"]
             else:
                 return {"status": "error", "message": f"Invalid field '{by}'"}
 
+            try:
+                query, params, limit, key_fields = keyset_query(
+                    "SELECT * FROM customers", where, params, "customer_id", None, self.SORT_COLUMNS,
+                    limit, after, order_by, descending
+                )
+            except ValueError as e:
+                return {"status": "error", "message": str(e)}
+
             cursor.execute(query, params)
-            rows = cursor.fetchall()
-            customers = [CustomerModel.from_db_row(r).to_dict() for r in rows]
-            logger.info(f"Search '{value}' in '{by}': {len(customers)} results")
-            return {"status": "success", "message":"Search results", "data": customers}
+            customers, next_cursor, has_more = page_rows(CustomerRecord.read_all(cursor), limit, key_fields)
+            logger.info("Search '%s' in '%s': %s results", value, by, len(customers))
+            return {"status": "success", "message":"Search results", "data": to_dicts(customers),
+                    "next_cursor": next_cursor, "has_more": has_more}
 
         except Exception as e:
-            logger.error(f"Error in search_customers(by={by}, value={value}): {e}")
+            logger.error("Error in search_customers(by=%s, value=%s): %s", by, value, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -1,11 +1,14 @@
 # backend/api/order_items.py
 
-from database.db_connection import get_connection
-from utils.logger import logger
+from backend.database.db_connection import get_connection
+from backend.utils.logger import logger
+from backend.utils.metrics import instrumented
 from backend.models.order_model import OrderItemModel
 from backend.api import books as books_module
+from backend.cache.catalog_cache import catalog_cache
 
 
+@instrumented
 class OrderItemsAPI:
     """
     API to manage order items individually.
@@ -27,7 +30,7 @@ class OrderItemsAPI:
             data = [OrderItemModel.from_db_row(r).to_dict() for r in rows]
             return {"status": "success", "message": "Items fetched", "data": data}
         except Exception as e:
-            logger.error(f"Error fetching items for order {order_id}: {e}")
+            logger.error("Error fetching items for order %s: %s", order_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cur.close()
@@ -73,7 +76,9 @@ class OrderItemsAPI:
             cur.execute("UPDATE orders SET total_amount = total_amount + %s WHERE order_id=%s", (round(subtotal, 2), order_id))
 
             conn.commit()
-            logger.info(f"Added item {item_id} to order {order_id}")
+            # stock was reduced by the order_items trigger
+            catalog_cache.invalidate_books([book_id])
+            logger.info("Added item %s to order %s", item_id, order_id)
             # return the inserted item
             cur2 = conn.cursor(dictionary=True)
             cur2.execute("SELECT * FROM order_items WHERE item_id=%s", (item_id,))
@@ -82,7 +87,7 @@ class OrderItemsAPI:
             return {"status": "success", "message": "Item added", "data": OrderItemModel.from_db_row(inserted).to_dict()}
         except Exception as e:
             conn.rollback()
-            logger.error(f"Error adding item to order {order_id}: {e}")
+            logger.error("Error adding item to order %s: %s", order_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cur.close()
@@ -124,7 +129,7 @@ class OrderItemsAPI:
                 br = cur.fetchone()
                 if not br:
                     return {"status": "error", "message": "Book not found"}
-                avail = int(br[0] or 0)
+                avail = int(br["stock"] or 0)
                 if avail < delta:
                     return {"status": "error", "message": f"Insufficient stock to increase quantity by {delta}"}
                 # decrement stock
@@ -140,7 +145,9 @@ class OrderItemsAPI:
             cur.execute("UPDATE orders SET total_amount = total_amount + %s WHERE order_id=%s", (round(subtotal_delta, 2), item["order_id"]))
 
             conn.commit()
-            logger.info(f"Updated item {item_id} quantity from {old_qty} to {new_qty}")
+            if delta:
+                catalog_cache.invalidate_books([book_id])
+            logger.info("Updated item %s quantity from %s to %s", item_id, old_qty, new_qty)
             # return updated item
             cur2 = conn.cursor(dictionary=True)
             cur2.execute("SELECT * FROM order_items WHERE item_id=%s", (item_id,))
@@ -149,7 +156,7 @@ class OrderItemsAPI:
             return {"status": "success", "message": "Item updated", "data": OrderItemModel.from_db_row(updated).to_dict()}
         except Exception as e:
             conn.rollback()
-            logger.error(f"Error updating item {item_id}: {e}")
+            logger.error("Error updating item %s: %s", item_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cur.close()
@@ -185,11 +192,12 @@ class OrderItemsAPI:
             cur.execute("DELETE FROM order_items WHERE item_id=%s", (item_id,))
 
             conn.commit()
-            logger.info(f"Deleted order item {item_id}")
+            catalog_cache.invalidate_books([book_id])
+            logger.info("Deleted order item %s", item_id)
             return {"status": "success", "message": "Item deleted", "data": item_id}
         except Exception as e:
             conn.rollback()
-            logger.error(f"Error deleting item {item_id}: {e}")
+            logger.error("Error deleting item %s: %s", item_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cur.close()
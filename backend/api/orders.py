@@ -1,18 +1,25 @@
 # backend/api/orders.py
 
 from backend.database.db_connection import get_connection
-from backend.utils.helpers import format_date
+from backend.utils.helpers import format_date, round_price, calculate_order_total
 from backend.utils.logger import logger
-from backend.models.order_model import OrderModel, OrderItemModel
-from backend.api import books as books_module  # for price lookup and stock checks
+from backend.utils.metrics import instrumented
+from backend.models.order_model import OrderModel, OrderRecord, OrderItemRecord
+from backend.models.records import column_names, to_dicts
+from backend.utils.pagination import keyset_query, page_rows
+from backend.cache.catalog_cache import catalog_cache
 
 
+@instrumented
 class OrdersAPI:
     """
     OrdersAPI — supports creating orders with items, fetching orders with items,
     updating order-level fields, deleting, and searching.
+    Listing endpoints accept limit/after for keyset pagination.
     """
 
+    SORT_COLUMNS = {"order_date": "o.order_date", "total_amount": "o.total_amount"}
+
     def _fetch_items_for_order(self, conn, order_id):
         """
         Helper: return list of item rows (dicts) for the given order_id
@@ -29,30 +36,78 @@ class OrdersAPI:
         finally:
             cur.close()
 
-    def get_all(self):
+    def _fetch_items_grouped(self, conn, where_sql="", params=(), order_ids=None):
+        """
+        Helper: return {order_id: [OrderItemRecord]} for every order matching where_sql
+        (a filter on the orders table aliased as `o`) in a single query,
+        so listing N orders costs two round trips instead of N + 1.
+        When order_ids is given (one page of orders) only those orders are matched.
+        """
+        if order_ids is not None:
+            if not order_ids:
+                return {}
+            where_sql = f"WHERE o.order_id IN ({', '.join(['%s'] * len(order_ids))})"
+            params = tuple(order_ids)
+
+        cur = conn.cursor()
+        try:
+            cur.execute(f"""
+                SELECT oi.item_id, oi.order_id, oi.book_id, oi.quantity, oi.price_each
+                FROM order_items oi
+                JOIN orders o ON o.order_id = oi.order_id
+                {where_sql}
+                ORDER BY oi.order_id, oi.item_id
+            """, params)
+            rows = cur.fetchall()
+            order_pos = column_names(cur).index("order_id")
+            grouped = {}
+            for row, item in zip(rows, OrderItemRecord.read_all(cur, rows)):
+                grouped.setdefault(row[order_pos], []).append(item)
+            return grouped
+        finally:
+            cur.close()
+
+    @staticmethod
+    def _with_items(columns, rows, orders, items_by_order):
+        """
+        Helper: order dicts for one page of order rows (orders are the same
+        rows already wrapped), each with its list of items attached.
+        """
+        return to_dicts(OrderRecord.wrap(
+            list(columns) + ["items"],
+            [tuple(row) + (items_by_order.get(o["order_id"], []),) for row, o in zip(rows, orders)]
+        ))
+
+    def get_all(self, limit=None, after=None, order_by=None, descending=False):
+        try:
+            sql, params, limit, key_fields = keyset_query(
+                "SELECT o.* FROM orders o", [], [], "order_id", "o.order_id", self.SORT_COLUMNS,
+                limit, after, order_by, descending
+            )
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+
         conn = get_connection()
         if not conn:
             return {"status": "error", "message": "DB connection failed"}
 
-        cur = conn.cursor(dictionary=True)
+        cur = conn.cursor()
         try:
-            cur.execute("SELECT * FROM orders WHERE 1=1")
-            orders = cur.fetchall()
-
-            result = []
-            for o in orders:
-                # fetch items for each order
-                items = self._fetch_items_for_order(conn, o["order_id"])
-                order_model = OrderModel.from_db_row(o, items)
-                d = order_model.to_dict()
-                # format date already in model but ensure consistent formatting
-                d["order_date"] = format_date(o.get("order_date"))
-                result.append(d)
-
-            logger.info(f"Fetched {len(result)} orders")
-            return {"status": "success", "message": "Fetched all orders", "data": result}
+            cur.execute(sql, params)
+            columns, rows = column_names(cur), cur.fetchall()
+            orders, next_cursor, has_more = page_rows(OrderRecord.wrap(columns, rows), limit, key_fields)
+            if limit:
+                items_by_order = self._fetch_items_grouped(conn, order_ids=[o["order_id"] for o in orders])
+            else:
+                items_by_order = self._fetch_items_grouped(conn)
+
+            result = self._with_items(columns, rows, orders, items_by_order)
+
+            logger.info("Fetched %s orders", len(result))
+            return {"status": "success", "message": "Fetched all orders", "data": result,
+                    "next_cursor": next_cursor, "has_more": has_more}
         except Exception as e:
-            logger.error(f"Error fetching orders: {e}")
+            logger.error("Error fetching orders: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cur.close()
@@ -76,7 +131,7 @@ class OrdersAPI:
             data["order_date"] = format_date(order.get("order_date"))
             return {"status": "success", "message": "Fetched order by id", "data": data}
         except Exception as e:
-            logger.error(f"Error fetching order {order_id}: {e}")
+            logger.error("Error fetching order %s: %s", order_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cur.close()
@@ -87,49 +142,123 @@ class OrdersAPI:
         Add a new order along with its items.
         order_data: {
             "customer_id": int,
-            "total_amount": float,
             "order_status": str,
             "items": [
-                {"book_id": int, "quantity": int, "price_each": float}, ...
+                {"book_id": int, "quantity": int}, ...
             ]
         }
+        Prices and the order total are taken from the books table; any
+        client-supplied price_each / total_amount is ignored.
+        All referenced books are locked with one SELECT ... FOR UPDATE and the
+        order is rejected if any of them lacks stock.
         """
         customer_id = order_data.get("customer_id")
-        total_amount = order_data.get("total_amount", 0)
         order_status = order_data.get("order_status", "Pending")
         items = order_data.get("items", [])
 
         if not customer_id or not items:
             return {"status": "error", "message": "Customer ID and order items required"}
 
+        # Quantity requested per book (the same book may appear on several lines)
+        requested = {}
+        try:
+            for item in items:
+                book_id, quantity = int(item["book_id"]), int(item["quantity"])
+                if quantity <= 0:
+                    raise ValueError
+                requested[book_id] = requested.get(book_id, 0) + quantity
+        except (KeyError, ValueError, TypeError):
+            return {"status": "error", "message": "Each item needs a book_id and a positive quantity"}
+
         conn = get_connection()
         if not conn:
             return {"status": "error", "message": "DB connection failed"}
 
-        cursor = conn.cursor()
+        cursor = conn.cursor(dictionary=True)
         try:
-            # Begin transaction
+            # Begin transaction: lock every referenced book in one statement.
+            # Ascending book_id order keeps concurrent checkouts from deadlocking.
+            book_ids = sorted(requested)
+            cursor.execute(f"""
+                SELECT book_id, title, price, stock
+                FROM books
+                WHERE book_id IN ({", ".join(["%s"] * len(book_ids))})
+                ORDER BY book_id
+                FOR UPDATE
+            """, book_ids)
+            books = {row["book_id"]: row for row in cursor.fetchall()}
+
+            missing = [b for b in book_ids if b not in books]
+            if missing:
+                conn.rollback()
+                return {"status": "error", "message": f"Book(s) not found: {', '.join(map(str, missing))}"}
+
+            short = [
+                f"{books[b]['title']} (available {books[b]['stock'] or 0}, requested {requested[b]})"
+                for b in book_ids if (books[b]["stock"] or 0) < requested[b]
+            ]
+            if short:
+                conn.rollback()
+                return {"status": "error", "message": "Insufficient stock: " + "; ".join(short)}
+
+            items = [
+                {"book_id": int(item["book_id"]), "quantity": int(item["quantity"]),
+                 "price_each": round_price(books[int(item["book_id"])]["price"])}
+                for item in items
+            ]
+            total_amount = calculate_order_total(items)
+
             cursor.execute("""
                 INSERT INTO orders (customer_id, total_amount, status)
                 VALUES (%s, %s, %s)
             """, (customer_id, total_amount, order_status))
             order_id = cursor.lastrowid
 
-            # Insert order items
+            # Insert all order items in one multi-row statement
+            values = []
             for item in items:
-                cursor.execute("""
-                    INSERT INTO order_items (order_id, book_id, quantity, price_each)
-                    VALUES (%s, %s, %s, %s)
-                """, (order_id, item["book_id"], item["quantity"], item["price_each"]))
+                values += [order_id, item["book_id"], item["quantity"], item["price_each"]]
+            cursor.execute(
+                "INSERT INTO order_items (order_id, book_id, quantity, price_each) VALUES "
+                + ", ".join(["(%s, %s, %s, %s)"] * len(items)),
+                values
+            )
+
+            # Read back the column default order_date (the database clock, which the
+            # sales rollup buckets by) and the item ids in one statement; ids ascend
+            # in insertion order, so they line up with items.
+            cursor.execute("""
+                SELECT o.order_date, oi.item_id
+                FROM orders o
+                JOIN order_items oi ON oi.order_id = o.order_id
+                WHERE o.order_id = %s
+                ORDER BY oi.item_id
+            """, (order_id,))
+            inserted = cursor.fetchall()
+            order_date = inserted[0]["order_date"]
 
             conn.commit()
-            logger.info(f"Order {order_id} added with {len(items)} items")
-            
-            # Fetch full order with items
-            cursor.execute("SELECT * FROM order_items WHERE order_id=%s", (order_id,))
-            item_rows = cursor.fetchall()
-            cursor.execute("SELECT * FROM orders WHERE order_id=%s", (order_id,))
-            order_row = cursor.fetchone()
+            # stock was reduced by the order_items trigger
+            catalog_cache.invalidate_books({item["book_id"] for item in items})
+            logger.info("Order %s added with %s items", order_id, len(items))
+
+            # Build the response from what was inserted
+            item_rows = [
+                {
+                    "item_id": row["item_id"],
+                    "book_id": item["book_id"],
+                    "quantity": item["quantity"],
+                    "price_each": item["price_each"]
+                }
+                for row, item in zip(inserted, items)
+            ]
+            order_row = {
+                "order_id": order_id,
+                "customer_id": customer_id,
+                "order_date": order_date,
+                "total_amount": total_amount,
+                "status": order_status
+            }
             return {
                 "status": "success",
                 "message": "Order added successfully",
@@ -138,7 +267,7 @@ class OrdersAPI:
 
         except Exception as e:
             conn.rollback()
-            logger.error(f"Error adding order: {e}")
+            logger.error("Error adding order: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -171,11 +300,11 @@ class OrdersAPI:
             sql = f"UPDATE orders SET {set_clause} WHERE order_id=%s"
             cur.execute(sql, tuple(values))
             conn.commit()
-            logger.info(f"Order {order_id} updated with {order_updates}")
+            logger.info("Order %s updated with %s", order_id, order_updates)
             return self.get_by_id(order_id)
         except Exception as e:
             conn.rollback()
-            logger.error(f"Error updating order {order_id}: {e}")
+            logger.error("Error updating order %s: %s", order_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cur.close()
@@ -204,11 +333,12 @@ class OrdersAPI:
             # delete the order (cascade will remove order_items)
             cur.execute("DELETE FROM orders WHERE order_id=%s", (order_id,))
             conn.commit()
-            logger.info(f"Order deleted: {order_id}")
+            catalog_cache.invalidate_books({it["book_id"] for it in items})
+            logger.info("Order deleted: %s", order_id)
             return {"status": "success", "message": "Order deleted", "data": order_id}
         except Exception as e:
             conn.rollback()
-            logger.error(f"Error deleting order {order_id}: {e}")
+            logger.error("Error deleting order %s: %s", order_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cur.close()
@@ -245,7 +375,7 @@ class OrdersAPI:
             """, (order_id, method, amount, status, transaction_id))
             conn.commit()
             payment_id = cursor.lastrowid
-            logger.info(f"Payment {payment_id} recorded for Order {order_id}")
+            logger.info("Payment %s recorded for Order %s", payment_id, order_id)
 
             return {
                 "status": "success",
@@ -262,39 +392,48 @@ class OrdersAPI:
 
         except Exception as e:
             conn.rollback()
-            logger.error(f"Error recording payment for order {order_id}: {e}")
+            logger.error("Error recording payment for order %s: %s", order_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
             conn.close()
 
-    def search(self, by, query):
+    def search(self, by, query, limit=None, after=None, order_by=None, descending=False):
         allowed_fields = ["order_id", "customer_id", "status", "order_date"]
         if by not in allowed_fields:
             return {"status": "error", "message": f"Invalid search field '{by}'"}
 
+        where_sql = f"WHERE o.{by} LIKE %s"
+        params = (f"%{query}%",)
+        try:
+            sql, page_params, limit, key_fields = keyset_query(
+                "SELECT o.* FROM orders o", [f"o.{by} LIKE %s"], params, "order_id", "o.order_id",
+                self.SORT_COLUMNS, limit, after, order_by, descending
+            )
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+
         conn = get_connection()
         if not conn:
             return {"status": "error", "message": "DB connection failed"}
 
-        cur = conn.cursor(dictionary=True)
+        cur = conn.cursor()
         try:
-            sql = f"SELECT * FROM orders WHERE {by} LIKE %s"
-            cur.execute(sql, (f"%{query}%",))
-            results = cur.fetchall()
-
-            data = []
-            for r in results:
-                items = self._fetch_items_for_order(conn, r["order_id"])
-                order_model = OrderModel.from_db_row(r, items)
-                d = order_model.to_dict()
-                d["order_date"] = format_date(r.get("order_date"))
-                data.append(d)
-
-            logger.info(f"Search '{query}' in '{by}' → {len(data)} results")
-            return {"status": "success", "message": "Search results", "data": data}
+            cur.execute(sql, page_params)
+            columns, rows = column_names(cur), cur.fetchall()
+            results, next_cursor, has_more = page_rows(OrderRecord.wrap(columns, rows), limit, key_fields)
+            if limit:
+                items_by_order = self._fetch_items_grouped(conn, order_ids=[r["order_id"] for r in results])
+            else:
+                items_by_order = self._fetch_items_grouped(conn, where_sql, params)
+
+            data = self._with_items(columns, rows, results, items_by_order)
+
+            logger.info("Search '%s' in '%s' → %s results", query, by, len(data))
+            return {"status": "success", "message": "Search results", "data": data,
+                    "next_cursor": next_cursor, "has_more": has_more}
         except Exception as e:
-            logger.error(f"Error searching orders: {e}")
+            logger.error("Error searching orders: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cur.close()
@@ -4,16 +4,22 @@ from backend.database.db_connection import get_connection
 from backend.utils.helpers import safe_get, format_date, round_price
 from backend.utils.validators import is_positive_number
 from backend.utils.logger import logger
+from backend.utils.metrics import instrumented
 from backend.models.payment_model import PaymentModel
+from backend.utils.pagination import keyset_query, page_rows
 
 
+@instrumented
 class PaymentsAPI:
     """
     Local API class to manage payments using PaymentModel.
     Supports CRUD, validation, and flexible search.
+    search() accepts limit/after for keyset pagination.
     """
 
-    def search(self, field=None, value=None):
+    SORT_COLUMNS = {"amount": "amount"}
+
+    def search(self, field=None, value=None, limit=None, after=None, order_by=None, descending=False):
         """
         Flexible search for payments.
         If no field/value provided → returns all payments.
@@ -29,22 +35,29 @@ class PaymentsAPI:
         cursor = conn.cursor(dictionary=True)
         try:
             if not field or not value:
-                query = "SELECT * FROM payments"
-                params = ()
+                where, params = [], []
             else:
                 if field not in allowed_fields:
                     return {"status": "error", "message": f"Invalid search field '{field}'"}
-                query = f"SELECT * FROM payments WHERE {field} LIKE %s"
-                params = (f"%{value}%",)
+                where, params = [f"{field} LIKE %s"], [f"%{value}%"]
+
+            try:
+                query, params, limit, key_fields = keyset_query(
+                    "SELECT * FROM payments", where, params, "payment_id", None, self.SORT_COLUMNS,
+                    limit, after, order_by, descending
+                )
+            except ValueError as e:
+                return {"status": "error", "message": str(e)}
 
             cursor.execute(query, params)
-            rows = cursor.fetchall()
+            rows, next_cursor, has_more = page_rows(cursor.fetchall(), limit, key_fields)
             payments = [PaymentModel.from_db_row(row).to_dict() for row in rows]
-            logger.info(f"Search in payments by {field or 'ALL'}='{value or ''}' → {len(payments)} results")
-            return {"status": "success","message":"Search Results", "data": payments}
+            logger.info("Search in payments by %s='%s' → %s results", field or 'ALL', value or '', len(payments))
+            return {"status": "success","message":"Search Results", "data": payments,
+                    "next_cursor": next_cursor, "has_more": has_more}
 
         except Exception as e:
-            logger.error(f"Error searching payments: {e}")
+            logger.error("Error searching payments: %s", e)
             return {"status": "error", "message": str(e)}
 
         finally:
@@ -90,7 +103,7 @@ class PaymentsAPI:
             """, (order_id, payment_method, round_price(amount), payment_status, transaction_id))
             conn.commit()
             payment_id = cursor.lastrowid
-            logger.info(f"Payment added: {payment_id} for order {order_id}")
+            logger.info("Payment added: %s for order %s", payment_id, order_id)
 
             payment = PaymentModel(payment_id=payment_id, order_id=order_id, amount=round_price(amount),
                                    payment_method=payment_method, payment_status=payment_status,
@@ -98,7 +111,7 @@ class PaymentsAPI:
             return {"status": "success", "message": "Payment recorded", "data": payment.to_dict()}
 
         except Exception as e:
-            logger.error(f"Error adding payment: {e}")
+            logger.error("Error adding payment: %s", e)
             return {"status": "error", "message": str(e)}
 
         finally:
@@ -123,11 +136,11 @@ class PaymentsAPI:
             cursor.execute("UPDATE payments SET payment_status=%s WHERE payment_id=%s",
                            (payment_status, payment_id))
             conn.commit()
-            logger.info(f"Payment {payment_id} status updated to {payment_status}")
+            logger.info("Payment %s status updated to %s", payment_id, payment_status)
             return {"status": "success", "message": "Payment status updated", "data": self.search("payment_id", payment_id).get("data",[])[0].to_dict()}
 
         except Exception as e:
-            logger.error(f"Error updating payment {payment_id}: {e}")
+            logger.error("Error updating payment %s: %s", payment_id, e)
             return {"status": "error", "message": str(e)}
 
         finally:
@@ -147,11 +160,11 @@ class PaymentsAPI:
         try:
             cursor.execute("DELETE FROM payments WHERE payment_id=%s", (payment_id,))
             conn.commit()
-            logger.info(f"Payment deleted: {payment_id}")
+            logger.info("Payment deleted: %s", payment_id)
             return {"status": "success", "message": "Payment deleted", "data":payment_id}
 
         except Exception as e:
-            logger.error(f"Error deleting payment {payment_id}: {e}")
+            logger.error("Error deleting payment %s: %s", payment_id, e)
             return {"status": "error", "message": str(e)}
 
         finally:
@@ -3,16 +3,32 @@
 from backend.database.db_connection import get_connection
 from backend.utils.helpers import safe_get
 from backend.utils.logger import logger
+from backend.utils.metrics import instrumented
 from backend.models.publisher_model import PublisherModel
+from backend.utils.pagination import keyset_query, page_rows, ranked_page
+from backend.search.book_index import book_index, get_book_index
+from backend.cache.catalog_cache import catalog_cache
 
 
+@instrumented
 class PublishersAPI:
     """
     Local API class to manage publishers using PublisherModel.
     Provides CRUD + dynamic search functionality.
+    Listing endpoints accept limit/after for keyset pagination.
     """
 
-    def get_all(self):
+    SORT_COLUMNS = {"name": "name"}
+
+    def get_all(self, limit=None, after=None, order_by=None, descending=False):
+        try:
+            query, params, limit, key_fields = keyset_query(
+                "SELECT * FROM publishers", [], [], "publisher_id", None, self.SORT_COLUMNS,
+                limit, after, order_by, descending
+            )
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+
         conn = get_connection()
         if not conn:
             logger.error("DB connection failed in get_all()")
@@ -20,14 +36,14 @@ class PublishersAPI:
 
         cursor = conn.cursor(dictionary=True)
         try:
-            query = "SELECT * FROM publishers"
-            cursor.execute(query)
-            rows = cursor.fetchall()
+            cursor.execute(query, params)
+            rows, next_cursor, has_more = page_rows(cursor.fetchall(), limit, key_fields)
             publishers = [PublisherModel.from_db_row(row).to_dict() for row in rows]
-            logger.info(f"Fetched {len(publishers)} publishers")
-            return {"status": "success","message":"Fetched all publishers", "data": publishers}
+            logger.info("Fetched %s publishers", len(publishers))
+            return {"status": "success","message":"Fetched all publishers", "data": publishers,
+                    "next_cursor": next_cursor, "has_more": has_more}
         except Exception as e:
-            logger.error(f"Error fetching publishers: {e}")
+            logger.error("Error fetching publishers: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -45,13 +61,13 @@ class PublishersAPI:
             row = cursor.fetchone()
             if row:
                 publisher = PublisherModel.from_db_row(row).to_dict()
-                logger.info(f"Publisher fetched: {publisher_id}")
+                logger.info("Publisher fetched: %s", publisher_id)
                 return {"status": "success","message":"Fetched Publisher by id", "data": publisher}
             else:
-                logger.warning(f"Publisher not found: {publisher_id}")
+                logger.warning("Publisher not found: %s", publisher_id)
                 return {"status": "error", "message": "Publisher not found"}
         except Exception as e:
-            logger.error(f"Error fetching publisher by ID {publisher_id}: {e}")
+            logger.error("Error fetching publisher by ID %s: %s", publisher_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -84,10 +100,11 @@ class PublishersAPI:
                 contact_email=contact_email,
                 phone=phone
             ).to_dict()
-            logger.info(f"Publisher added: {publisher_id} - {name}")
+            logger.info("Publisher added: %s - %s", publisher_id, name)
+            book_index.index_entity("publisher", publisher_id, name)
             return {"status": "success", "message": "Publisher added", "data": publisher}
         except Exception as e:
-            logger.error(f"Error adding publisher: {e}")
+            logger.error("Error adding publisher: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -116,10 +133,13 @@ class PublishersAPI:
             row = updated.get("data")
             publisher = PublisherModel.from_db_row(row).to_dict() if row else None
 
-            logger.info(f"Publisher updated: {publisher_id}")
+            logger.info("Publisher updated: %s", publisher_id)
+            if "name" in publisher_data:
+                book_index.index_entity("publisher", publisher_id, publisher_data["name"])
+                catalog_cache.invalidate_link("publisher_id", publisher_id)
             return {"status": "success", "message": "Publisher updated", "data": publisher}
         except Exception as e:
-            logger.error(f"Error updating publisher {publisher_id}: {e}")
+            logger.error("Error updating publisher %s: %s", publisher_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -135,25 +155,45 @@ class PublishersAPI:
         try:
             cursor.execute("DELETE FROM publishers WHERE publisher_id=%s", (publisher_id,))
             conn.commit()
-            logger.info(f"Publisher deleted: {publisher_id}")
+            logger.info("Publisher deleted: %s", publisher_id)
+            book_index.remove_entity("publisher", publisher_id)
+            catalog_cache.invalidate_link("publisher_id", publisher_id)
             return {"status": "success", "message": "Publisher deleted", "data": publisher_id}
         except Exception as e:
-            logger.error(f"Error deleting publisher {publisher_id}: {e}")
+            logger.error("Error deleting publisher %s: %s", publisher_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
             conn.close()
 
-    def search_by(self, field, query):
+    def search_by(self, field, query, limit=None, after=None, order_by=None, descending=False):
         """
         Dynamically search publishers by any valid field.
         field: column name (e.g. 'name', 'location', 'contact_email', 'phone')
         query: search text or partial match
+        With field='name_prefix', query is matched against names (every word
+        may be a prefix), best match first.
         """
+        if field == "name_prefix":
+            # Name words as prefixes in relevance order → search index
+            if query and not order_by:
+                index = get_book_index()
+                if index is not None:
+                    return self._ranked_search(index, query, limit, after)
+            field = "name"
+
         valid_fields = {"name", "location", "contact_email", "phone"}
         if field not in valid_fields:
             return {"status": "error", "message": f"Invalid field '{field}'"}
 
+        try:
+            sql, params, limit, key_fields = keyset_query(
+                "SELECT * FROM publishers", [f"{field} LIKE %s"], [f"%{query}%"],
+                "publisher_id", None, self.SORT_COLUMNS, limit, after, order_by, descending
+            )
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+
         conn = get_connection()
         if not conn:
             logger.error("DB connection failed in search_by()")
@@ -161,14 +201,52 @@ class PublishersAPI:
 
         cursor = conn.cursor(dictionary=True)
         try:
-            sql = f"SELECT * FROM publishers WHERE {field} LIKE %s"
-            cursor.execute(sql, (f"%{query}%",))
-            rows = cursor.fetchall()
+            cursor.execute(sql, params)
+            rows, next_cursor, has_more = page_rows(cursor.fetchall(), limit, key_fields)
             results = [PublisherModel.from_db_row(row).to_dict() for row in rows]
-            logger.info(f"Search by {field}: '{query}' → {len(results)} results")
-            return {"status": "success","message":"Search results", "data": results}
+            logger.info("Search by %s: '%s' → %s results", field, query, len(results))
+            return {"status": "success","message":"Search results", "data": results,
+                    "next_cursor": next_cursor, "has_more": has_more}
+        except Exception as e:
+            logger.error("Error in dynamic search: %s", e)
+            return {"status": "error", "message": str(e)}
+        finally:
+            cursor.close()
+            conn.close()
+
+    def _ranked_search(self, index, query, limit=None, after=None):
+        """
+        Answers a free-text name search from the search index; only the rows
+        of the returned page are read from the database.
+        """
+        try:
+            hits, total, next_cursor, has_more = ranked_page(
+                lambda n, after_key: index.search_entities("publisher", query, limit=n, after=after_key), limit, after
+            )
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+        exhaustive = index.is_exhaustive(query, "publisher")
+        if not hits:
+            return {"status": "success", "message": "Search results", "data": [], "next_cursor": None, "has_more": False,
+                    "exhaustive": exhaustive}
+
+        conn = get_connection()
+        if not conn:
+            logger.error("DB connection failed in _ranked_search()")
+            return {"status": "error", "message": "DB connection failed"}
+
+        cursor = conn.cursor(dictionary=True)
+        try:
+            ids = [publisher_id for publisher_id, _ in hits]
+            cursor.execute(f"SELECT * FROM publishers WHERE publisher_id IN ({', '.join(['%s'] * len(ids))})", ids)
+            by_id = {row["publisher_id"]: PublisherModel.from_db_row(row).to_dict() for row in cursor.fetchall()}
+            # Keep index order; skip publishers deleted by another process
+            results = [by_id[i] for i in ids if i in by_id]
+            logger.info("Ranked publisher search: '%s' → %s hits", query, total)
+            return {"status": "success", "message": "Search results", "data": results,
+                    "next_cursor": next_cursor, "has_more": has_more, "exhaustive": exhaustive}
         except Exception as e:
-            logger.error(f"Error in dynamic search: {e}")
+            logger.error("Error in dynamic search: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
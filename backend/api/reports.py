@@ -3,7 +3,9 @@
 from backend.reports.sales_summary import SalesSummaryReport
 from backend.reports.stock_report import StockReport
 from backend.utils.logger import logger
+from backend.utils.metrics import instrumented
 
+@instrumented
 class ReportsAPI:
     """
     Central API to expose all reports for the frontend.
@@ -15,23 +17,24 @@ class ReportsAPI:
         self.stock_report = StockReport()
 
     # ----- Sales Summary -----
-    def get_daily_sales(self):
+    def get_daily_sales(self, start_date=None, end_date=None):
         """
-        Returns daily sales data.
+        Returns daily sales data, optionally for an inclusive date range.
         """
-        return self.sales_report.get_daily_sales()
+        return self.sales_report.get_daily_sales(start_date, end_date)
 
-    def get_daily_sales_plot_data(self):
+    def get_daily_sales_plot_data(self, start_date=None, end_date=None):
         """
         Returns data suitable for plotting daily sales.
         """
-        return self.sales_report.get_daily_sales_plot_data()
+        return self.sales_report.get_daily_sales_plot_data(start_date, end_date)
 
-    def get_top_selling_books(self, limit=10):
+    def get_top_selling_books(self, limit=10, start=None, end=None, window=None):
         """
-        Returns top-selling books.
+        Returns top-selling books, optionally for a date range (start / end)
+        or a rolling window ("last_7d", "last_30d").
         """
-        return self.sales_report.top_selling_books(limit=limit)
+        return self.sales_report.top_selling_books(limit=limit, start=start, end=end, window=window)
 
     # ----- Stock / Inventory -----
     def get_current_stock(self):
@@ -40,11 +43,13 @@ class ReportsAPI:
         """
         return self.stock_report.get_current_stock()
 
-    def get_low_stock(self, threshold=10):
+    def get_low_stock(self, threshold=10, category_id=None, publisher_id=None, limit=None):
         """
-        Returns books with stock below threshold.
+        Returns books with stock below their reorder point (or threshold).
         """
-        return self.stock_report.get_low_stock(threshold=threshold)
+        return self.stock_report.get_low_stock(
+            threshold=threshold, category_id=category_id, publisher_id=publisher_id, limit=limit
+        )
 
     def get_category_stock_summary(self):
         """
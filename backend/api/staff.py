@@ -4,17 +4,37 @@ from backend.database.db_connection import get_connection
 from backend.utils.helpers import safe_get
 from backend.utils.validators import is_non_empty_string
 from backend.utils.logger import logger
-import bcrypt
+from backend.utils.metrics import instrumented
+from backend.utils.passwords import hash_password, check_password, needs_rehash, submit
+from backend.utils.sessions import issue_token, verify_token
 from backend.models.staff_model import StaffModel
+from backend.utils.pagination import keyset_query, page_rows
 
 
+@instrumented
 class StaffAPI:
     """
     Local API class to manage staff/admin users using StaffModel.
     Provides CRUD + authentication + role management + search.
+    Listing endpoints accept limit/after for keyset pagination.
+
+    Password hashing is slow by design; the *_async variants run the call on
+    the password hashing pool and return a Future of the usual response.
     """
 
-    def get_all(self):
+    SORT_COLUMNS = {"username": "username"}
+    # Fields staff may change on their own profile
+    PROFILE_FIELDS = ("full_name", "email")
+
+    def get_all(self, limit=None, after=None, order_by=None, descending=False):
+        try:
+            query, params, limit, key_fields = keyset_query(
+                "SELECT staff_id, username, full_name, role, email, created_at FROM staff", [], [],
+                "staff_id", None, self.SORT_COLUMNS, limit, after, order_by, descending
+            )
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+
         conn = get_connection()
         if not conn:
             logger.error("DB connection failed in get_all()")
@@ -22,14 +42,14 @@ class StaffAPI:
 
         cursor = conn.cursor(dictionary=True)
         try:
-            query = "SELECT staff_id, username, full_name, role, email, created_at FROM staff WHERE 1=1"
-            cursor.execute(query)
-            rows = cursor.fetchall()
+            cursor.execute(query, params)
+            rows, next_cursor, has_more = page_rows(cursor.fetchall(), limit, key_fields)
             staff_list = [StaffModel.from_db_row(row).to_dict() for row in rows]
-            logger.info(f"Fetched {len(staff_list)} staff users")
-            return {"status": "success","message":"Fetched all staff data", "data": staff_list}
+            logger.info("Fetched %s staff users", len(staff_list))
+            return {"status": "success","message":"Fetched all staff data", "data": staff_list,
+                    "next_cursor": next_cursor, "has_more": has_more}
         except Exception as e:
-            logger.error(f"Error fetching staff: {e}")
+            logger.error("Error fetching staff: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -47,13 +67,13 @@ class StaffAPI:
             row = cursor.fetchone()
             if row:
                 staff = StaffModel.from_db_row(row).to_dict()
-                logger.info(f"Staff fetched: {staff_id}")
+                logger.info("Staff fetched: %s", staff_id)
                 return {"status": "success","message":"Fetched staff data by id", "data": staff}
             else:
-                logger.warning(f"Staff not found: {staff_id}")
+                logger.warning("Staff not found: %s", staff_id)
                 return {"status": "error", "message": "Staff not found"}
         except Exception as e:
-            logger.error(f"Error fetching staff {staff_id}: {e}")
+            logger.error("Error fetching staff %s: %s", staff_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -69,7 +89,7 @@ class StaffAPI:
         if not is_non_empty_string(username) or not is_non_empty_string(password):
             return {"status": "error", "message": "username and password are required"}
 
-        password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        password_hash = hash_password(password)
 
         conn = get_connection()
         if not conn:
@@ -88,10 +108,10 @@ class StaffAPI:
                 staff_id=staff_id, username=username, password_hash=password_hash,
                 full_name=full_name, role=role, email=email
             ).to_dict()
-            logger.info(f"Staff added: {staff_id} - {username}")
+            logger.info("Staff added: %s - %s", staff_id, username)
             return {"status": "success", "message": "Staff added", "data": staff}
         except Exception as e:
-            logger.error(f"Error adding staff: {e}")
+            logger.error("Error adding staff: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -102,7 +122,7 @@ class StaffAPI:
             return {"status": "error", "message": "No fields to update"}
 
         if "password" in staff_data:
-            staff_data["password_hash"] = bcrypt.hashpw(staff_data["password"].encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+            staff_data["password_hash"] = hash_password(staff_data["password"])
             del staff_data["password"]
 
         fields = ", ".join(f"{key}=%s" for key in staff_data.keys())
@@ -122,10 +142,10 @@ class StaffAPI:
             cursor.execute("SELECT staff_id, username, full_name, role, email, created_at FROM staff WHERE staff_id=%s", (staff_id,))
             row = cursor.fetchone()
             staff = StaffModel.from_db_row(row).to_dict() if row else None
-            logger.info(f"Staff updated: {staff_id}")
+            logger.info("Staff updated: %s", staff_id)
             return {"status": "success", "message": "Staff updated", "data": staff}
         except Exception as e:
-            logger.error(f"Error updating staff {staff_id}: {e}")
+            logger.error("Error updating staff %s: %s", staff_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -141,10 +161,10 @@ class StaffAPI:
         try:
             cursor.execute("DELETE FROM staff WHERE staff_id=%s", (staff_id,))
             conn.commit()
-            logger.info(f"Staff deleted: {staff_id}")
+            logger.info("Staff deleted: %s", staff_id)
             return {"status": "success", "message": "Staff deleted"," data": staff_id}
         except Exception as e:
-            logger.error(f"Error deleting staff {staff_id}: {e}")
+            logger.error("Error deleting staff %s: %s", staff_id, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -160,20 +180,57 @@ class StaffAPI:
         try:
             cursor.execute("SELECT staff_id, username, password_hash, full_name, role FROM staff WHERE username=%s", (username,))
             row = cursor.fetchone()
-            if row and bcrypt.checkpw(password.encode('utf-8'), row['password_hash'].encode('utf-8')):
-                logger.info(f"Staff authenticated: {username}")
-                return {"status": "success", "message":"Authenticated Successfully","data":{"full_name": row['full_name'], "role": row['role']}}
+            if row and check_password(password, row['password_hash']):
+                if needs_rehash(row['password_hash']):
+                    self._rehash(cursor, conn, row, password)
+                logger.info("Staff authenticated: %s", username)
+                token = issue_token(row['staff_id'], row['username'], row['role'])
+                return {"status": "success", "message":"Authenticated Successfully","data":{
+                    "staff_id": row['staff_id'], "username": row['username'],
+                    "full_name": row['full_name'], "role": row['role'], "token": token}}
             else:
-                logger.warning(f"Authentication failed for: {username}")
+                logger.warning("Authentication failed for: %s", username)
                 return {"status": "error", "message": "Invalid username or password"}
         except Exception as e:
-            logger.error(f"Error authenticating staff {username}: {e}")
+            logger.error("Error authenticating staff %s: %s", username, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
             conn.close()
 
-    def search(self, by=None, query=None):
+    def _rehash(self, cursor, conn, row, password):
+        """
+        Upgrades a hash made with an old cost factor. Only replaces the hash that
+        was verified, so a concurrent password change wins. Failures are logged
+        and do not affect the login.
+        """
+        try:
+            cursor.execute(
+                "UPDATE staff SET password_hash=%s WHERE staff_id=%s AND password_hash=%s",
+                (hash_password(password), row['staff_id'], row['password_hash'])
+            )
+            conn.commit()
+            logger.info("Password hash upgraded for staff %s", row['staff_id'])
+        except Exception as e:
+            conn.rollback()
+            logger.warning("Could not upgrade password hash for staff %s: %s", row['staff_id'], e)
+
+    # -------------------------------------------------------------
+    # ASYNC VARIANTS (password hashing pool)
+    # -------------------------------------------------------------
+    def authenticate_async(self, username, password, callback=None):
+        return submit(self.authenticate, username, password, callback=callback)
+
+    def add_async(self, staff_data, callback=None):
+        return submit(self.add, staff_data, callback=callback)
+
+    def update_async(self, staff_id, staff_data, callback=None):
+        return submit(self.update, staff_id, staff_data, callback=callback)
+
+    def change_password_async(self, staff_id, old_password, new_password, callback=None):
+        return submit(self.change_password, staff_id, old_password, new_password, callback=callback)
+
+    def search(self, by=None, query=None, limit=None, after=None, order_by=None, descending=False):
         """
         Search staff dynamically by any valid column.
         Example: search(by='full_name', query='John')
@@ -182,6 +239,15 @@ class StaffAPI:
         if by not in valid_fields:
             return {"status": "error", "message": f"Invalid search field. Use one of: {', '.join(valid_fields)}"}
 
+        where, params = ([f"{by} LIKE %s"], [f"%{query}%"]) if query else ([], [])
+        try:
+            sql, params, limit, key_fields = keyset_query(
+                "SELECT staff_id, username, full_name, role, email, created_at FROM staff", where, params,
+                "staff_id", None, self.SORT_COLUMNS, limit, after, order_by, descending
+            )
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+
         conn = get_connection()
         if not conn:
             logger.error("DB connection failed in search()")
@@ -189,29 +255,42 @@ class StaffAPI:
 
         cursor = conn.cursor(dictionary=True)
         try:
-            if not query:
-                cursor.execute(f"SELECT staff_id, username, full_name, role, email, created_at FROM staff")
-            else:
-                sql = f"SELECT staff_id, username, full_name, role, email, created_at FROM staff WHERE {by} LIKE %s"
-                cursor.execute(sql, (f"%{query}%",))
-            rows = cursor.fetchall()
+            cursor.execute(sql, params)
+            rows, next_cursor, has_more = page_rows(cursor.fetchall(), limit, key_fields)
             data = [StaffModel.from_db_row(row).to_dict() for row in rows]
-            logger.info(f"Staff search: by={by}, query={query}, results={len(data)}")
-            return {"status": "success","message":"Search results", "data": data}
+            logger.info("Staff search: by=%s, query=%s, results=%s", by, query, len(data))
+            return {"status": "success","message":"Search results", "data": data,
+                    "next_cursor": next_cursor, "has_more": has_more}
         except Exception as e:
-            logger.error(f"Error in staff search by {by}: {e}")
+            logger.error("Error in staff search by %s: %s", by, e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
             conn.close()
 
-    def get_profile(self, full_name):
-        # Just reuse get_by_id
-        return self.search(by="full_name", query=full_name)
+    def get_session(self, token):
+        """
+        Checks a token issued by authenticate() without touching the database.
+        Returns its claims: staff_id, username, role, exp.
+        """
+        claims = verify_token(token)
+        if claims is None:
+            return {"status": "error", "message": "Invalid or expired session"}
+        return {"status": "success", "message": "Valid session", "data": claims}
+
+    def get_profile(self, token):
+        # The session names the staff member; fetch them by primary key
+        session = self.get_session(token)
+        if session["status"] == "error":
+            return session
+        return self.get_by_id(session["data"]["staff_id"])
 
-    def update_profile(self, staff_id, fields):
-        # Just reuse update
-        return self.update(staff_id, fields)
+    def update_profile(self, token, fields):
+        session = self.get_session(token)
+        if session["status"] == "error":
+            return session
+        fields = {k: v for k, v in (fields or {}).items() if k in self.PROFILE_FIELDS}
+        return self.update(session["data"]["staff_id"], fields)
 
     def change_password(self, staff_id, old_password, new_password):
         conn = get_connection()
@@ -224,10 +303,10 @@ class StaffAPI:
             row = cursor.fetchone()
             if not row:
                 return {"status": "error", "message": "Staff not found"}
-            if not bcrypt.checkpw(old_password.encode('utf-8'), row['password_hash'].encode('utf-8')):
+            if not check_password(old_password, row['password_hash']):
                 return {"status": "error", "message": "Old password incorrect"}
 
-            new_hash = bcrypt.hashpw(new_password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+            new_hash = hash_password(new_password)
             cursor.execute("UPDATE staff SET password_hash=%s WHERE staff_id=%s", (new_hash, staff_id))
             conn.commit()
             return {"status": "success", "message": "Password changed", "data": staff_id}
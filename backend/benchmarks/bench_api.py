@@ -0,0 +1,384 @@
+# backend/benchmarks/bench_api.py
+#
+# Times every public method of BookAPI, OrdersAPI, CustomersAPI, PaymentsAPI,
+# ReportsAPI and StaffAPI.authenticate against a database filled by datagen.py,
+# and reports per method:
+#
+#   p50 / p95 / p99 ms  -> latency percentiles over the timed calls
+#   queries             -> statements executed per call (mean)
+#
+#   python -m backend.benchmarks.bench_api [--iterations N] [--cold]
+#                                          [--save FILE] [--compare FILE] [--tolerance 0.2]
+#   DB_ENGINE=sqlite python -m backend.benchmarks.bench_api --scales small,medium [--data-dir DIR]
+#
+# Without --scales the configured database is measured as is. With
+# DB_ENGINE=sqlite, --scales runs each scale on its own bench_<scale>.db file,
+# generating it on first use. Write methods run as add -> update -> delete
+# cycles on rows they create, so the data set is unchanged afterwards.
+# --cold clears the catalog cache before every call.
+#
+# --save writes the results as a JSON baseline; --compare reads one and
+# exits with 1 when a method's p95 grew by more than the tolerance (and by at
+# least 1 ms) or it runs more statements than before.
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+from backend.api.books import BookAPI
+from backend.api.customers import CustomersAPI
+from backend.api.orders import OrdersAPI
+from backend.api.payments import PaymentsAPI
+from backend.api.reports import ReportsAPI
+from backend.api.staff import StaffAPI
+from backend.benchmarks import datagen
+from backend.cache.catalog_cache import catalog_cache
+from backend.database import db_connection
+from backend.database.connection_pool import PooledConnection
+from backend.search.book_index import book_index
+
+TABLES = ("books", "customers", "orders", "order_items", "payments")
+
+
+# -------------------------------------------------------------
+# STATEMENT COUNTING
+# -------------------------------------------------------------
+class StatementCounter:
+    """
+    Counts statements run on pooled connections while installed.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def install(self):
+        counter = self
+
+        class CountingCursor:
+            def __init__(self, cursor):
+                self._cursor = cursor
+
+            def execute(self, *args, **kwargs):
+                counter.count += 1
+                return self._cursor.execute(*args, **kwargs)
+
+            def executemany(self, *args, **kwargs):
+                counter.count += 1
+                return self._cursor.executemany(*args, **kwargs)
+
+            def __getattr__(self, name):
+                return getattr(self._cursor, name)
+
+        def cursor(conn, *args, **kwargs):
+            return CountingCursor(conn._raw.cursor(*args, **kwargs))
+
+        return mock.patch.object(PooledConnection, "cursor", cursor, create=True)
+
+
+# -------------------------------------------------------------
+# SCENARIOS
+# -------------------------------------------------------------
+class Context:
+    """
+    API objects, id ranges of the loaded data and a seeded RNG for arguments.
+    """
+
+    def __init__(self, seed=7):
+        self.rnd = random.Random(seed)
+        self.books, self.orders, self.customers = BookAPI(), OrdersAPI(), CustomersAPI()
+        self.payments, self.reports, self.staff = PaymentsAPI(), ReportsAPI(), StaffAPI()
+        self.ranges, self.counts = {}, {}
+        conn = db_connection.get_connection()
+        if not conn:
+            raise RuntimeError("DB connection failed")
+        cursor = conn.cursor()
+        try:
+            for table in TABLES:
+                key = "item_id" if table == "order_items" else table.rstrip("s") + "_id"
+                cursor.execute(f"SELECT MIN({key}), MAX({key}), COUNT(*) FROM {table}")
+                low, high, count = cursor.fetchone()
+                self.ranges[table] = (low or 1, high or 1)
+                self.counts[table] = count
+        finally:
+            cursor.close()
+            conn.close()
+
+    def id(self, table):
+        return self.rnd.randint(*self.ranges[table])
+
+    def word(self):
+        return self.rnd.choice(datagen.WORDS)
+
+
+def single(name, call):
+    """
+    A scenario made of one timed call.
+    """
+    def scenario(ctx):
+        yield name, lambda: call(ctx)
+    return scenario
+
+
+def book_writes(ctx):
+    result = yield "BookAPI.add", lambda: ctx.books.add({
+        "title": f"Bench {ctx.word().title()}", "author_id": 1, "publisher_id": 1, "category_id": 1,
+        "price": 199, "stock": 5})
+    book_id = result["data"]["book_id"]
+    yield "BookAPI.update", lambda: ctx.books.update(book_id, {"price": 249, "stock": 7})
+    yield "BookAPI.delete", lambda: ctx.books.delete(book_id)
+
+
+def customer_writes(ctx):
+    result = yield "CustomersAPI.add", lambda: ctx.customers.add({
+        "full_name": "Bench Customer", "email": f"bench{ctx.rnd.randrange(10 ** 9)}@example.com", "city": "Pune"})
+    customer_id = result["data"]["customer_id"]
+    yield "CustomersAPI.update", lambda: ctx.customers.update(customer_id, {"city": "Mumbai"})
+    yield "CustomersAPI.delete", lambda: ctx.customers.delete(customer_id)
+
+
+def order_writes(ctx):
+    items = [{"book_id": ctx.id("books"), "quantity": 1} for _ in range(3)]
+    result = yield "OrdersAPI.add", lambda: ctx.orders.add({"customer_id": ctx.id("customers"), "items": items})
+    order_id = result["data"]["order_id"]
+    yield "OrdersAPI.update", lambda: ctx.orders.update(order_id, {"status": "Confirmed"})
+    yield "OrdersAPI.record_payment", lambda: ctx.orders.record_payment(order_id, 100)
+    yield "OrdersAPI.delete", lambda: ctx.orders.delete(order_id)
+
+
+def payment_writes(ctx):
+    result = yield "PaymentsAPI.add", lambda: ctx.payments.add({"order_id": ctx.id("orders"), "amount": 10})
+    payment_id = result["data"]["payment_id"]
+    yield "PaymentsAPI.update_status", lambda: ctx.payments.update_status(payment_id, "Success")
+    yield "PaymentsAPI.delete", lambda: ctx.payments.delete(payment_id)
+
+
+def _month_ago():
+    return (date.today() - timedelta(days=30)).isoformat()
+
+
+# (scenario, heavy): heavy scenarios read whole tables and run fewer iterations
+SCENARIOS = [
+    (single("BookAPI.get_all[page]", lambda c: c.books.get_all(limit=50)), False),
+    (single("BookAPI.get_all[page, title]", lambda c: c.books.get_all(limit=50, order_by="title")), False),
+    (single("BookAPI.get_all[next page]", lambda c: c.books.get_all(
+        limit=50, after=c.books.get_all(limit=50)["next_cursor"])), False),
+    (single("BookAPI.get_all[fields]", lambda c: c.books.get_all(
+        limit=50, fields=["book_id", "title", "author", "price"])), False),
+    (single("BookAPI.get_all", lambda c: c.books.get_all()), True),
+    (single("BookAPI.get_by_id", lambda c: c.books.get_by_id(c.id("books"))), False),
+    (single("BookAPI.search[ranked]", lambda c: c.books.search(query=c.word(), limit=50)), False),
+    (single("BookAPI.search[title]", lambda c: c.books.search(field="title", query=c.word(), limit=50)), False),
+    (book_writes, False),
+
+    (single("OrdersAPI.get_all[page]", lambda c: c.orders.get_all(limit=50)), False),
+    (single("OrdersAPI.get_all[page, date desc]", lambda c: c.orders.get_all(
+        limit=50, order_by="order_date", descending=True)), False),
+    (single("OrdersAPI.get_all", lambda c: c.orders.get_all()), True),
+    (single("OrdersAPI.get_by_id", lambda c: c.orders.get_by_id(c.id("orders"))), False),
+    (single("OrdersAPI.search[status]", lambda c: c.orders.search("status", "Pending", limit=50)), False),
+    (single("OrdersAPI.search[customer]", lambda c: c.orders.search("customer_id", c.id("customers"), limit=50)), False),
+    (order_writes, False),
+
+    (single("CustomersAPI.get_all[page]", lambda c: c.customers.get_all(limit=50)), False),
+    (single("CustomersAPI.get_all", lambda c: c.customers.get_all()), True),
+    (single("CustomersAPI.get_by_id", lambda c: c.customers.get_by_id(c.id("customers"))), False),
+    (single("CustomersAPI.search_customers[any]", lambda c: c.customers.search_customers(
+        "any", c.rnd.choice(datagen.LAST_NAMES), limit=50)), False),
+    (single("CustomersAPI.search_customers[city]", lambda c: c.customers.search_customers(
+        "city", c.rnd.choice(datagen.CITIES)[0], limit=50)), False),
+    (customer_writes, False),
+
+    (single("PaymentsAPI.search[page]", lambda c: c.payments.search(limit=50)), False),
+    (single("PaymentsAPI.search[status]", lambda c: c.payments.search("payment_status", "Pending", limit=50)), False),
+    (single("PaymentsAPI.search", lambda c: c.payments.search()), True),
+    (payment_writes, False),
+
+    (single("ReportsAPI.get_daily_sales", lambda c: c.reports.get_daily_sales(_month_ago())), False),
+    (single("ReportsAPI.get_daily_sales_plot_data", lambda c: c.reports.get_daily_sales_plot_data(_month_ago())), False),
+    (single("ReportsAPI.get_top_selling_books", lambda c: c.reports.get_top_selling_books(window="last_30d")), False),
+    (single("ReportsAPI.get_top_selling_books[all time]", lambda c: c.reports.get_top_selling_books()), True),
+    (single("ReportsAPI.get_current_stock", lambda c: c.reports.get_current_stock()), True),
+    (single("ReportsAPI.get_low_stock", lambda c: c.reports.get_low_stock(threshold=10, limit=100)), False),
+    (single("ReportsAPI.get_category_stock_summary", lambda c: c.reports.get_category_stock_summary()), True),
+
+    (single("StaffAPI.authenticate", lambda c: c.staff.authenticate(datagen.BENCH_USER, datagen.BENCH_PASSWORD)), False),
+]
+
+
+# -------------------------------------------------------------
+# RUNNING
+# -------------------------------------------------------------
+def percentile(values, q):
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    return values[min(len(values) - 1, max(0, round(q * len(values) + 0.5) - 1))]
+
+
+def run_scenarios(ctx, iterations=30, cold=False):
+    """
+    Runs every scenario (one untimed warm-up pass first) and returns
+    {method: {calls, errors, p50, p95, p99, mean, queries}}.
+    """
+    counter = StatementCounter()
+    samples = {}
+    with counter.install():
+        for scenario, heavy in SCENARIOS:
+            runs = max(3, iterations // 10) if heavy else iterations
+            for i in range(runs + 1):
+                steps = scenario(ctx)
+                result = None
+                while True:
+                    try:
+                        name, call = steps.send(result)
+                    except StopIteration:
+                        break
+                    if cold:
+                        catalog_cache.clear()
+                    counter.count = 0
+                    start = time.perf_counter()
+                    result = call()
+                    elapsed = (time.perf_counter() - start) * 1000
+                    failed = not isinstance(result, dict) or result.get("status") != "success"
+                    if i == 0:
+                        if failed:
+                            print(f"  {name}: {result.get('message') if isinstance(result, dict) else result}")
+                            break
+                        continue
+                    entry = samples.setdefault(name, {"times": [], "queries": 0, "errors": 0})
+                    entry["times"].append(elapsed)
+                    entry["queries"] += counter.count
+                    entry["errors"] += failed
+
+    results = {}
+    for name, entry in samples.items():
+        times = sorted(entry["times"])
+        results[name] = {
+            "calls": len(times),
+            "errors": entry["errors"],
+            "p50": round(percentile(times, 0.50), 3),
+            "p95": round(percentile(times, 0.95), 3),
+            "p99": round(percentile(times, 0.99), 3),
+            "mean": round(sum(times) / len(times), 3),
+            "queries": round(entry["queries"] / len(times), 2),
+        }
+    return results
+
+
+def print_results(label, counts, results):
+    print(f"\n== {label}: " + ", ".join(f"{counts[t]} {t}" for t in TABLES))
+    print(f"{'method':<44} | {'p50 ms':>9} | {'p95 ms':>9} | {'p99 ms':>9} | {'queries':>7} | {'calls':>5}")
+    print("-" * 98)
+    for name, r in results.items():
+        errors = f"  ({r['errors']} errors)" if r["errors"] else ""
+        print(f"{name:<44} | {r['p50']:>9.2f} | {r['p95']:>9.2f} | {r['p99']:>9.2f} | "
+              f"{r['queries']:>7.2f} | {r['calls']:>5}{errors}")
+
+
+def compare(current, baseline, tolerance=0.2):
+    """
+    Prints the methods that got slower or chattier than the baseline.
+    Returns the number of regressions.
+    """
+    regressions = 0
+    for label, scale in current["scales"].items():
+        before = baseline.get("scales", {}).get(label)
+        if before is None:
+            print(f"\n{label}: not in the baseline")
+            continue
+        if before["counts"] != scale["counts"]:
+            print(f"\n{label}: data sizes differ from the baseline ({before['counts']})")
+        print(f"\n== {label} vs baseline")
+        for name, r in scale["results"].items():
+            old = before["results"].get(name)
+            if old is None:
+                continue
+            slower = r["p95"] > old["p95"] * (1 + tolerance) and r["p95"] - old["p95"] >= 1
+            chattier = r["queries"] > old["queries"]
+            if slower or chattier:
+                regressions += 1
+                print(f"  REGRESSION {name}: p95 {old['p95']:.2f} -> {r['p95']:.2f} ms, "
+                      f"queries {old['queries']} -> {r['queries']}")
+            elif r["p95"] < old["p95"] * (1 - tolerance) and old["p95"] - r["p95"] >= 1:
+                print(f"  faster     {name}: p95 {old['p95']:.2f} -> {r['p95']:.2f} ms")
+    print(f"\n{regressions} regression(s)")
+    return regressions
+
+
+def use_database(path):
+    """
+    Points the SQLite engine at another file and drops state from the previous one.
+    """
+    db_connection.close_pool()
+    os.environ["DB_PATH"] = path
+    catalog_cache.clear()
+    book_index.invalidate()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the backend APIs against a generated shop.")
+    parser.add_argument("--iterations", type=int, default=30, help="timed calls per method (heavy ones: a tenth)")
+    parser.add_argument("--cold", action="store_true", help="clear the catalog cache before every call")
+    parser.add_argument("--scales", help="comma-separated datagen scales (DB_ENGINE=sqlite only)")
+    parser.add_argument("--data-dir", default=".", help="where the bench_<scale>.db files live")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare with a JSON baseline written by --save")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p95 growth (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    if args.scales and db_connection.ENGINE != "sqlite":
+        parser.error("--scales needs DB_ENGINE=sqlite; with MySQL, load each scale with datagen and run once per scale")
+
+    labels = args.scales.split(",") if args.scales else ["current"]
+    output = {
+        "meta": {
+            "engine": db_connection.ENGINE,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "iterations": args.iterations,
+            "cold": args.cold,
+            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "scales": {},
+    }
+
+    for label in labels:
+        if args.scales:
+            if label not in datagen.SCALES:
+                parser.error(f"Unknown scale '{label}' (expected one of: {', '.join(datagen.SCALES)})")
+            path = os.path.join(args.data_dir, f"bench_{label}.db")
+            fresh = not os.path.exists(path)
+            use_database(path)
+            if fresh:
+                print(f"Generating {label} shop in {path} ...")
+                result = datagen.generate(label)
+                if result["status"] != "success":
+                    print(result["message"])
+                    return 1
+
+        ctx = Context()
+        results = run_scenarios(ctx, args.iterations, args.cold)
+        print_results(label, ctx.counts, results)
+        output["scales"][label] = {"counts": ctx.counts, "results": results}
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2)
+        print(f"\nSaved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(output, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
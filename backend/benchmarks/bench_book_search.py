@@ -0,0 +1,126 @@
+# backend/benchmarks/bench_book_search.py
+#
+# Measures BookSearchIndex build time and query latency on a synthetic catalog.
+#
+# The database is replaced by an in-memory stand-in serving N generated books
+# plus their authors, publishers and categories, so the benchmark runs without a
+# MySQL server and measures the index itself.
+#
+# Run: python -m backend.benchmarks.bench_book_search [num_books]
+
+import random
+import sys
+import time
+
+from backend.search.book_index import BookSearchIndex
+
+WORDS = (
+    "shadow river garden night empire silent stone winter golden secret house "
+    "city ocean forest letters journey memory fire glass crown island dream "
+    "mountain history children voice light storm bridge kingdom broken wild "
+    "summer last lost return song moon queen road north hidden paper iron"
+).split()
+FIRST_NAMES = "Amit Priya Rahul Anita Vikram Sara John Maya Ravi Leela Arjun Nina".split()
+LAST_NAMES = "Sharma Iyer Das Mehta Rao Singh Khan Bose Nair Kapoor Verma Pillai".split()
+QUERIES = ["shadow", "sha", "golden river", "win gar", "sharma", "rao fire", "fiction", "9780000012345", "zzz"]
+
+
+class CatalogConnection:
+    """
+    Minimal connection double answering the queries BookSearchIndex.build() runs.
+    """
+
+    def __init__(self, num_books, seed=42):
+        rnd = random.Random(seed)
+        self.authors = [
+            {"id": i, "name": f"{rnd.choice(FIRST_NAMES)} {rnd.choice(LAST_NAMES)}"}
+            for i in range(1, max(num_books // 20, 1) + 1)
+        ]
+        self.publishers = [{"id": i, "name": f"{rnd.choice(WORDS).title()} Press"} for i in range(1, 201)]
+        self.categories = [
+            {"id": i, "name": name}
+            for i, name in enumerate(["Fiction", "History", "Science", "Poetry", "Children", "Travel"], start=1)
+        ]
+        self.books = [
+            {
+                "book_id": i,
+                "title": " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(2, 5))).title(),
+                "isbn": f"978-{i:010d}",
+                "author_id": rnd.randint(1, len(self.authors)),
+                "publisher_id": rnd.randint(1, len(self.publishers)),
+                "category_id": rnd.randint(1, len(self.categories)),
+            }
+            for i in range(1, num_books + 1)
+        ]
+
+    def cursor(self, dictionary=False):
+        return CatalogCursor(self)
+
+    def close(self):
+        pass
+
+
+class CatalogCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self._rows = []
+
+    def execute(self, sql, params=()):
+        for table in ("authors", "publishers", "categories", "books"):
+            if f"FROM {table}" in sql:
+                self._rows = list(getattr(self.conn, table))
+                return
+        self._rows = []
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def fetchmany(self, size=1):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def close(self):
+        pass
+
+
+def run(num_books=300000, repeat=20, page_size=50):
+    conn = CatalogConnection(num_books)
+    index = BookSearchIndex()
+
+    start = time.perf_counter()
+    index.build(conn)
+    print(f"Indexed {num_books} books in {(time.perf_counter() - start) * 1000:.0f} ms\n")
+
+    print(f"{'query':>16} | {'hits':>7} | {'avg ms':>8} | {'max ms':>8}   (first {page_size} hits)")
+    print("-" * 48)
+    for query in QUERIES:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            _, total = index.search(query, limit=page_size)
+            timings.append((time.perf_counter() - start) * 1000)
+        print(f"{query:>16} | {total:>7} | {sum(timings) / repeat:>8.2f} | {max(timings):>8.2f}")
+
+    # Maintenance keeps results current without a rebuild
+    index.index_book({"book_id": num_books + 1, "title": "Quixotic Lighthouse", "isbn": None,
+                      "author_id": 1, "publisher_id": 1, "category_id": 1})
+    assert [b for b, _ in index.search("quixo")[0]] == [num_books + 1]
+    index.remove_book(num_books + 1)
+    assert index.search("quixotic") == ([], 0)
+
+    # Paging with an (score, book_id) cursor walks the full ranking exactly once
+    full, _ = index.search("golden river")
+    paged, after = [], None
+    while True:
+        page, _ = index.search("golden river", limit=page_size, after=after)
+        if not page:
+            break
+        paged += page
+        after = (page[-1][1], page[-1][0])
+    assert paged == full
+    print("\nIncremental add/remove reflected in results.")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 300000)
@@ -0,0 +1,104 @@
+# backend/benchmarks/bench_orders_listing.py
+#
+# Shows that OrdersAPI.get_all() and OrdersAPI.search() issue a constant number
+# of statements no matter how many orders they return.
+#
+# The database is replaced by an in-memory stand-in that serves N synthetic
+# orders (3 items each) and counts every cursor.execute(), so the benchmark runs
+# without a MySQL server and measures round trips rather than server speed.
+#
+# Run: python -m backend.benchmarks.bench_orders_listing
+
+import time
+from datetime import datetime
+from unittest import mock
+
+from backend.api import orders as orders_module
+
+
+class CountingConnection:
+    """
+    Minimal connection double: answers `FROM order_items` and `FROM orders`
+    queries from in-memory rows and counts executed statements.
+    """
+
+    def __init__(self, num_orders, items_per_order=3):
+        self.statements = 0
+        now = datetime.now()
+        self.orders = [
+            {"order_id": i, "customer_id": 1, "order_date": now, "total_amount": 100.0, "status": "Confirmed"}
+            for i in range(1, num_orders + 1)
+        ]
+        self.items = [
+            {"item_id": (i - 1) * items_per_order + j, "order_id": i, "book_id": j, "quantity": 1, "price_each": 100.0 / items_per_order}
+            for i in range(1, num_orders + 1)
+            for j in range(1, items_per_order + 1)
+        ]
+
+    def cursor(self, dictionary=False):
+        return CountingCursor(self, dictionary)
+
+    def close(self):
+        pass
+
+
+class CountingCursor:
+    def __init__(self, conn, dictionary=False):
+        self.conn = conn
+        self.dictionary = dictionary
+        self.description = None
+        self._rows = []
+
+    def execute(self, sql, params=()):
+        self.conn.statements += 1
+        if "FROM order_items" in sql:
+            rows = self.conn.items
+        elif "FROM orders" in sql:
+            rows = self.conn.orders
+        else:
+            rows = []
+        if self.dictionary or not rows:
+            self._rows = rows
+        else:
+            # Plain cursors return tuples, described by cursor.description
+            columns = list(rows[0])
+            self.description = [(name,) for name in columns]
+            self._rows = [tuple(row[name] for name in columns) for row in rows]
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def close(self):
+        pass
+
+
+def run(sizes=(10, 100, 1000, 10000, 20000)):
+    api = orders_module.OrdersAPI()
+    print(f"{'orders':>8} | {'get_all stmts':>13} | {'search stmts':>12} | {'get_all ms':>10}")
+    print("-" * 54)
+    counts = set()
+    for n in sizes:
+        conn = CountingConnection(n)
+        with mock.patch.object(orders_module, "get_connection", return_value=conn):
+            start = time.perf_counter()
+            resp = api.get_all()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            get_all_stmts = conn.statements
+
+            conn.statements = 0
+            api.search("status", "Confirmed")
+            search_stmts = conn.statements
+
+        assert resp["status"] == "success" and len(resp["data"]) == n
+        counts.add((get_all_stmts, search_stmts))
+        print(f"{n:>8} | {get_all_stmts:>13} | {search_stmts:>12} | {elapsed_ms:>10.1f}")
+
+    assert len(counts) == 1, f"Statement count varies with order count: {counts}"
+    print("\nStatement count is constant across order counts.")
+
+
+if __name__ == "__main__":
+    run()
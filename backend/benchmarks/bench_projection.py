@@ -0,0 +1,131 @@
+# backend/benchmarks/bench_projection.py
+#
+# Compares the books table listing before and after projection push-down:
+#
+#   filtered  -> BookAPI.get_all() builds full book rows (description included)
+#                and the client keeps only its columns afterwards
+#   projected -> BooksClient passes its columns down; only those are selected
+#
+# The database is replaced by an in-memory stand-in serving N synthetic books
+# with ~1 KB descriptions. Like a real driver it decodes a fresh row tuple per
+# fetch, holding only the columns named in the SELECT list, so the numbers
+# reflect what each path reads and builds. Peak memory is measured with
+# tracemalloc, latency with perf_counter (best of 3).
+#
+# Run: python -m backend.benchmarks.bench_projection [num_books]
+
+import re
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from unittest import mock
+
+from backend.api import books as books_module
+from backend.cache.catalog_cache import catalog_cache
+from frontend.api_client import BooksClient, handle_response
+
+DESCRIPTION = ("A sweeping family saga across three generations. " * 20).encode("utf-8")
+
+
+class CatalogConnection:
+    """
+    Minimal connection double answering the books listing query.
+    """
+
+    def __init__(self, num_books):
+        now = datetime.now()
+        self.books = [
+            {
+                "book_id": i, "title": f"Book {i:07d}", "isbn": f"978{i:010d}",
+                "author_id": i % 500 + 1, "author_name": f"Author {i % 500 + 1}",
+                "publisher_id": i % 50 + 1, "publisher_name": f"Publisher {i % 50 + 1}",
+                "category_id": i % 12 + 1, "genre": f"Genre {i % 12 + 1}",
+                "language": "English", "publication_year": 1990 + i % 30,
+                "price": 199.0 + i % 300, "stock": i % 40, "reorder_point": None,
+                "description": DESCRIPTION, "created_at": now, "updated_at": now,
+            }
+            for i in range(1, num_books + 1)
+        ]
+
+    def cursor(self, dictionary=False):
+        return CatalogCursor(self)
+
+    def close(self):
+        pass
+
+
+class CatalogCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self._keys = []
+        self.description = None
+
+    def execute(self, sql, params=()):
+        select = re.search(r"SELECT\s+(.*?)\s+FROM books", sql, re.S).group(1)
+        if "b.*" in select:
+            self._keys = list(self.conn.books[0])
+        else:
+            # "b.title" -> title, "a.full_name AS author_name" -> author_name
+            self._keys = [col.split(" AS ")[-1].split(".")[-1].strip() for col in select.split(",")]
+        self.description = [(key,) for key in self._keys]
+
+    def fetchall(self):
+        desc = self._keys.index("description") if "description" in self._keys else None
+        rows = []
+        for book in self.conn.books:
+            row = [book[key] for key in self._keys]
+            if desc is not None:
+                row[desc] = row[desc].decode("utf-8")
+            rows.append(tuple(row))
+        return rows
+
+    def fetchone(self):
+        rows = self.fetchall()
+        return rows[0] if rows else None
+
+    def close(self):
+        pass
+
+
+def listing_filtered(client):
+    return handle_response(client.api.get_all, fields=client.fields)
+
+
+def listing_projected(client):
+    return client.get_all()
+
+
+def measure(func, client):
+    best = float("inf")
+    for _ in range(3):
+        catalog_cache.clear()
+        start = time.perf_counter()
+        func(client)
+        best = min(best, time.perf_counter() - start)
+
+    catalog_cache.clear()
+    tracemalloc.start()
+    data = func(client)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return data, best * 1000, peak / 2 ** 20
+
+
+def run(sizes=(1000, 10000, 100000)):
+    client = BooksClient()
+    print(f"{'books':>8} | {'filtered ms':>11} | {'projected ms':>12} | {'filtered MiB':>12} | {'projected MiB':>13}")
+    print("-" * 70)
+    for n in sizes:
+        conn = CatalogConnection(n)
+        with mock.patch.object(books_module, "get_connection", return_value=conn):
+            old, old_ms, old_mib = measure(listing_filtered, client)
+            new, new_ms, new_mib = measure(listing_projected, client)
+
+        assert old == new, "Projected listing differs from the filtered one"
+        print(f"{n:>8} | {old_ms:>11.1f} | {new_ms:>12.1f} | {old_mib:>12.1f} | {new_mib:>13.1f}")
+    catalog_cache.clear()
+
+
+if __name__ == "__main__":
+    run((int(sys.argv[1]),) if len(sys.argv) > 1 else (1000, 10000, 100000))
@@ -0,0 +1,115 @@
+# backend/benchmarks/bench_records.py
+#
+# Compares the two ways of turning a books listing into API rows:
+#
+#   model  -> dictionary cursor rows, BookModel.from_db_row(row).to_dict()
+#             (the previous BookAPI read path)
+#   record -> plain cursor tuples wrapped in BookRecords (backend/models/records.py)
+#
+# Both sides include the driver's own row building (a dict per row for a
+# dictionary cursor, a tuple per row otherwise), since choosing the cursor
+# type is part of the change. Reported per side:
+#
+#   build ms   -> CPU time to materialize the whole listing
+#   MiB        -> memory held by the materialized listing (tracemalloc)
+#   read ms    -> CPU time to then read every field of every row once
+#                 (e.g. an export)
+#
+# Run: python -m backend.benchmarks.bench_records [num_books]
+
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from decimal import Decimal
+
+from backend.models.book_model import BookModel, BookRecord
+
+COLUMNS = [
+    "book_id", "title", "isbn", "author_id", "publisher_id", "category_id", "publication_year",
+    "language", "price", "stock", "reorder_point", "description", "created_at", "updated_at",
+    "author_name", "publisher_name", "genre"
+]
+
+
+class FakeCursor:
+    """
+    Stands in for the driver: hands out freshly built rows from compact
+    source lists, as dicts (dictionary=True) or tuples.
+    """
+
+    def __init__(self, source, dictionary):
+        self.source = source
+        self.dictionary = dictionary
+        self.description = [(name,) for name in COLUMNS]
+
+    def fetchall(self):
+        if self.dictionary:
+            return [dict(zip(COLUMNS, values)) for values in self.source]
+        return [tuple(values) for values in self.source]
+
+
+def make_source(num_books):
+    now = datetime.now().replace(microsecond=0)
+    titles = [f"Title {i}" for i in range(1000)]
+    return [
+        [i, titles[i % 1000], f"978{i:010d}", i % 500 + 1, i % 50 + 1, i % 12 + 1, 1990 + i % 30,
+         "English", Decimal("199.00") + i % 300, i % 40, None, None, now, now,
+         f"Author {i % 500}", f"Publisher {i % 50}", f"Genre {i % 12}"]
+        for i in range(1, num_books + 1)
+    ]
+
+
+def build_models(source):
+    cursor = FakeCursor(source, dictionary=True)
+    return [BookModel.from_db_row(row).to_dict() for row in cursor.fetchall()]
+
+
+def build_records(source):
+    return BookRecord.read_all(FakeCursor(source, dictionary=False))
+
+
+def read_everything(rows):
+    for row in rows:
+        for key in BookRecord.FIELDS:
+            row[key]
+
+
+def measure(build, source):
+    gc.collect()
+    start = time.process_time()
+    rows = build(source)
+    build_ms = (time.process_time() - start) * 1000
+    del rows
+
+    gc.collect()
+    tracemalloc.start()
+    rows = build(source)
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.process_time()
+    read_everything(rows)
+    read_ms = (time.process_time() - start) * 1000
+    return rows, build_ms, held / 2 ** 20, read_ms
+
+
+def run(num_books=500000):
+    source = make_source(num_books)
+    print(f"{num_books} books")
+    print(f"{'path':>8} | {'build ms':>9} | {'MiB':>7} | {'read ms':>8}")
+    print("-" * 42)
+    results = {}
+    for name, build in (("model", build_models), ("record", build_records)):
+        rows, build_ms, mib, read_ms = measure(build, source)
+        results[name] = rows[:100]
+        print(f"{name:>8} | {build_ms:>9.0f} | {mib:>7.1f} | {read_ms:>8.0f}")
+        del rows
+
+    assert [dict(r) for r in results["record"]] == results["model"], "Records differ from model dicts"
+    print("\nRecords read the same as BookModel.to_dict().")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500000)
@@ -0,0 +1,280 @@
+# backend/benchmarks/datagen.py
+#
+# Fills an empty database with a synthetic shop of a given size, for the
+# benchmarks in bench_api.py.
+#
+#   python -m backend.benchmarks.datagen [--scale small|medium|large] [--seed N]
+#                                        [--books N] [--customers N] [--orders N]
+#                                        [--days N] [--end YYYY-MM-DD]
+#
+# The same seed, sizes and end date always produce the same rows. Orders are
+# spread over the `days` days up to the end date (default: today) and carry
+# about 3 items each, so --scale large (500k books, 2M customers, 3.4M orders)
+# gives roughly 10M order_items. Runs against whatever DB_ENGINE / DB_* point
+# at; with DB_ENGINE=sqlite a fresh DB_PATH file is the quickest way to a
+# throwaway shop.
+#
+# Rows are written with multi-row INSERTs, GEN_BATCH per statement and one
+# commit per statement. The stock and sales rollup triggers fire as usual, so
+# the rollups are consistent when the load finishes.
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from backend.api.staff import StaffAPI
+from backend.database.db_connection import get_connection
+from backend.utils.helpers import parse_date
+from backend.utils.logger import logger
+
+# Rows per INSERT statement
+GEN_BATCH = 1000
+
+SCALES = {
+    "small": {"books": 2000, "customers": 5000, "orders": 10000},
+    "medium": {"books": 50000, "customers": 200000, "orders": 340000},
+    "large": {"books": 500000, "customers": 2000000, "orders": 3400000},
+}
+
+# Login created for StaffAPI.authenticate benchmarks
+BENCH_USER = "bench"
+BENCH_PASSWORD = "bench-password"
+
+WORDS = (
+    "shadow river garden night empire silent stone winter golden secret house "
+    "city ocean forest letters journey memory fire glass crown island dream "
+    "mountain history children voice light storm bridge kingdom broken wild "
+    "summer last lost return song moon queen road north hidden paper iron"
+).split()
+FIRST_NAMES = "Amit Priya Rahul Anita Vikram Sara John Maya Ravi Leela Arjun Nina Kiran Dev Asha Omar".split()
+LAST_NAMES = "Sharma Iyer Das Mehta Rao Singh Khan Bose Nair Kapoor Verma Pillai Gupta Reddy Joshi Sen".split()
+CITIES = [
+    ("Mumbai", "Maharashtra"), ("Pune", "Maharashtra"), ("Delhi", "Delhi"), ("Bengaluru", "Karnataka"),
+    ("Chennai", "Tamil Nadu"), ("Kolkata", "West Bengal"), ("Hyderabad", "Telangana"), ("Jaipur", "Rajasthan"),
+    ("Kochi", "Kerala"), ("Lucknow", "Uttar Pradesh"),
+]
+LANGUAGES = ["English"] * 6 + ["Hindi", "Bengali", "Tamil", "Marathi"]
+ORDER_STATUSES = ["Delivered"] * 6 + ["Shipped"] * 2 + ["Confirmed", "Pending", "Cancelled"]
+PAYMENT_METHODS = ["UPI", "UPI", "Card", "NetBanking", "Cash"]
+
+
+def sizes_for(scale, books=None, customers=None, orders=None):
+    """
+    Table sizes for a scale preset, with any explicit counts overriding it.
+    Authors, publishers and categories follow from the number of books.
+    """
+    sizes = dict(SCALES[scale])
+    for key, value in (("books", books), ("customers", customers), ("orders", orders)):
+        if value is not None:
+            sizes[key] = value
+    sizes["authors"] = max(sizes["books"] // 10, 1)
+    sizes["publishers"] = max(sizes["books"] // 250, 20)
+    sizes["categories"] = 40
+    return sizes
+
+
+def isbn13(n):
+    """
+    A valid ISBN-13 (978 prefix) for sequence number n.
+    """
+    digits = f"978{n:09d}"
+    total = sum(int(d) * (1 if i % 2 == 0 else 3) for i, d in enumerate(digits))
+    return digits + str((10 - total % 10) % 10)
+
+
+# -------------------------------------------------------------
+# WRITING
+# -------------------------------------------------------------
+class Loader:
+    """
+    Batched multi-row INSERTs on one connection. insert() returns the id of
+    each row written, from the first id of every statement (InnoDB and the
+    SQLite engine both number a multi-row INSERT consecutively).
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.cursor = conn.cursor()
+        self.rows_written = 0
+
+    def insert(self, table, columns, rows):
+        ids = []
+        placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+        for start in range(0, len(rows), GEN_BATCH):
+            batch = rows[start:start + GEN_BATCH]
+            self.cursor.execute(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES " + ", ".join([placeholders] * len(batch)),
+                [value for row in batch for value in row]
+            )
+            first = self.cursor.lastrowid
+            ids.extend(range(first, first + len(batch)))
+            self.conn.commit()
+        self.rows_written += len(rows)
+        return ids
+
+    def stream(self, table, columns, rows):
+        """
+        insert() for a generator of rows, without holding them all.
+        """
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == GEN_BATCH:
+                self.insert(table, columns, batch)
+                batch = []
+        if batch:
+            self.insert(table, columns, batch)
+
+    def close(self):
+        self.cursor.close()
+
+
+# -------------------------------------------------------------
+# GENERATION
+# -------------------------------------------------------------
+def generate(scale="small", seed=42, books=None, customers=None, orders=None, days=365, end_date=None):
+    """
+    Loads a synthetic shop into the (empty) configured database.
+    Returns the usual response dict; data holds the row count per table.
+    """
+    if scale not in SCALES:
+        return {"status": "error", "message": f"Unknown scale '{scale}' (expected one of: {', '.join(SCALES)})"}
+    sizes = sizes_for(scale, books, customers, orders)
+    end_date = end_date or date.today()
+    first_day = datetime.combine(end_date, datetime.min.time()) - timedelta(days=days - 1)
+    rnd = random.Random(seed)
+
+    conn = get_connection()
+    if not conn:
+        return {"status": "error", "message": "DB connection failed"}
+
+    start = time.perf_counter()
+    loader = Loader(conn)
+    try:
+        loader.cursor.execute("SELECT COUNT(*) FROM books")
+        if loader.cursor.fetchone()[0]:
+            return {"status": "error", "message": "The database already has books; generate into an empty one"}
+
+        category_ids = loader.insert("categories", ["name", "description"], [
+            (f"{WORDS[i % len(WORDS)].title()} {'Stories' if i < len(WORDS) else 'Studies'}", None)
+            for i in range(sizes["categories"])
+        ])
+        publisher_ids = loader.insert("publishers", ["name", "location"], [
+            (f"{rnd.choice(WORDS).title()} Press {i}", rnd.choice(CITIES)[0])
+            for i in range(1, sizes["publishers"] + 1)
+        ])
+        author_ids = loader.insert("authors", ["full_name", "country", "birth_year"], [
+            (f"{rnd.choice(FIRST_NAMES)} {rnd.choice(LAST_NAMES)}", "India", rnd.randint(1900, 1995))
+            for _ in range(sizes["authors"])
+        ])
+        logger.info("[DATAGEN] %s authors, %s publishers, %s categories", len(author_ids), len(publisher_ids), len(category_ids))
+
+        # Prices in paise, kept to price the order items
+        prices = [rnd.randint(99, 1999) * 100 for _ in range(sizes["books"])]
+        book_ids = loader.insert(
+            "books",
+            ["title", "isbn", "author_id", "publisher_id", "category_id", "language",
+             "publication_year", "price", "stock", "reorder_point", "description"],
+            [
+                (" ".join(rnd.choice(WORDS) for _ in range(rnd.randint(2, 5))).title(), isbn13(i),
+                 rnd.choice(author_ids), rnd.choice(publisher_ids), rnd.choice(category_ids),
+                 rnd.choice(LANGUAGES), rnd.randint(1950, end_date.year), prices[i] / 100,
+                 1000000, rnd.choice((None,) * 9 + (25,)),
+                 f"A {rnd.choice(WORDS)} tale of {rnd.choice(WORDS)} and {rnd.choice(WORDS)}.")
+                for i in range(sizes["books"])
+            ]
+        )
+        logger.info("[DATAGEN] %s books", len(book_ids))
+
+        customer_ids = loader.insert(
+            "customers",
+            ["full_name", "email", "phone", "city", "state", "country", "postal_code"],
+            [
+                (f"{rnd.choice(FIRST_NAMES)} {rnd.choice(LAST_NAMES)}", f"customer{i}@example.com",
+                 f"+91 9{rnd.randint(100000000, 999999999)}", *rnd.choice(CITIES), "India",
+                 f"{rnd.randint(110000, 799999)}")
+                for i in range(1, sizes["customers"] + 1)
+            ]
+        )
+        logger.info("[DATAGEN] %s customers", len(customer_ids))
+
+        # Orders and their items / payments go in together, one batch of orders at a time
+        num_items = num_payments = 0
+        for batch_start in range(0, sizes["orders"], GEN_BATCH):
+            count = min(GEN_BATCH, sizes["orders"] - batch_start)
+            orders_batch, items_batch = [], []
+            for _ in range(count):
+                items = [(rnd.randrange(len(book_ids)), rnd.randint(1, 3)) for _ in range(rnd.randint(1, 5))]
+                total = sum(prices[b] * q for b, q in items) / 100
+                order_date = first_day + timedelta(seconds=rnd.randrange(days * 86400))
+                orders_batch.append((rnd.choice(customer_ids), order_date, total, rnd.choice(ORDER_STATUSES)))
+                items_batch.append(items)
+
+            order_ids = loader.insert("orders", ["customer_id", "order_date", "total_amount", "status"], orders_batch)
+            item_rows, payment_rows = [], []
+            for order_id, order, items in zip(order_ids, orders_batch, items_batch):
+                item_rows += [(order_id, book_ids[b], q, prices[b] / 100) for b, q in items]
+                if order[3] != "Cancelled":
+                    payment_rows.append((order_id, rnd.choice(PAYMENT_METHODS), order[2],
+                                         "Pending" if order[3] == "Pending" else "Success",
+                                         f"TXN{order_id:010d}", order[1]))
+            loader.insert("order_items", ["order_id", "book_id", "quantity", "price_each"], item_rows)
+            loader.insert("payments", ["order_id", "payment_method", "amount", "payment_status",
+                                       "transaction_id", "payment_date"], payment_rows)
+            num_items += len(item_rows)
+            num_payments += len(payment_rows)
+            if (batch_start // GEN_BATCH) % 100 == 99:
+                logger.info("[DATAGEN] %s / %s orders", batch_start + count, sizes['orders'])
+
+        # Books were stocked high so the stock trigger never went negative;
+        # now give them a realistic spread, some below their reorder point
+        loader.cursor.execute("UPDATE books SET stock = (book_id * 7919) % 250")
+        conn.commit()
+
+    except Exception as e:
+        logger.error("[DATAGEN] Generation failed after %s rows: %s", loader.rows_written, e)
+        conn.rollback()
+        return {"status": "error", "message": str(e)}
+
+    finally:
+        loader.close()
+        conn.close()
+
+    staff = StaffAPI().add({"username": BENCH_USER, "password": BENCH_PASSWORD, "role": "Staff",
+                            "full_name": "Benchmark User"})
+    if staff["status"] != "success":
+        logger.warning("[DATAGEN] Could not create the benchmark login: %s", staff['message'])
+
+    counts = dict(sizes, order_items=num_items, payments=num_payments)
+    elapsed = time.perf_counter() - start
+    logger.info("[DATAGEN] Generated %s rows in %.1f s: %s", loader.rows_written, elapsed, counts)
+    return {"status": "success", "message": f"Generated {loader.rows_written} rows in {elapsed:.1f} s", "data": counts}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic bookshop for benchmarks.")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--books", type=int)
+    parser.add_argument("--customers", type=int)
+    parser.add_argument("--orders", type=int)
+    parser.add_argument("--days", type=int, default=365, help="days of order history")
+    parser.add_argument("--end", help="last order day (YYYY-MM-DD, default today)")
+    args = parser.parse_args(argv)
+
+    end_date = None
+    if args.end:
+        end_date = parse_date(args.end, "%Y-%m-%d")
+        if not end_date:
+            parser.error(f"Invalid date '{args.end}', expected YYYY-MM-DD")
+        end_date = end_date.date()
+
+    result = generate(args.scale, args.seed, args.books, args.customers, args.orders, args.days, end_date)
+    print(result["message"])
+    return 0 if result["status"] == "success" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,385 @@
+# backend/bulk/catalog_import.py
+#
+# Loads books from a CSV or JSONL file.
+#
+#   python -m backend.bulk.catalog_import FILE [--format csv|jsonl] [--gzip]
+#                                         [--skip-existing] [--dry-run] [--errors PATH]
+#
+# Columns (CSV header / JSON keys): title, author, publisher, category, price,
+# and optionally isbn, language, publication_year, stock, reorder_point,
+# description. "author_name", "publisher_name" and "genre" are accepted too, so
+# a books export (backend/bulk/export.py) can be loaded back.
+#
+# Authors, publishers and categories are matched by name (case-insensitive)
+# and created when missing. Books are upserted by ISBN: an existing ISBN is
+# updated (or left alone with --skip-existing), anything else is inserted.
+# Rows are written IMPORT_BATCH at a time, one multi-row INSERT and one commit
+# per batch; a row that fails validation or is rejected by the database is
+# reported with its line number and the rest of the file still loads.
+
+import argparse
+import csv
+import gzip
+import json
+import os
+import sys
+import time
+
+from backend.bulk.export import FORMATS, file_format
+from backend.cache.catalog_cache import catalog_cache
+from backend.database.db_connection import get_connection
+from backend.search.book_index import book_index
+from backend.utils.helpers import round_price
+from backend.utils.logger import logger
+from backend.utils.validators import is_valid_isbn, is_positive_number, is_non_negative_integer
+
+# Books written per INSERT / commit
+IMPORT_BATCH = int(os.getenv("IMPORT_BATCH", "1000"))
+
+# Entities books refer to by name: kind -> (table, id column, name column, unique name)
+ENTITIES = {
+    "author": ("authors", "author_id", "full_name", False),
+    "publisher": ("publishers", "publisher_id", "name", True),
+    "category": ("categories", "category_id", "name", True),
+}
+
+# Input column -> accepted spellings, first match wins
+ALIASES = {
+    "author": ("author", "author_name"),
+    "publisher": ("publisher", "publisher_name"),
+    "category": ("category", "genre", "category_name"),
+}
+
+BOOK_COLUMNS = (
+    "title", "isbn", "author_id", "publisher_id", "category_id", "publication_year",
+    "language", "price", "stock", "reorder_point", "description",
+)
+
+# Column sizes from init_database.sql
+MAX_LENGTHS = {"title": 200, "isbn": 20, "language": 50, "author": 120, "publisher": 150, "category": 100}
+
+
+# -------------------------------------------------------------
+# READING
+# -------------------------------------------------------------
+def read_rows(path, fmt=None, compress=None):
+    """
+    Yields (line number, row dict) from a CSV or JSONL file ("-" for stdin).
+    A JSONL line that does not parse yields (line number, None).
+    """
+    default_fmt, default_compress = file_format(path)
+    fmt = fmt or default_fmt
+    if compress is None:
+        compress = default_compress
+
+    if path == "-":
+        source = gzip.open(sys.stdin.buffer, "rt", encoding="utf-8", newline="") if compress else sys.stdin
+    elif compress:
+        source = gzip.open(path, "rt", encoding="utf-8-sig", newline="")
+    else:
+        source = open(path, encoding="utf-8-sig", newline="")
+
+    try:
+        if fmt == "csv":
+            reader = csv.DictReader(source)
+            for row in reader:
+                yield reader.line_num, row
+        else:
+            for line_num, line in enumerate(source, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    row = None
+                yield line_num, row if isinstance(row, dict) else None
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+def _value(row, key):
+    """
+    Stripped value of a column under any of its spellings; "" and NULL are None.
+    """
+    for name in ALIASES.get(key, (key,)):
+        value = row.get(name)
+        if isinstance(value, str):
+            value = value.strip()
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def clean_row(row):
+    """
+    Validates one input row the way BookAPI.add does.
+    Returns (book dict, None) or (None, error message). The book dict holds
+    the author / publisher / category names; their ids are filled in later.
+    """
+    if row is None:
+        return None, "Invalid JSON object"
+
+    book = {key: _value(row, key) for key in (
+        "title", "isbn", "author", "publisher", "category", "publication_year",
+        "language", "price", "stock", "reorder_point", "description")}
+
+    if not book["title"] or not book["author"] or not book["publisher"] or not book["category"]:
+        return None, "Missing required fields"
+    for key, limit in MAX_LENGTHS.items():
+        if book[key] is not None and len(str(book[key])) > limit:
+            return None, f"{key.capitalize()} longer than {limit} characters"
+
+    if not is_positive_number(book["price"]):
+        return None, "Invalid price"
+    book["price"] = round_price(book["price"])
+
+    if book["isbn"] is not None:
+        book["isbn"] = str(book["isbn"])
+        if not is_valid_isbn(book["isbn"]):
+            return None, "Invalid ISBN"
+
+    if book["stock"] is None:
+        book["stock"] = 0
+    if not is_non_negative_integer(book["stock"]):
+        return None, "Invalid stock amount"
+    book["stock"] = int(book["stock"])
+
+    if book["reorder_point"] is not None:
+        if not is_non_negative_integer(book["reorder_point"]):
+            return None, "Invalid reorder point"
+        book["reorder_point"] = int(book["reorder_point"])
+
+    if book["publication_year"] is not None:
+        try:
+            book["publication_year"] = int(book["publication_year"])
+        except (ValueError, TypeError):
+            return None, "Invalid publication year"
+
+    book["language"] = book["language"] or "English"
+    book["description"] = book["description"] or ""
+    return book, None
+
+
+# -------------------------------------------------------------
+# NAME LOOKUPS
+# -------------------------------------------------------------
+class NameLookup:
+    """
+    In-memory name -> id map for one entity table, loaded once per import.
+    Names compare case-insensitively, like the tables' default collation;
+    for authors (names not unique) the oldest match wins.
+    """
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.table, self.id_col, self.name_col, self.unique = ENTITIES[kind]
+        self.ids = {}
+        self.created = 0
+
+    def load(self, cursor):
+        cursor.execute(f"SELECT {self.id_col}, {self.name_col} FROM {self.table} ORDER BY {self.id_col}")
+        for entity_id, name in cursor.fetchall():
+            self.ids.setdefault(name.strip().casefold(), entity_id)
+
+    def get(self, name):
+        return self.ids.get(name.casefold())
+
+    def create(self, cursor, name):
+        """
+        Inserts a missing name and returns its id. Publisher and category names
+        are unique, so one created meanwhile by someone else is reused.
+        """
+        sql = f"INSERT INTO {self.table} ({self.name_col}) VALUES (%s)"
+        if self.unique:
+            sql += f" ON DUPLICATE KEY UPDATE {self.id_col} = LAST_INSERT_ID({self.id_col})"
+        cursor.execute(sql, (name,))
+        self.ids[name.casefold()] = cursor.lastrowid
+        self.created += 1
+        return cursor.lastrowid
+
+
+# -------------------------------------------------------------
+# WRITING
+# -------------------------------------------------------------
+def upsert_sql(num_rows, skip_existing=False):
+    """
+    Multi-row INSERT for num_rows books; a duplicate ISBN updates the existing
+    book (every column except the ISBN) or, with skip_existing, keeps it as is.
+    """
+    placeholders = "(" + ", ".join(["%s"] * len(BOOK_COLUMNS)) + ")"
+    if skip_existing:
+        update = "book_id = book_id"
+    else:
+        update = ", ".join(f"{col} = VALUES({col})" for col in BOOK_COLUMNS if col != "isbn")
+    return (
+        f"INSERT INTO books ({', '.join(BOOK_COLUMNS)}) VALUES "
+        + ", ".join([placeholders] * num_rows)
+        + f" ON DUPLICATE KEY UPDATE {update}"
+    )
+
+
+def write_batch(conn, cursor, batch, lookups, errors, skip_existing=False):
+    """
+    Resolves names and writes one batch of (line number, book) pairs.
+    New authors / publishers / categories are committed first, so they stay
+    valid for later batches even if this one fails. If the multi-row INSERT is
+    rejected, the batch is retried row by row to report the offending lines.
+    Returns the number of books written.
+    """
+    for kind, lookup in lookups.items():
+        for _, book in batch:
+            if lookup.get(book[kind]) is None:
+                lookup.create(cursor, book[kind])
+    conn.commit()
+
+    rows = []
+    for _, book in batch:
+        book["author_id"] = lookups["author"].get(book["author"])
+        book["publisher_id"] = lookups["publisher"].get(book["publisher"])
+        book["category_id"] = lookups["category"].get(book["category"])
+        rows.append(tuple(book[col] for col in BOOK_COLUMNS))
+
+    try:
+        cursor.execute(upsert_sql(len(rows), skip_existing), [v for row in rows for v in row])
+        conn.commit()
+        return len(rows)
+    except Exception as e:
+        conn.rollback()
+        logger.warning("[IMPORT] Batch at line %s rejected (%s), retrying row by row", batch[0][0], e)
+
+    written = 0
+    for (line_num, book), row in zip(batch, rows):
+        try:
+            cursor.execute(upsert_sql(1, skip_existing), row)
+            written += 1
+        except Exception as e:
+            errors.append({"line": line_num, "title": book["title"], "message": str(e)})
+    conn.commit()
+    return written
+
+
+# -------------------------------------------------------------
+# IMPORT
+# -------------------------------------------------------------
+def import_books(path, fmt=None, compress=None, skip_existing=False, dry_run=False, batch_size=IMPORT_BATCH):
+    """
+    Loads books from a CSV / JSONL file (see the header of this module).
+
+    - fmt / compress: default from the file name (books.csv, books.jsonl.gz, ...)
+    - skip_existing: leave books whose ISBN already exists untouched
+    - dry_run: validate only; nothing is written
+
+    Returns the usual response dict; data holds the counts and
+    errors: [{"line", "title", "message"}] for every row not loaded.
+    """
+    if fmt is not None and fmt not in FORMATS:
+        return {"status": "error", "message": f"Invalid format '{fmt}' (expected csv or jsonl)"}
+
+    conn = get_connection()
+    if not conn:
+        return {"status": "error", "message": "DB connection failed"}
+
+    start = time.perf_counter()
+    errors, seen_isbns = [], {}
+    rows_read = written = valid = 0
+    lookups = {kind: NameLookup(kind) for kind in ENTITIES}
+    cursor = conn.cursor()
+    try:
+        for lookup in lookups.values():
+            lookup.load(cursor)
+
+        batch = []
+        for line_num, row in read_rows(path, fmt, compress):
+            rows_read += 1
+            book, error = clean_row(row)
+            if book is not None and book["isbn"] is not None:
+                isbn = book["isbn"].replace("-", "").replace(" ", "")
+                if isbn in seen_isbns:
+                    book, error = None, f"Duplicate ISBN (also on line {seen_isbns[isbn]})"
+                else:
+                    seen_isbns[isbn] = line_num
+            if error:
+                errors.append({"line": line_num, "title": (row or {}).get("title"), "message": error})
+                continue
+
+            valid += 1
+            if dry_run:
+                continue
+            batch.append((line_num, book))
+            if len(batch) >= batch_size:
+                written += write_batch(conn, cursor, batch, lookups, errors, skip_existing)
+                batch = []
+        if batch:
+            written += write_batch(conn, cursor, batch, lookups, errors, skip_existing)
+
+    except Exception as e:
+        logger.error("[IMPORT] Import of %s stopped after %s rows: %s", path, rows_read, e)
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        return {"status": "error", "message": f"Import stopped after {rows_read} rows ({written} written): {e}",
+                "data": {"rows": rows_read, "written": written, "errors": errors}}
+
+    finally:
+        cursor.close()
+        conn.close()
+        if written or any(lookup.created for lookup in lookups.values()):
+            catalog_cache.clear()
+            book_index.invalidate()
+
+    errors.sort(key=lambda error: error["line"])
+    created = {kind: lookup.created for kind, lookup in lookups.items()}
+    elapsed = time.perf_counter() - start
+    logger.info(
+        "[IMPORT] %s: %s rows, %s books written, %s errors, "
+        "created %s authors / %s publishers / %s categories in %.1f s",
+        path, rows_read, written, len(errors),
+        created["author"], created["publisher"], created["category"], elapsed
+    )
+
+    if dry_run:
+        message = f"Checked {rows_read} rows: {valid} valid, {len(errors)} errors"
+    else:
+        message = f"Imported {written} of {rows_read} books ({len(errors)} errors)"
+    return {
+        "status": "success",
+        "message": message,
+        "data": {"rows": rows_read, "valid": valid, "written": written, "created": created, "errors": errors},
+    }
+
+
+def write_errors(errors, path):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["line", "title", "message"])
+        for error in errors:
+            writer.writerow([error["line"], error["title"], error["message"]])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import books from a CSV or JSONL file.")
+    parser.add_argument("file", help='input file ("-" for stdin)')
+    parser.add_argument("--format", choices=FORMATS, help="default: from the file extension, else csv")
+    parser.add_argument("--gzip", action="store_true", default=None, help="the input is gzipped (default for *.gz)")
+    parser.add_argument("--skip-existing", action="store_true", help="do not update books whose ISBN exists")
+    parser.add_argument("--dry-run", action="store_true", help="only validate the file")
+    parser.add_argument("--errors", help="write rejected rows to this CSV file")
+    args = parser.parse_args(argv)
+
+    result = import_books(args.file, args.format, args.gzip, args.skip_existing, args.dry_run)
+    print(result["message"])
+    errors = result.get("data", {}).get("errors", [])
+    if args.errors:
+        write_errors(errors, args.errors)
+    else:
+        for error in errors[:20]:
+            print(f"  line {error['line']}: {error['message']}")
+        if len(errors) > 20:
+            print(f"  ... {len(errors) - 20} more (use --errors FILE for the full list)")
+    return 0 if result["status"] == "success" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,371 @@
+# backend/bulk/export.py
+#
+# Streams catalog, order, payment and report data to CSV or JSONL files.
+#
+#   python -m backend.bulk.export DATASET OUT [--format csv|jsonl] [--gzip]
+#                                 [--start YYYY-MM-DD] [--end YYYY-MM-DD] [--status STATUS]
+#
+# DATASET is one of books, orders, payments, daily_sales, book_daily_sales, stock.
+# OUT is a file path ("-" for stdout); the format defaults to the file extension.
+#
+# Rows are read from an unbuffered (server-side) cursor in batches and written
+# as they arrive, so memory use does not grow with the size of the export.
+# Files are written under a temporary name and renamed when complete, so a
+# nightly job never picks up half an export.
+
+import argparse
+import csv
+import gzip
+import json
+import os
+import sys
+from datetime import date, datetime
+from decimal import Decimal
+
+from backend.database.db_connection import get_connection
+from backend.models.records import TIMESTAMP_FORMAT
+from backend.utils.helpers import parse_date
+from backend.utils.logger import logger
+
+# Rows fetched from the server per round trip
+EXPORT_BATCH = int(os.getenv("EXPORT_BATCH", "1000"))
+
+ORDER_STATUSES = ("Pending", "Confirmed", "Shipped", "Delivered", "Cancelled")
+PAYMENT_STATUSES = ("Success", "Pending", "Failed", "Cancelled")
+
+# Exportable datasets:
+# - sql: the query; {where} receives the date/status filters
+# - date / status: columns the --start/--end and --status filters apply to
+# - statuses: values --status accepts
+# - nested: (parent key, child columns) folded into an "items" list in JSONL
+DATASETS = {
+    "books": {
+        "sql": """
+            SELECT b.book_id, b.title, b.isbn, a.full_name AS author, p.name AS publisher_name,
+                   c.name AS genre, b.language, b.publication_year, b.price, b.stock,
+                   b.reorder_point, b.description, b.created_at, b.updated_at
+            FROM books b
+            LEFT JOIN authors a ON b.author_id = a.author_id
+            LEFT JOIN publishers p ON b.publisher_id = p.publisher_id
+            LEFT JOIN categories c ON b.category_id = c.category_id
+            {where}
+            ORDER BY b.book_id
+        """,
+        "date": "b.created_at",
+    },
+    "orders": {
+        "sql": """
+            SELECT o.order_id, o.customer_id, cu.full_name AS customer_name, o.order_date,
+                   o.status, o.total_amount,
+                   oi.item_id, oi.book_id, b.title, oi.quantity, oi.price_each
+            FROM orders o
+            LEFT JOIN customers cu ON o.customer_id = cu.customer_id
+            LEFT JOIN order_items oi ON oi.order_id = o.order_id
+            LEFT JOIN books b ON oi.book_id = b.book_id
+            {where}
+            ORDER BY o.order_id, oi.item_id
+        """,
+        "date": "o.order_date",
+        "status": "o.status",
+        "statuses": ORDER_STATUSES,
+        "nested": ("order_id", ("item_id", "book_id", "title", "quantity", "price_each")),
+    },
+    "payments": {
+        "sql": """
+            SELECT p.payment_id, p.order_id, p.payment_date, p.payment_method,
+                   p.payment_status, p.amount, p.transaction_id
+            FROM payments p
+            {where}
+            ORDER BY p.payment_id
+        """,
+        "date": "p.payment_date",
+        "status": "p.payment_status",
+        "statuses": PAYMENT_STATUSES,
+    },
+    "daily_sales": {
+        "sql": """
+            SELECT s.sale_date, s.status, s.num_orders, s.total_sales
+            FROM daily_sales s
+            {where}
+            ORDER BY s.sale_date, s.status
+        """,
+        "date": "s.sale_date",
+        "status": "s.status",
+        "statuses": ORDER_STATUSES,
+    },
+    "book_daily_sales": {
+        "sql": """
+            SELECT s.sale_date, s.status, s.book_id, b.title, s.quantity, s.revenue
+            FROM book_daily_sales s
+            LEFT JOIN books b ON s.book_id = b.book_id
+            {where}
+            ORDER BY s.sale_date, s.status, s.book_id
+        """,
+        "date": "s.sale_date",
+        "status": "s.status",
+        "statuses": ORDER_STATUSES,
+    },
+    "stock": {
+        "sql": """
+            SELECT b.book_id, b.title, b.stock, b.reorder_point, c.name AS category,
+                   p.name AS publisher, b.price
+            FROM books b
+            LEFT JOIN categories c ON b.category_id = c.category_id
+            LEFT JOIN publishers p ON b.publisher_id = p.publisher_id
+            {where}
+            ORDER BY b.book_id
+        """,
+    },
+}
+
+FORMATS = ("csv", "jsonl")
+
+
+# -------------------------------------------------------------
+# QUERY
+# -------------------------------------------------------------
+def build_query(dataset, start_date=None, end_date=None, status=None):
+    """
+    Returns (sql, params) for a dataset and its filters. Dates are inclusive
+    YYYY-MM-DD days. Raises ValueError for a filter the dataset does not have.
+    """
+    spec = DATASETS.get(dataset)
+    if spec is None:
+        raise ValueError(f"Unknown dataset '{dataset}' (expected one of: {', '.join(DATASETS)})")
+
+    where, params = [], []
+    for value in (start_date, end_date):
+        if value and not parse_date(value, "%Y-%m-%d"):
+            raise ValueError(f"Invalid date '{value}', expected YYYY-MM-DD")
+    if (start_date or end_date) and not spec.get("date"):
+        raise ValueError(f"Dataset '{dataset}' has no date to filter on")
+    if start_date:
+        where.append(f"{spec['date']} >= %s")
+        params.append(start_date)
+    if end_date:
+        where.append(f"{spec['date']} < %s + INTERVAL 1 DAY")
+        params.append(end_date)
+
+    if status:
+        if not spec.get("status"):
+            raise ValueError(f"Dataset '{dataset}' has no status to filter on")
+        if status not in spec["statuses"]:
+            raise ValueError(f"Invalid status '{status}' (expected one of: {', '.join(spec['statuses'])})")
+        where.append(f"{spec['status']} = %s")
+        params.append(status)
+
+    clause = ("WHERE " + " AND ".join(where)) if where else ""
+    return spec["sql"].format(where=clause), params
+
+
+def stream_rows(cursor, batch_size=EXPORT_BATCH):
+    """
+    Yields (columns, row tuple) from an executed cursor, batch_size rows per fetch.
+    """
+    columns = [d[0] for d in cursor.description]
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        for row in rows:
+            yield columns, row
+
+
+# -------------------------------------------------------------
+# WRITERS
+# -------------------------------------------------------------
+def to_text(value):
+    """
+    Export representation of a column value: timestamps and dates as text,
+    DECIMAL amounts as their exact digits (not floats).
+    """
+    if isinstance(value, datetime):
+        return value.strftime(TIMESTAMP_FORMAT)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+class CsvWriter:
+    def __init__(self, out):
+        self.writer = csv.writer(out)
+        self.header = None
+
+    def write(self, columns, row):
+        if self.header is None:
+            self.header = columns
+            self.writer.writerow(columns)
+        self.writer.writerow(["" if v is None else to_text(v) for v in row])
+
+    def close(self):
+        pass
+
+
+class JsonlWriter:
+    def __init__(self, out):
+        self.out = out
+
+    def write(self, columns, row):
+        self.write_record({name: to_text(v) for name, v in zip(columns, row)})
+
+    def write_record(self, record):
+        self.out.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        self.out.write("\n")
+
+    def close(self):
+        pass
+
+
+class NestedJsonlWriter(JsonlWriter):
+    """
+    JSONL writer for joined parent/child rows ordered by parent: consecutive
+    rows of the same parent become one line with the child columns in a list.
+    Only the current parent is held in memory.
+    """
+
+    def __init__(self, out, key, child_columns, list_name="items"):
+        super().__init__(out)
+        self.key = key
+        self.child_columns = child_columns
+        self.list_name = list_name
+        self.current = None
+
+    def write(self, columns, row):
+        values = dict(zip(columns, row))
+        parent = {c: to_text(values[c]) for c in columns if c not in self.child_columns}
+        if self.current is None or self.current[self.key] != parent[self.key]:
+            self.close()
+            self.current = parent
+            self.current[self.list_name] = []
+        # LEFT JOIN: a parent without children comes back once with NULL child columns
+        if values[self.child_columns[0]] is not None:
+            self.current[self.list_name].append({c: to_text(values[c]) for c in self.child_columns})
+
+    def close(self):
+        if self.current is not None:
+            self.write_record(self.current)
+            self.current = None
+
+
+def make_writer(dataset, fmt, out):
+    if fmt == "csv":
+        return CsvWriter(out)
+    nested = DATASETS[dataset].get("nested")
+    if nested:
+        return NestedJsonlWriter(out, *nested)
+    return JsonlWriter(out)
+
+
+def file_format(path):
+    """
+    Returns (format, gzip) implied by a file name: data.csv, data.jsonl.gz, ...
+    Defaults to CSV; "-" (stdin/stdout) is uncompressed CSV.
+    """
+    name = "" if path == "-" else path.lower()
+    compressed = name.endswith(".gz")
+    fmt = "jsonl" if name.removesuffix(".gz").endswith((".jsonl", ".ndjson")) else "csv"
+    return fmt, compressed
+
+
+def open_output(path, compress=False):
+    """
+    Opens the text stream an export writes to: path + ".part" (renamed by the
+    caller when done), gzip-compressed if requested, or stdout for "-".
+    """
+    if path == "-":
+        if compress:
+            return gzip.open(sys.stdout.buffer, "wt", encoding="utf-8", newline="")
+        return sys.stdout
+    if compress:
+        return gzip.open(path + ".part", "wt", encoding="utf-8", newline="")
+    return open(path + ".part", "w", encoding="utf-8", newline="")
+
+
+# -------------------------------------------------------------
+# EXPORT
+# -------------------------------------------------------------
+def export(dataset, path, fmt=None, start_date=None, end_date=None, status=None, compress=None,
+           batch_size=EXPORT_BATCH):
+    """
+    Writes a dataset to path as CSV or JSONL.
+
+    - fmt: "csv" or "jsonl"; by default taken from the file name
+      (data.csv, data.jsonl.gz, ...)
+    - compress: gzip the output; by default when the file name ends in .gz
+    - start_date / end_date: inclusive YYYY-MM-DD range on the dataset's date
+    - status: order or payment status to keep
+
+    Returns the usual response dict; data holds the rows written and the path.
+    """
+    default_fmt, default_compress = file_format(path)
+    fmt = fmt or default_fmt
+    if compress is None:
+        compress = default_compress
+    if fmt not in FORMATS:
+        return {"status": "error", "message": f"Invalid format '{fmt}' (expected csv or jsonl)"}
+
+    try:
+        sql, params = build_query(dataset, start_date, end_date, status)
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+
+    conn = get_connection()
+    if not conn:
+        return {"status": "error", "message": "DB connection failed"}
+
+    out = None
+    cursor = conn.cursor(buffered=False)
+    try:
+        cursor.execute(sql, params)
+        out = open_output(path, compress)
+        writer = make_writer(dataset, fmt, out)
+        count = 0
+        for columns, row in stream_rows(cursor, batch_size):
+            writer.write(columns, row)
+            count += 1
+        writer.close()
+
+        if out is not sys.stdout:
+            out.close()
+        if path != "-":
+            os.replace(path + ".part", path)
+        logger.info("[EXPORT] %s: %s rows -> %s", dataset, count, path)
+        return {"status": "success", "message": f"Exported {count} {dataset} rows",
+                "data": {"rows": count, "path": path}}
+
+    except Exception as e:
+        logger.error("[EXPORT] %s export failed: %s", dataset, e)
+        if out is not None and out is not sys.stdout:
+            out.close()
+            if path != "-" and os.path.exists(path + ".part"):
+                os.remove(path + ".part")
+        return {"status": "error", "message": str(e)}
+
+    finally:
+        try:
+            cursor.close()
+        except Exception:
+            pass  # unread rows after a failure; the pool discards the connection
+        conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export bookshop data to CSV or JSONL.")
+    parser.add_argument("dataset", choices=sorted(DATASETS))
+    parser.add_argument("out", help='output file ("-" for stdout)')
+    parser.add_argument("--format", choices=FORMATS, help="default: from the file extension, else csv")
+    parser.add_argument("--gzip", action="store_true", default=None, help="gzip the output (default for *.gz)")
+    parser.add_argument("--start", help="first day to include (YYYY-MM-DD)")
+    parser.add_argument("--end", help="last day to include (YYYY-MM-DD)")
+    parser.add_argument("--status", help="only rows with this order / payment status")
+    args = parser.parse_args(argv)
+
+    result = export(args.dataset, args.out, args.format, args.start, args.end, args.status, args.gzip)
+    print(result["message"], file=sys.stderr)
+    return 0 if result["status"] == "success" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+# backend/cache/catalog_cache.py
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# Foreign keys rows are grouped by, so a rename can evict exactly the affected books
+LINKS = ("author_id", "publisher_id", "category_id")
+
+
+class CatalogCache:
+    """
+    Read-through cache of denormalized book rows (BookRecords). Records are
+    read-only, so they are stored and handed out without copying.
+
+    - rows are keyed by book_id and evicted least-recently-used beyond max_rows
+    - secondary maps by author / publisher / category locate the rows an
+      entity rename or delete makes stale
+    - listings (the ordered book_ids a get_all() call returned) are cached per
+      set of paging arguments; a listing whose rows were evicted is completed
+      by primary-key lookups instead of re-running the listing query
+    - entries older than ttl seconds are ignored (0 = no expiry)
+    - a listing with more books than max_rows is not cached (its rows could
+      not all stay cached, so replaying it would re-fetch them by id)
+
+    Invalidation only sees writes made through this process's API classes;
+    changes by another till, catalog_import in another process or direct
+    SQL show up once the affected entries reach ttl.
+
+    Every invalidation bumps a generation counter; a fill computed from a read
+    that started before the invalidation is dropped, so a slow reader cannot
+    put back data a writer just made stale. Thread-safe.
+    """
+
+    def __init__(self, max_rows=50000, max_listings=32, ttl=0):
+        self.max_rows = max_rows
+        self.max_listings = max_listings
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._rows = OrderedDict()       # book_id -> (row, stored_at)
+        self._listings = OrderedDict()   # key -> (book_ids, next_cursor, has_more, stored_at)
+        self._by_link = {link: {} for link in LINKS}  # link -> {entity_id: set(book_id)}
+        self._generation = 0
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "listing_hits": 0,
+            "listing_misses": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    @property
+    def generation(self):
+        return self._generation
+
+    # -------------------------------------------------------------
+    # ROWS
+    # -------------------------------------------------------------
+    def get_many(self, book_ids):
+        """
+        Returns ({book_id: row}, [missing book_ids]).
+        """
+        found, missing = {}, []
+        with self._lock:
+            for book_id in book_ids:
+                row = self._get_locked(book_id)
+                if row is None:
+                    missing.append(book_id)
+                else:
+                    found[book_id] = row
+            self._stats["hits"] += len(found)
+            self._stats["misses"] += len(missing)
+        return found, missing
+
+    def get(self, book_id):
+        found, _ = self.get_many([book_id])
+        return found.get(book_id)
+
+    def put_many(self, rows, generation=None):
+        """
+        Stores rows unless the cache was invalidated since `generation` was read.
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            now = time.monotonic()
+            for row in rows:
+                self._put_locked(row, now)
+
+    def put(self, row, generation=None):
+        self.put_many([row], generation)
+
+    # -------------------------------------------------------------
+    # LISTINGS
+    # -------------------------------------------------------------
+    def get_listing(self, key):
+        """
+        Returns (book_ids, next_cursor, has_more) for a cached listing, or None.
+        """
+        with self._lock:
+            entry = self._listings.get(key)
+            if entry is None or self._expired(entry[3]):
+                self._listings.pop(key, None)
+                self._stats["listing_misses"] += 1
+                return None
+            self._listings.move_to_end(key)
+            self._stats["listing_hits"] += 1
+            return entry[:3]
+
+    def put_listing(self, key, book_ids, next_cursor, has_more, generation=None):
+        if len(book_ids) > self.max_rows:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._listings[key] = (tuple(book_ids), next_cursor, has_more, time.monotonic())
+            self._listings.move_to_end(key)
+            while len(self._listings) > self.max_listings:
+                self._listings.popitem(last=False)
+
+    # -------------------------------------------------------------
+    # INVALIDATION
+    # -------------------------------------------------------------
+    def invalidate_books(self, book_ids, listings=False):
+        """
+        Drops the given books (e.g. after a stock change). Pass listings=True when
+        membership or ordering of listings may have changed (insert / delete /
+        change to a sort column).
+        """
+        with self._lock:
+            self._generation += 1
+            self._stats["invalidations"] += 1
+            for book_id in book_ids:
+                self._drop_locked(book_id)
+            if listings:
+                self._listings.clear()
+
+    def invalidate_link(self, link, entity_id, listings=False):
+        """
+        Drops every book linked to an author / publisher / category, e.g. after
+        it was renamed (link is "author_id", "publisher_id" or "category_id").
+        """
+        with self._lock:
+            book_ids = list(self._by_link[link].get(entity_id, ()))
+        self.invalidate_books(book_ids, listings=listings)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._stats["invalidations"] += 1
+            self._rows.clear()
+            self._listings.clear()
+            for link in LINKS:
+                self._by_link[link].clear()
+
+    def stats(self):
+        """
+        Snapshot of cache metrics for health checks.
+        """
+        with self._lock:
+            data = dict(self._stats)
+            data["rows"] = len(self._rows)
+            data["listings"] = len(self._listings)
+            data["max_rows"] = self.max_rows
+        lookups = data["hits"] + data["misses"]
+        data["hit_ratio"] = data["hits"] / lookups if lookups else 0.0
+        return data
+
+    # -------------------------------------------------------------
+    # INTERNAL HELPERS (caller holds the lock)
+    # -------------------------------------------------------------
+    def _expired(self, stored_at):
+        return bool(self.ttl) and time.monotonic() - stored_at >= self.ttl
+
+    def _get_locked(self, book_id):
+        entry = self._rows.get(book_id)
+        if entry is None:
+            return None
+        if self._expired(entry[1]):
+            self._drop_locked(book_id)
+            return None
+        self._rows.move_to_end(book_id)
+        return entry[0]
+
+    def _put_locked(self, row, now):
+        book_id = row["book_id"]
+        self._drop_locked(book_id)
+        self._rows[book_id] = (row, now)
+        for link in LINKS:
+            if row.get(link) is not None:
+                self._by_link[link].setdefault(row[link], set()).add(book_id)
+        while len(self._rows) > self.max_rows:
+            oldest = next(iter(self._rows))
+            self._drop_locked(oldest)
+            self._stats["evictions"] += 1
+
+    def _drop_locked(self, book_id):
+        entry = self._rows.pop(book_id, None)
+        if entry is None:
+            return
+        for link in LINKS:
+            entity_id = entry[0].get(link)
+            books = self._by_link[link].get(entity_id)
+            if books is not None:
+                books.discard(book_id)
+                if not books:
+                    del self._by_link[link][entity_id]
+
+
+# -------------------------------------------------------------
+# PROCESS-WIDE CACHE
+# -------------------------------------------------------------
+# Entries expire after CATALOG_CACHE_TTL seconds (default 60) so stock and
+# prices changed by other processes are picked up; 0 keeps them until evicted.
+CACHE_TTL = float(os.getenv("CATALOG_CACHE_TTL", "60"))
+
+catalog_cache = CatalogCache(
+    max_rows=int(os.getenv("CATALOG_CACHE_SIZE", "50000")),
+    ttl=CACHE_TTL
+)
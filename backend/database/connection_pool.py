@@ -0,0 +1,382 @@
+# backend/database/connection_pool.py
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from backend.database import slow_query
+from backend.utils import metrics
+from backend.utils.logger import logger
+
+
+class PoolExhaustedError(Exception):
+    """
+    Raised when no connection could be checked out before the timeout expired.
+    """
+
+
+class PooledConnection:
+    """
+    Proxy around a raw connection borrowed from a ConnectionPool.
+    Behaves like the underlying connection, except that close() hands the
+    connection back to the pool instead of tearing down the socket, so the
+    existing `finally: conn.close()` blocks in the API classes keep working.
+    """
+
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+
+    def __getattr__(self, name):
+        raw = self.__dict__.get("_raw")
+        if raw is None:
+            raise AttributeError(f"Connection already returned to pool (accessing '{name}')")
+        return getattr(raw, name)
+
+    def cursor(self, *args, **kwargs):
+        """
+        Cursor of the underlying connection, wrapped so the statements and
+        fetches it runs are counted by backend.utils.metrics.
+        """
+        raw = self.__dict__.get("_raw")
+        if raw is None:
+            raise AttributeError("Connection already returned to pool (accessing 'cursor')")
+        return TrackedCursor(raw.cursor(*args, **kwargs))
+
+    def close(self):
+        """
+        Return the connection to the pool. Safe to call more than once.
+        """
+        raw, self._raw = self._raw, None
+        if raw is not None:
+            self._pool.release(raw)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class TrackedCursor:
+    """
+    Cursor proxy that reports execute/fetch time, statements, rows and bytes
+    to the instrumented API call running on this thread (if any), and
+    statements slower than slow_query.threshold to the slow-query log.
+
+    A statement's time runs from execute() through the fetches of its rows
+    (drivers read most rows while fetching), until the next execute() or
+    close().
+    """
+
+    __slots__ = ("_cursor", "_statement")
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self._statement = None   # [operation, params, seconds so far, explain]
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        self._finish()
+        start = time.perf_counter()
+        try:
+            if params is None:
+                return self._cursor.execute(operation, *args, **kwargs)
+            return self._cursor.execute(operation, params, *args, **kwargs)
+        finally:
+            self._executed(operation, params, time.perf_counter() - start, True)
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        self._finish()
+        start = time.perf_counter()
+        try:
+            return self._cursor.executemany(operation, seq_params, *args, **kwargs)
+        finally:
+            self._executed(operation, None, time.perf_counter() - start, False)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._fetched(time.perf_counter() - start, () if row is None else (row,))
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        start = time.perf_counter()
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._fetched(time.perf_counter() - start, rows)
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._fetched(time.perf_counter() - start, rows)
+        return rows
+
+    def close(self):
+        self._finish()
+        return self._cursor.close()
+
+    def _executed(self, operation, params, elapsed, explain):
+        if metrics.tracking():
+            metrics.record_statement(elapsed)
+        if slow_query.threshold is not None:
+            self._statement = [operation, params, elapsed, explain]
+
+    def _fetched(self, elapsed, rows):
+        if metrics.tracking():
+            metrics.record_fetch(elapsed, rows)
+        if self._statement is not None:
+            self._statement[2] += elapsed
+
+    def _finish(self):
+        statement, self._statement = self._statement, None
+        if statement is not None and statement[2] >= slow_query.threshold:
+            slow_query.slow_query_log.record(*statement)
+
+
+class ConnectionPool:
+    """
+    Bounded, thread-safe pool of DB connections.
+
+    - min_size connections are kept open even when idle
+    - at most max_size connections exist at any time; callers block when all are in use
+    - connections idle for longer than idle_timeout seconds are closed (above min_size)
+    - a connection idle for longer than validation_interval seconds is pinged on checkout
+    """
+
+    def __init__(self, connect, min_size=1, max_size=10, idle_timeout=300,
+                 checkout_timeout=10, validation_interval=30):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError(f"Invalid pool size (min={min_size}, max={max_size})")
+
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        self.validation_interval = validation_interval
+
+        self._idle = deque()  # (raw_connection, last_used_monotonic)
+        self._size = 0        # idle + checked out
+        self._closed = False
+        self._cond = threading.Condition(threading.Lock())
+
+        self._stats = {
+            "checkouts": 0,
+            "waits": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+            "timeouts": 0,
+            "created": 0,
+            "destroyed": 0,
+            "failed_validations": 0,
+        }
+
+    # -------------------------------------------------------------
+    # CHECKOUT / RELEASE
+    # -------------------------------------------------------------
+    def acquire(self, timeout=None):
+        """
+        Borrow a connection. Returns a PooledConnection whose close() gives it back.
+        Raises PoolExhaustedError on timeout, or the driver error if connecting fails.
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        waited_since = None
+
+        while True:
+            raw, last_used, create = None, None, False
+            with self._cond:
+                if self._closed:
+                    raise PoolExhaustedError("Connection pool is closed")
+
+                self._prune_idle_locked()
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise PoolExhaustedError(
+                            f"No connection available within {timeout}s (max_size={self.max_size})"
+                        )
+                    if waited_since is None:
+                        waited_since = time.monotonic()
+                        self._stats["waits"] += 1
+                    self._cond.wait(remaining)
+
+                if self._idle:
+                    # LIFO: the most recently used connection is the least likely to be stale
+                    raw, last_used = self._idle.pop()
+                else:
+                    self._size += 1
+                    create = True
+
+            if create:
+                try:
+                    raw = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._stats["created"] += 1
+            elif not self._is_alive(raw, last_used):
+                self._destroy(raw)
+                with self._cond:
+                    self._stats["failed_validations"] += 1
+                continue
+
+            with self._cond:
+                self._stats["checkouts"] += 1
+                if waited_since is not None:
+                    waited = time.monotonic() - waited_since
+                    self._stats["wait_time_total"] += waited
+                    self._stats["wait_time_max"] = max(self._stats["wait_time_max"], waited)
+            return PooledConnection(self, raw)
+
+    def release(self, raw):
+        """
+        Give a raw connection back to the pool. Any open transaction is rolled back
+        so the next borrower never inherits locks or uncommitted writes.
+        """
+        try:
+            if getattr(raw, "in_transaction", False):
+                raw.rollback()
+        except Exception as e:
+            logger.warning("[DB_POOL] Discarding connection that failed to reset: %s", e)
+            self._destroy(raw)
+            return
+
+        with self._cond:
+            if self._closed:
+                discard = True
+            else:
+                discard = False
+                self._idle.append((raw, time.monotonic()))
+                self._cond.notify()
+        if discard:
+            self._destroy(raw)
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """
+        Context manager API:
+            with pool.connection() as conn:
+                ...
+        """
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    # -------------------------------------------------------------
+    # MAINTENANCE
+    # -------------------------------------------------------------
+    def prefill(self):
+        """
+        Open connections until min_size exist. Failures are logged, not raised,
+        so the app can still start while the database is unreachable.
+        """
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                raw = self._connect()
+            except Exception as e:
+                with self._cond:
+                    self._size -= 1
+                logger.error("[DB_POOL] Could not pre-open connection: %s", e)
+                return
+            with self._cond:
+                self._stats["created"] += 1
+                self._idle.append((raw, time.monotonic()))
+                self._cond.notify()
+
+    def close_all(self):
+        """
+        Close idle connections and stop handing out new ones.
+        Connections still checked out are closed when they are returned.
+        """
+        with self._cond:
+            self._closed = True
+            idle = [raw for raw, _ in self._idle]
+            self._idle.clear()
+            self._cond.notify_all()
+        for raw in idle:
+            self._destroy(raw)
+
+    def stats(self):
+        """
+        Snapshot of pool metrics for sizing and health checks.
+        """
+        with self._cond:
+            data = dict(self._stats)
+            data["size"] = self._size
+            data["idle"] = len(self._idle)
+            data["in_use"] = self._size - len(self._idle)
+            data["min_size"] = self.min_size
+            data["max_size"] = self.max_size
+        data["wait_time_avg"] = data["wait_time_total"] / data["waits"] if data["waits"] else 0.0
+        return data
+
+    # -------------------------------------------------------------
+    # INTERNAL HELPERS
+    # -------------------------------------------------------------
+    def _prune_idle_locked(self):
+        """
+        Close connections idle longer than idle_timeout, keeping min_size open.
+        Oldest connections sit at the left end of the deque. Caller holds the lock.
+        """
+        if not self.idle_timeout:
+            return
+        now = time.monotonic()
+        expired = []
+        while self._idle and self._size - len(expired) > self.min_size:
+            raw, last_used = self._idle[0]
+            if now - last_used < self.idle_timeout:
+                break
+            self._idle.popleft()
+            expired.append(raw)
+        for raw in expired:
+            # _destroy takes the lock itself, so close the socket inline here
+            self._size -= 1
+            self._stats["destroyed"] += 1
+            try:
+                raw.close()
+            except Exception:
+                pass
+
+    def _is_alive(self, raw, last_used):
+        if time.monotonic() - last_used < self.validation_interval:
+            return True
+        try:
+            return raw.is_connected()
+        except Exception:
+            return False
+
+    def _destroy(self, raw):
+        try:
+            raw.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._size -= 1
+            self._stats["destroyed"] += 1
+            self._cond.notify()
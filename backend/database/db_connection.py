@@ -3,34 +3,115 @@
 import mysql.connector
 from mysql.connector import Error
 import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from backend.database.connection_pool import ConnectionPool, PoolExhaustedError
+from backend.database import sqlite_engine
 from backend.utils.logger import logger
 from dotenv import load_dotenv
 
 # Load environment variables from .env
 load_dotenv()
 
+# Storage engine: "mysql" (server, credentials below) or "sqlite" (embedded file DB_PATH)
+ENGINE = os.getenv("DB_ENGINE", "mysql").lower()
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _connect():
+    """
+    Opens a brand-new connection using the settings from .env.
+    Only the pool should call this; everything else borrows via get_connection().
+    """
+    if ENGINE == "sqlite":
+        return sqlite_engine.connect(
+            os.getenv("DB_PATH", "bookshop.db"),
+            lock_timeout=float(os.getenv("DB_LOCK_TIMEOUT", "50"))
+        )
+    return mysql.connector.connect(
+        host=os.getenv("DB_HOST", "localhost"),
+        port=int(os.getenv("DB_PORT", "3306")),
+        user=os.getenv("DB_USER", "root"),
+        password=os.getenv("DB_PASS", ""),
+        database=os.getenv("DB_NAME", "bookshop_db")
+    )
+
+
+def get_pool():
+    """
+    Returns the process-wide connection pool, creating it on first use.
+    Sizing is configurable through .env:
+        DB_POOL_MIN, DB_POOL_MAX, DB_POOL_IDLE_TIMEOUT,
+        DB_POOL_CHECKOUT_TIMEOUT, DB_POOL_VALIDATION_INTERVAL
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                pool = ConnectionPool(
+                    _connect,
+                    min_size=int(os.getenv("DB_POOL_MIN", "1")),
+                    max_size=int(os.getenv("DB_POOL_MAX", "10")),
+                    idle_timeout=float(os.getenv("DB_POOL_IDLE_TIMEOUT", "300")),
+                    checkout_timeout=float(os.getenv("DB_POOL_CHECKOUT_TIMEOUT", "10")),
+                    validation_interval=float(os.getenv("DB_POOL_VALIDATION_INTERVAL", "30"))
+                )
+                pool.prefill()
+                _pool = pool
+    return _pool
+
+
 def get_connection():
     """
-    Returns a MySQL connection object using credentials from .env.
-    Returns None if connection fails.
+    Borrows a database connection from the pool.
+    Calling close() on the returned object returns it to the pool.
+    Returns None if no connection could be obtained.
     """
     try:
-        conn = mysql.connector.connect(
-            host=os.getenv("DB_HOST", "localhost"),
-            user=os.getenv("DB_USER", "root"),
-            password=os.getenv("DB_PASS", ""),
-            database=os.getenv("DB_NAME", "bookshop_db")
-        )
-        return conn
-    except Error as e:
-        logger.error(f"[DB_CONNECTION_ERROR] Error connecting to MySQL: {e}")
+        return get_pool().acquire()
+    except (Error, sqlite3.Error, PoolExhaustedError) as e:
+        logger.error("[DB_CONNECTION_ERROR] Error connecting to %s: %s", ENGINE, e)
         return None
 
+
+@contextmanager
+def pooled_connection():
+    """
+    Context manager variant of get_connection():
+        with pooled_connection() as conn:
+            ...
+    Raises instead of returning None when no connection is available.
+    """
+    with get_pool().connection() as conn:
+        yield conn
+
+
+def get_pool_stats():
+    """
+    Returns pool metrics (checkouts, waits, wait time, created/destroyed, ...).
+    """
+    return get_pool().stats()
+
+
+def close_pool():
+    """
+    Closes all pooled connections, e.g. on application shutdown.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close_all()
+            _pool = None
+
 # Optional helper for testing connection
 if __name__ == "__main__":
     connection = get_connection()
     if connection:
         logger.info("Database connection successful!")
         connection.close()
+        logger.info("Pool stats: %s", get_pool_stats())
     else:
         logger.error("Database connection failed!")
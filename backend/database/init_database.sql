@@ -2,6 +2,9 @@
 --  BOOKSHOP MANAGEMENT SYSTEM – DATABASE SCHEMA
 --  Designed by: Abheek Kumar Sarangi Sarangi
 --  Compatible with MySQL 8.0+
+--
+--  After loading this file run `python -m backend.database.migrate up`
+--  to add the secondary indexes in backend/database/migrations.
 -- ================================================================
 
 -- ----------------------------
@@ -64,9 +67,12 @@ CREATE TABLE IF NOT EXISTS books (
     publication_year SMALLINT,
     price DECIMAL(10,2) NOT NULL,
     stock INT DEFAULT 0,
+    reorder_point INT DEFAULT NULL,  -- per-book low-stock level; NULL = use the report threshold
     description TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX idx_books_stock (stock),
+    INDEX idx_books_reorder_point (reorder_point),
     FOREIGN KEY (author_id) REFERENCES authors(author_id) ON DELETE CASCADE,
     FOREIGN KEY (publisher_id) REFERENCES publishers(publisher_id) ON DELETE SET NULL,
     FOREIGN KEY (category_id) REFERENCES categories(category_id) ON DELETE SET NULL
@@ -97,6 +103,7 @@ CREATE TABLE IF NOT EXISTS orders (
     order_date DATETIME DEFAULT CURRENT_TIMESTAMP,
     total_amount DECIMAL(12,2) DEFAULT 0.00,
     status ENUM('Pending', 'Confirmed', 'Shipped', 'Delivered', 'Cancelled') DEFAULT 'Pending',
+    INDEX idx_orders_status_date (status, order_date),
     FOREIGN KEY (customer_id) REFERENCES customers(customer_id) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
@@ -141,6 +148,33 @@ CREATE TABLE IF NOT EXISTS staff (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
+-- ----------------------------
+-- TABLE: DAILY SALES (ROLLUP OF ORDERS)
+-- Maintained by the orders / customers triggers below;
+-- rebuild with: python -m backend.reports.sales_rollup rebuild
+-- ----------------------------
+CREATE TABLE IF NOT EXISTS daily_sales (
+    sale_date DATE NOT NULL,
+    status ENUM('Pending', 'Confirmed', 'Shipped', 'Delivered', 'Cancelled') NOT NULL,
+    num_orders INT NOT NULL DEFAULT 0,
+    total_sales DECIMAL(14,2) NOT NULL DEFAULT 0.00,
+    PRIMARY KEY (sale_date, status)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- ----------------------------
+-- TABLE: BOOK DAILY SALES (ROLLUP OF ORDER ITEMS)
+-- Maintained by the order_items / orders / customers triggers below
+-- ----------------------------
+CREATE TABLE IF NOT EXISTS book_daily_sales (
+    sale_date DATE NOT NULL,
+    status ENUM('Pending', 'Confirmed', 'Shipped', 'Delivered', 'Cancelled') NOT NULL,
+    book_id INT NOT NULL,
+    quantity INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(14,2) NOT NULL DEFAULT 0.00,
+    PRIMARY KEY (sale_date, status, book_id),
+    FOREIGN KEY (book_id) REFERENCES books(book_id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
 -- ----------------------------
 -- TRIGGERS
 -- ----------------------------
@@ -156,6 +190,197 @@ BEGIN
 END;
 //
 
+CREATE TRIGGER daily_sales_after_order_insert
+AFTER INSERT ON orders
+FOR EACH ROW
+BEGIN
+    INSERT INTO daily_sales (sale_date, status, num_orders, total_sales)
+    VALUES (DATE(NEW.order_date), NEW.status, 1, NEW.total_amount)
+    ON DUPLICATE KEY UPDATE
+        num_orders = num_orders + 1,
+        total_sales = total_sales + NEW.total_amount;
+END;
+//
+
+CREATE TRIGGER daily_sales_after_order_update
+AFTER UPDATE ON orders
+FOR EACH ROW
+BEGIN
+    IF NOT (DATE(OLD.order_date) <=> DATE(NEW.order_date))
+       OR NOT (OLD.status <=> NEW.status)
+       OR NOT (OLD.total_amount <=> NEW.total_amount) THEN
+        UPDATE daily_sales
+        SET num_orders = num_orders - 1,
+            total_sales = total_sales - OLD.total_amount
+        WHERE sale_date = DATE(OLD.order_date) AND status = OLD.status;
+
+        INSERT INTO daily_sales (sale_date, status, num_orders, total_sales)
+        VALUES (DATE(NEW.order_date), NEW.status, 1, NEW.total_amount)
+        ON DUPLICATE KEY UPDATE
+            num_orders = num_orders + 1,
+            total_sales = total_sales + NEW.total_amount;
+    END IF;
+END;
+//
+
+CREATE TRIGGER daily_sales_after_order_delete
+AFTER DELETE ON orders
+FOR EACH ROW
+BEGIN
+    UPDATE daily_sales
+    SET num_orders = num_orders - 1,
+        total_sales = total_sales - OLD.total_amount
+    WHERE sale_date = DATE(OLD.order_date) AND status = OLD.status;
+END;
+//
+
+-- FK cascades do not fire triggers, so orders removed along with their
+-- customer are subtracted here
+CREATE TRIGGER daily_sales_before_customer_delete
+BEFORE DELETE ON customers
+FOR EACH ROW
+BEGIN
+    UPDATE daily_sales d
+    JOIN (
+        SELECT DATE(order_date) AS sale_date, status,
+               COUNT(*) AS num_orders, SUM(total_amount) AS total_sales
+        FROM orders
+        WHERE customer_id = OLD.customer_id
+        GROUP BY DATE(order_date), status
+    ) gone ON gone.sale_date = d.sale_date AND gone.status = d.status
+    SET d.num_orders = d.num_orders - gone.num_orders,
+        d.total_sales = d.total_sales - gone.total_sales;
+END;
+//
+
+CREATE TRIGGER book_daily_sales_after_item_insert
+AFTER INSERT ON order_items
+FOR EACH ROW
+BEGIN
+    DECLARE sold_on DATE;
+    DECLARE order_status VARCHAR(20);
+    SELECT DATE(order_date), status INTO sold_on, order_status
+    FROM orders WHERE order_id = NEW.order_id;
+
+    INSERT INTO book_daily_sales (sale_date, status, book_id, quantity, revenue)
+    VALUES (sold_on, order_status, NEW.book_id, NEW.quantity, NEW.quantity * NEW.price_each)
+    ON DUPLICATE KEY UPDATE
+        quantity = quantity + NEW.quantity,
+        revenue = revenue + NEW.quantity * NEW.price_each;
+END;
+//
+
+CREATE TRIGGER book_daily_sales_after_item_update
+AFTER UPDATE ON order_items
+FOR EACH ROW
+BEGIN
+    DECLARE sold_on DATE;
+    DECLARE order_status VARCHAR(20);
+    IF NOT (OLD.quantity <=> NEW.quantity)
+       OR NOT (OLD.price_each <=> NEW.price_each)
+       OR NOT (OLD.book_id <=> NEW.book_id) THEN
+        SELECT DATE(order_date), status INTO sold_on, order_status
+        FROM orders WHERE order_id = NEW.order_id;
+
+        UPDATE book_daily_sales
+        SET quantity = quantity - OLD.quantity,
+            revenue = revenue - OLD.quantity * OLD.price_each
+        WHERE sale_date = sold_on AND status = order_status AND book_id = OLD.book_id;
+
+        INSERT INTO book_daily_sales (sale_date, status, book_id, quantity, revenue)
+        VALUES (sold_on, order_status, NEW.book_id, NEW.quantity, NEW.quantity * NEW.price_each)
+        ON DUPLICATE KEY UPDATE
+            quantity = quantity + NEW.quantity,
+            revenue = revenue + NEW.quantity * NEW.price_each;
+    END IF;
+END;
+//
+
+CREATE TRIGGER book_daily_sales_after_item_delete
+AFTER DELETE ON order_items
+FOR EACH ROW
+BEGIN
+    DECLARE sold_on DATE;
+    DECLARE order_status VARCHAR(20);
+    SELECT DATE(order_date), status INTO sold_on, order_status
+    FROM orders WHERE order_id = OLD.order_id;
+
+    UPDATE book_daily_sales
+    SET quantity = quantity - OLD.quantity,
+        revenue = revenue - OLD.quantity * OLD.price_each
+    WHERE sale_date = sold_on AND status = order_status AND book_id = OLD.book_id;
+END;
+//
+
+-- Moves an order's items to the new (day, status) bucket
+CREATE TRIGGER book_daily_sales_after_order_update
+AFTER UPDATE ON orders
+FOR EACH ROW
+BEGIN
+    IF NOT (DATE(OLD.order_date) <=> DATE(NEW.order_date))
+       OR NOT (OLD.status <=> NEW.status) THEN
+        UPDATE book_daily_sales bs
+        JOIN (
+            SELECT book_id, SUM(quantity) AS quantity, SUM(quantity * price_each) AS revenue
+            FROM order_items
+            WHERE order_id = NEW.order_id
+            GROUP BY book_id
+        ) moved ON moved.book_id = bs.book_id
+        SET bs.quantity = bs.quantity - moved.quantity,
+            bs.revenue = bs.revenue - moved.revenue
+        WHERE bs.sale_date = DATE(OLD.order_date) AND bs.status = OLD.status;
+
+        INSERT INTO book_daily_sales (sale_date, status, book_id, quantity, revenue)
+        SELECT * FROM (
+            SELECT DATE(NEW.order_date) AS sold_on, NEW.status AS order_status, book_id,
+                   SUM(quantity) AS sold, SUM(quantity * price_each) AS earned
+            FROM order_items
+            WHERE order_id = NEW.order_id
+            GROUP BY book_id
+        ) moved
+        ON DUPLICATE KEY UPDATE
+            quantity = book_daily_sales.quantity + moved.sold,
+            revenue = book_daily_sales.revenue + moved.earned;
+    END IF;
+END;
+//
+
+-- order_items removed by the orders FK cascade fire no triggers
+CREATE TRIGGER book_daily_sales_before_order_delete
+BEFORE DELETE ON orders
+FOR EACH ROW
+BEGIN
+    UPDATE book_daily_sales bs
+    JOIN (
+        SELECT book_id, SUM(quantity) AS quantity, SUM(quantity * price_each) AS revenue
+        FROM order_items
+        WHERE order_id = OLD.order_id
+        GROUP BY book_id
+    ) gone ON gone.book_id = bs.book_id
+    SET bs.quantity = bs.quantity - gone.quantity,
+        bs.revenue = bs.revenue - gone.revenue
+    WHERE bs.sale_date = DATE(OLD.order_date) AND bs.status = OLD.status;
+END;
+//
+
+CREATE TRIGGER book_daily_sales_before_customer_delete
+BEFORE DELETE ON customers
+FOR EACH ROW
+BEGIN
+    UPDATE book_daily_sales bs
+    JOIN (
+        SELECT DATE(o.order_date) AS sale_date, o.status, oi.book_id,
+               SUM(oi.quantity) AS quantity, SUM(oi.quantity * oi.price_each) AS revenue
+        FROM orders o
+        JOIN order_items oi ON oi.order_id = o.order_id
+        WHERE o.customer_id = OLD.customer_id
+        GROUP BY DATE(o.order_date), o.status, oi.book_id
+    ) gone ON gone.sale_date = bs.sale_date AND gone.status = bs.status AND gone.book_id = bs.book_id
+    SET bs.quantity = bs.quantity - gone.quantity,
+        bs.revenue = bs.revenue - gone.revenue;
+END;
+//
+
 DELIMITER ;
 
 SET FOREIGN_KEY_CHECKS = 1;
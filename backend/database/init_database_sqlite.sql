@@ -0,0 +1,341 @@
+-- ================================================================
+--  BOOKSHOP MANAGEMENT SYSTEM – DATABASE SCHEMA (SQLite)
+--  Embedded counterpart of init_database.sql, used with DB_ENGINE=sqlite.
+--  Applied automatically by backend/database/sqlite_engine.py when the
+--  database file has no tables yet; it already includes the columns and
+--  indexes of backend/database/migrations, so no migrations are needed.
+--
+--  Differences from the MySQL schema:
+--  - ENUM columns are TEXT with a CHECK constraint on the same values
+--  - names, titles and e-mails compare case-insensitively (COLLATE NOCASE),
+--    like MySQL's default collation
+--  - timestamps default to local time, like MySQL's CURRENT_TIMESTAMP
+--  - FK cascades fire triggers in SQLite, so the customer delete triggers the
+--    MySQL schema needs are not required here
+-- ================================================================
+
+-- ----------------------------
+-- TABLE: AUTHORS
+-- ----------------------------
+CREATE TABLE IF NOT EXISTS authors (
+    author_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    full_name VARCHAR(120) NOT NULL COLLATE NOCASE,
+    country VARCHAR(100) DEFAULT 'India' COLLATE NOCASE,
+    birth_year SMALLINT NULL,
+    death_year SMALLINT NULL,
+    bio TEXT NULL,
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX IF NOT EXISTS idx_authors_full_name ON authors (full_name);
+
+-- ----------------------------
+-- TABLE: PUBLISHERS
+-- ----------------------------
+CREATE TABLE IF NOT EXISTS publishers (
+    publisher_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(150) NOT NULL UNIQUE COLLATE NOCASE,
+    location VARCHAR(150) COLLATE NOCASE,
+    contact_email VARCHAR(120) COLLATE NOCASE,
+    phone VARCHAR(20),
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+
+-- ----------------------------
+-- TABLE: CATEGORIES
+-- ----------------------------
+CREATE TABLE IF NOT EXISTS categories (
+    category_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(100) NOT NULL UNIQUE COLLATE NOCASE,
+    description TEXT,
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+
+-- ----------------------------
+-- TABLE: BOOKS
+-- ----------------------------
+CREATE TABLE IF NOT EXISTS books (
+    book_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title VARCHAR(200) NOT NULL COLLATE NOCASE,
+    author_id INT NOT NULL,
+    publisher_id INT,
+    category_id INT,
+    language VARCHAR(50) DEFAULT 'English' COLLATE NOCASE,
+    isbn VARCHAR(20) UNIQUE,
+    publication_year SMALLINT,
+    price DECIMAL(10,2) NOT NULL,
+    stock INT DEFAULT 0,
+    reorder_point INT DEFAULT NULL,  -- per-book low-stock level; NULL = use the report threshold
+    description TEXT,
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    FOREIGN KEY (author_id) REFERENCES authors(author_id) ON DELETE CASCADE,
+    FOREIGN KEY (publisher_id) REFERENCES publishers(publisher_id) ON DELETE SET NULL,
+    FOREIGN KEY (category_id) REFERENCES categories(category_id) ON DELETE SET NULL
+);
+CREATE INDEX IF NOT EXISTS idx_books_stock ON books (stock);
+CREATE INDEX IF NOT EXISTS idx_books_reorder_point ON books (reorder_point);
+CREATE INDEX IF NOT EXISTS idx_books_title ON books (title);
+CREATE INDEX IF NOT EXISTS idx_books_price ON books (price);
+CREATE INDEX IF NOT EXISTS idx_books_created_at ON books (created_at);
+-- MySQL indexes foreign keys implicitly, SQLite does not
+CREATE INDEX IF NOT EXISTS idx_books_author_id ON books (author_id);
+CREATE INDEX IF NOT EXISTS idx_books_publisher_id ON books (publisher_id);
+CREATE INDEX IF NOT EXISTS idx_books_category_id ON books (category_id);
+
+-- ----------------------------
+-- TABLE: CUSTOMERS
+-- ----------------------------
+CREATE TABLE IF NOT EXISTS customers (
+    customer_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    full_name VARCHAR(120) NOT NULL COLLATE NOCASE,
+    email VARCHAR(120) UNIQUE COLLATE NOCASE,
+    phone VARCHAR(20),
+    address TEXT,
+    city VARCHAR(100) COLLATE NOCASE,
+    state VARCHAR(100) COLLATE NOCASE,
+    country VARCHAR(100) DEFAULT 'India' COLLATE NOCASE,
+    postal_code VARCHAR(10),
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX IF NOT EXISTS idx_customers_full_name ON customers (full_name);
+CREATE INDEX IF NOT EXISTS idx_customers_created_at ON customers (created_at);
+CREATE INDEX IF NOT EXISTS idx_customers_city_state ON customers (city, state);
+
+-- ----------------------------
+-- TABLE: ORDERS
+-- ----------------------------
+CREATE TABLE IF NOT EXISTS orders (
+    order_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    customer_id INT NOT NULL,
+    order_date DATETIME DEFAULT (datetime('now', 'localtime')),
+    total_amount DECIMAL(12,2) DEFAULT 0.00,
+    status TEXT DEFAULT 'Pending'
+        CHECK (status IN ('Pending', 'Confirmed', 'Shipped', 'Delivered', 'Cancelled')),
+    FOREIGN KEY (customer_id) REFERENCES customers(customer_id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_orders_status_date ON orders (status, order_date);
+CREATE INDEX IF NOT EXISTS idx_orders_customer_date ON orders (customer_id, order_date);
+CREATE INDEX IF NOT EXISTS idx_orders_order_date ON orders (order_date);
+CREATE INDEX IF NOT EXISTS idx_orders_total_amount ON orders (total_amount);
+
+-- ----------------------------
+-- TABLE: ORDER ITEMS
+-- ----------------------------
+CREATE TABLE IF NOT EXISTS order_items (
+    item_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    order_id INT NOT NULL,
+    book_id INT NOT NULL,
+    quantity INT NOT NULL CHECK (quantity > 0),
+    price_each DECIMAL(10,2) NOT NULL,
+    FOREIGN KEY (order_id) REFERENCES orders(order_id) ON DELETE CASCADE,
+    FOREIGN KEY (book_id) REFERENCES books(book_id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_order_items_order_cover ON order_items (order_id, book_id, quantity, price_each);
+CREATE INDEX IF NOT EXISTS idx_order_items_book_id ON order_items (book_id);
+
+-- ----------------------------
+-- TABLE: PAYMENTS
+-- ----------------------------
+CREATE TABLE IF NOT EXISTS payments (
+    payment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    order_id INT NOT NULL,
+    payment_method TEXT DEFAULT 'UPI'
+        CHECK (payment_method IN ('UPI', 'Card', 'NetBanking', 'Cash')),
+    amount DECIMAL(12,2) NOT NULL,
+    payment_status TEXT DEFAULT 'Pending'
+        CHECK (payment_status IN ('Success', 'Pending', 'Failed', 'Cancelled')),
+    transaction_id VARCHAR(100),
+    payment_date DATETIME DEFAULT (datetime('now', 'localtime')),
+    FOREIGN KEY (order_id) REFERENCES orders(order_id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_payments_order_status ON payments (order_id, payment_status);
+CREATE INDEX IF NOT EXISTS idx_payments_amount ON payments (amount);
+
+-- ----------------------------
+-- TABLE: STAFF / ADMINS
+-- ----------------------------
+CREATE TABLE IF NOT EXISTS staff (
+    staff_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username VARCHAR(50) UNIQUE NOT NULL COLLATE NOCASE,
+    password_hash VARCHAR(255) NOT NULL,
+    full_name VARCHAR(100) COLLATE NOCASE,
+    role TEXT DEFAULT 'Staff' CHECK (role IN ('Admin', 'Staff')),
+    position TEXT DEFAULT 'Clerk' CHECK (position IN ('Admin', 'Manager', 'Clerk')),
+    email VARCHAR(120) COLLATE NOCASE,
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+
+-- ----------------------------
+-- TABLE: DAILY SALES (ROLLUP OF ORDERS)
+-- Maintained by the orders triggers below;
+-- rebuild with: python -m backend.reports.sales_rollup rebuild
+-- ----------------------------
+CREATE TABLE IF NOT EXISTS daily_sales (
+    sale_date DATE NOT NULL,
+    status TEXT NOT NULL CHECK (status IN ('Pending', 'Confirmed', 'Shipped', 'Delivered', 'Cancelled')),
+    num_orders INT NOT NULL DEFAULT 0,
+    total_sales DECIMAL(14,2) NOT NULL DEFAULT 0.00,
+    PRIMARY KEY (sale_date, status)
+);
+
+-- ----------------------------
+-- TABLE: BOOK DAILY SALES (ROLLUP OF ORDER ITEMS)
+-- Maintained by the order_items / orders triggers below
+-- ----------------------------
+CREATE TABLE IF NOT EXISTS book_daily_sales (
+    sale_date DATE NOT NULL,
+    status TEXT NOT NULL CHECK (status IN ('Pending', 'Confirmed', 'Shipped', 'Delivered', 'Cancelled')),
+    book_id INT NOT NULL,
+    quantity INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(14,2) NOT NULL DEFAULT 0.00,
+    PRIMARY KEY (sale_date, status, book_id),
+    FOREIGN KEY (book_id) REFERENCES books(book_id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_book_daily_sales_book_id ON book_daily_sales (book_id);
+
+-- ----------------------------
+-- TRIGGERS
+-- ----------------------------
+
+-- MySQL: updated_at ... ON UPDATE CURRENT_TIMESTAMP
+CREATE TRIGGER IF NOT EXISTS books_set_updated_at
+AFTER UPDATE ON books
+FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE books SET updated_at = datetime('now', 'localtime') WHERE book_id = NEW.book_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS update_stock_after_order
+AFTER INSERT ON order_items
+FOR EACH ROW
+BEGIN
+    UPDATE books
+    SET stock = stock - NEW.quantity
+    WHERE book_id = NEW.book_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS daily_sales_after_order_insert
+AFTER INSERT ON orders
+FOR EACH ROW
+BEGIN
+    INSERT INTO daily_sales (sale_date, status, num_orders, total_sales)
+    VALUES (DATE(NEW.order_date), NEW.status, 1, NEW.total_amount)
+    ON CONFLICT (sale_date, status) DO UPDATE SET
+        num_orders = num_orders + 1,
+        total_sales = total_sales + excluded.total_sales;
+END;
+
+CREATE TRIGGER IF NOT EXISTS daily_sales_after_order_update
+AFTER UPDATE ON orders
+FOR EACH ROW WHEN DATE(OLD.order_date) IS NOT DATE(NEW.order_date)
+               OR OLD.status IS NOT NEW.status
+               OR OLD.total_amount IS NOT NEW.total_amount
+BEGIN
+    UPDATE daily_sales
+    SET num_orders = num_orders - 1,
+        total_sales = total_sales - OLD.total_amount
+    WHERE sale_date = DATE(OLD.order_date) AND status = OLD.status;
+
+    INSERT INTO daily_sales (sale_date, status, num_orders, total_sales)
+    VALUES (DATE(NEW.order_date), NEW.status, 1, NEW.total_amount)
+    ON CONFLICT (sale_date, status) DO UPDATE SET
+        num_orders = num_orders + 1,
+        total_sales = total_sales + excluded.total_sales;
+END;
+
+-- Also fires for orders removed by the customers FK cascade
+CREATE TRIGGER IF NOT EXISTS daily_sales_after_order_delete
+AFTER DELETE ON orders
+FOR EACH ROW
+BEGIN
+    UPDATE daily_sales
+    SET num_orders = num_orders - 1,
+        total_sales = total_sales - OLD.total_amount
+    WHERE sale_date = DATE(OLD.order_date) AND status = OLD.status;
+END;
+
+CREATE TRIGGER IF NOT EXISTS book_daily_sales_after_item_insert
+AFTER INSERT ON order_items
+FOR EACH ROW
+BEGIN
+    INSERT INTO book_daily_sales (sale_date, status, book_id, quantity, revenue)
+    SELECT DATE(order_date), status, NEW.book_id, NEW.quantity, NEW.quantity * NEW.price_each
+    FROM orders WHERE order_id = NEW.order_id
+    ON CONFLICT (sale_date, status, book_id) DO UPDATE SET
+        quantity = quantity + excluded.quantity,
+        revenue = revenue + excluded.revenue;
+END;
+
+CREATE TRIGGER IF NOT EXISTS book_daily_sales_after_item_update
+AFTER UPDATE ON order_items
+FOR EACH ROW WHEN OLD.quantity IS NOT NEW.quantity
+               OR OLD.price_each IS NOT NEW.price_each
+               OR OLD.book_id IS NOT NEW.book_id
+BEGIN
+    UPDATE book_daily_sales
+    SET quantity = quantity - OLD.quantity,
+        revenue = revenue - OLD.quantity * OLD.price_each
+    WHERE book_id = OLD.book_id
+      AND (sale_date, status) = (SELECT DATE(order_date), status FROM orders WHERE order_id = NEW.order_id);
+
+    INSERT INTO book_daily_sales (sale_date, status, book_id, quantity, revenue)
+    SELECT DATE(order_date), status, NEW.book_id, NEW.quantity, NEW.quantity * NEW.price_each
+    FROM orders WHERE order_id = NEW.order_id
+    ON CONFLICT (sale_date, status, book_id) DO UPDATE SET
+        quantity = quantity + excluded.quantity,
+        revenue = revenue + excluded.revenue;
+END;
+
+-- Items removed by the orders FK cascade find no order here; the orders
+-- delete trigger below has already subtracted them
+CREATE TRIGGER IF NOT EXISTS book_daily_sales_after_item_delete
+AFTER DELETE ON order_items
+FOR EACH ROW
+BEGIN
+    UPDATE book_daily_sales
+    SET quantity = quantity - OLD.quantity,
+        revenue = revenue - OLD.quantity * OLD.price_each
+    WHERE book_id = OLD.book_id
+      AND (sale_date, status) = (SELECT DATE(order_date), status FROM orders WHERE order_id = OLD.order_id);
+END;
+
+-- Moves an order's items to the new (day, status) bucket
+CREATE TRIGGER IF NOT EXISTS book_daily_sales_after_order_update
+AFTER UPDATE ON orders
+FOR EACH ROW WHEN DATE(OLD.order_date) IS NOT DATE(NEW.order_date)
+               OR OLD.status IS NOT NEW.status
+BEGIN
+    UPDATE book_daily_sales
+    SET quantity = quantity - (SELECT SUM(quantity) FROM order_items
+                               WHERE order_id = NEW.order_id AND book_id = book_daily_sales.book_id),
+        revenue = revenue - (SELECT SUM(quantity * price_each) FROM order_items
+                             WHERE order_id = NEW.order_id AND book_id = book_daily_sales.book_id)
+    WHERE sale_date = DATE(OLD.order_date) AND status = OLD.status
+      AND book_id IN (SELECT book_id FROM order_items WHERE order_id = NEW.order_id);
+
+    INSERT INTO book_daily_sales (sale_date, status, book_id, quantity, revenue)
+    SELECT DATE(NEW.order_date), NEW.status, book_id, SUM(quantity), SUM(quantity * price_each)
+    FROM order_items
+    WHERE order_id = NEW.order_id
+    GROUP BY book_id
+    ON CONFLICT (sale_date, status, book_id) DO UPDATE SET
+        quantity = quantity + excluded.quantity,
+        revenue = revenue + excluded.revenue;
+END;
+
+CREATE TRIGGER IF NOT EXISTS book_daily_sales_before_order_delete
+BEFORE DELETE ON orders
+FOR EACH ROW
+BEGIN
+    UPDATE book_daily_sales
+    SET quantity = quantity - (SELECT SUM(quantity) FROM order_items
+                               WHERE order_id = OLD.order_id AND book_id = book_daily_sales.book_id),
+        revenue = revenue - (SELECT SUM(quantity * price_each) FROM order_items
+                             WHERE order_id = OLD.order_id AND book_id = book_daily_sales.book_id)
+    WHERE sale_date = DATE(OLD.order_date) AND status = OLD.status
+      AND book_id IN (SELECT book_id FROM order_items WHERE order_id = OLD.order_id);
+END;
+
+-- ================================================================
+--  END OF SCHEMA INITIALIZATION
+-- ================================================================
@@ -0,0 +1,262 @@
+# backend/database/migrate.py
+#
+# Versioned schema migrations for an existing database.
+#
+# Migrations are SQL files in backend/database/migrations named
+# NNNN_description.sql and are applied in version order. Applied versions are
+# recorded in the schema_migrations table, so each one runs once per database.
+# DELIMITER blocks (for triggers / procedures) are supported.
+#
+#   python -m backend.database.migrate status
+#   python -m backend.database.migrate up [--to VERSION] [--dry-run]
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+
+from mysql.connector import Error
+
+from backend.database.db_connection import ENGINE, get_connection
+from backend.utils.logger import logger
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "migrations")
+_FILE_RE = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+# Migrations are MySQL scripts; a SQLite database gets the full schema up front
+SQLITE_NOTE = "Nothing to migrate: SQLite databases are created from init_database_sqlite.sql"
+
+# MySQL errors meaning the change is already in place (e.g. the database was
+# created from a newer init_database.sql). The statement is skipped, so
+# migrations can be re-run safely after a partial failure: DDL auto-commits in
+# MySQL, so a failed migration cannot be rolled back as a whole.
+ALREADY_APPLIED_ERRORS = {
+    1050: "table already exists",
+    1060: "duplicate column",
+    1061: "duplicate index name",
+    1091: "column/index already dropped",
+    1359: "trigger already exists",
+    1826: "duplicate foreign key",
+}
+
+
+class Migration:
+    def __init__(self, version, name, path):
+        self.version = version
+        self.name = name
+        self.path = path
+        with open(path, encoding="utf-8") as f:
+            self.sql = f.read()
+        self.checksum = hashlib.sha256(self.sql.encode("utf-8")).hexdigest()
+
+    def statements(self):
+        return split_statements(self.sql)
+
+
+def split_statements(sql):
+    """
+    Splits a SQL script into statements, honouring DELIMITER changes,
+    quoted strings and -- / # comments. Returns statements without their
+    trailing delimiter.
+    """
+    statements = []
+    delimiter = ";"
+    current = []
+
+    for line in sql.splitlines(keepends=True):
+        stripped = line.strip()
+        if not current and stripped.upper().startswith("DELIMITER "):
+            delimiter = stripped.split(None, 1)[1]
+            continue
+        if not current and (not stripped or stripped.startswith("--") or stripped.startswith("#")):
+            continue
+        current.append(line)
+
+        text = "".join(current)
+        if _ends_with_delimiter(text, delimiter):
+            statement = text[:text.rstrip().rfind(delimiter)].strip()
+            if statement:
+                statements.append(statement)
+            current = []
+
+    tail = "".join(current).strip()
+    if tail:
+        statements.append(tail)
+    return statements
+
+
+def _ends_with_delimiter(text, delimiter):
+    """
+    True if text ends with delimiter outside of any quoted string or comment.
+    """
+    quote = None
+    code_end = 0  # index just past the last character that is code
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if quote:
+            if ch == "\\":
+                i += 1
+            elif ch == quote:
+                quote = None
+                code_end = i + 1
+        elif ch in ("'", '"', "`"):
+            quote = ch
+        elif text.startswith("--", i) or ch == "#":
+            newline = text.find("\n", i)
+            i = len(text) if newline == -1 else newline
+            continue
+        elif not ch.isspace():
+            code_end = i + 1
+        i += 1
+    return quote is None and text[:code_end].endswith(delimiter)
+
+
+def discover(directory=MIGRATIONS_DIR):
+    """
+    Returns all migrations in directory, sorted by version.
+    """
+    migrations = []
+    for filename in os.listdir(directory):
+        match = _FILE_RE.match(filename)
+        if match:
+            migrations.append(Migration(int(match.group(1)), match.group(2), os.path.join(directory, filename)))
+    migrations.sort(key=lambda m: m.version)
+
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError("Duplicate migration version in " + directory)
+    return migrations
+
+
+def _ensure_table(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INT PRIMARY KEY,
+            name VARCHAR(200) NOT NULL,
+            checksum CHAR(64) NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """)
+
+
+def _applied(cursor):
+    cursor.execute("SELECT version, checksum FROM schema_migrations")
+    return {version: checksum for version, checksum in cursor.fetchall()}
+
+
+def status():
+    """
+    Returns [{version, name, applied, modified}] for every known migration.
+    """
+    if ENGINE == "sqlite":
+        return {"status": "success", "message": SQLITE_NOTE, "data": []}
+    conn = get_connection()
+    if not conn:
+        return {"status": "error", "message": "DB connection failed"}
+
+    cursor = conn.cursor()
+    try:
+        _ensure_table(cursor)
+        applied = _applied(cursor)
+        data = [
+            {
+                "version": m.version,
+                "name": m.name,
+                "applied": m.version in applied,
+                "modified": m.version in applied and applied[m.version] != m.checksum,
+            }
+            for m in discover()
+        ]
+        return {"status": "success", "message": "Migration status", "data": data}
+    except Exception as e:
+        logger.error("[MIGRATE] Could not read migration status: %s", e)
+        return {"status": "error", "message": str(e)}
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def migrate(target=None, dry_run=False):
+    """
+    Applies pending migrations in order, up to and including `target`.
+    Stops at the first failing migration; earlier ones stay recorded.
+    """
+    if ENGINE == "sqlite":
+        return {"status": "success", "message": SQLITE_NOTE}
+    conn = get_connection()
+    if not conn:
+        return {"status": "error", "message": "DB connection failed"}
+
+    cursor = conn.cursor()
+    done = []
+    try:
+        _ensure_table(cursor)
+        applied = _applied(cursor)
+
+        for migration in discover():
+            if target is not None and migration.version > target:
+                break
+            if migration.version in applied:
+                if applied[migration.version] != migration.checksum:
+                    logger.warning("[MIGRATE] %s_%s changed after it was applied", migration.version, migration.name)
+                continue
+
+            logger.info("[MIGRATE] Applying %s_%s", migration.version, migration.name)
+            for statement in migration.statements():
+                if dry_run:
+                    print(statement + ";\n")
+                    continue
+                try:
+                    cursor.execute(statement)
+                except Error as e:
+                    if e.errno not in ALREADY_APPLIED_ERRORS:
+                        raise
+                    logger.info("[MIGRATE] Skipped (%s): %s", ALREADY_APPLIED_ERRORS[e.errno], statement.splitlines()[0])
+
+            if not dry_run:
+                cursor.execute(
+                    "INSERT INTO schema_migrations (version, name, checksum) VALUES (%s, %s, %s)",
+                    (migration.version, migration.name, migration.checksum)
+                )
+                conn.commit()
+            done.append(migration.version)
+
+        message = f"Applied {len(done)} migration(s)" if not dry_run else f"{len(done)} migration(s) pending"
+        return {"status": "success", "message": message, "data": done}
+    except Exception as e:
+        conn.rollback()
+        logger.error("[MIGRATE] Migration failed after %s: %s", done, e)
+        return {"status": "error", "message": str(e)}
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply versioned schema migrations.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("status", help="list migrations and whether they are applied")
+    up = sub.add_parser("up", help="apply pending migrations")
+    up.add_argument("--to", type=int, help="stop after this version")
+    up.add_argument("--dry-run", action="store_true", help="print the SQL instead of running it")
+    args = parser.parse_args(argv)
+
+    if args.command == "status":
+        result = status()
+        if result["status"] == "success":
+            for m in result["data"]:
+                state = "applied" if m["applied"] else "pending"
+                if m["modified"]:
+                    state += " (modified since)"
+                print(f"{m['version']:>5}  {m['name']:<40} {state}")
+    else:
+        result = migrate(args.to, args.dry_run)
+
+    print(result["message"])
+    return 0 if result["status"] == "success" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
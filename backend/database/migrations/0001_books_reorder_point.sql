@@ -0,0 +1,9 @@
+-- ================================================================
+--  0001: per-book reorder point for the low-stock report
+--  (already part of init_database.sql for new databases)
+-- ================================================================
+
+ALTER TABLE books ADD COLUMN reorder_point INT DEFAULT NULL AFTER stock;
+
+ALTER TABLE books ADD INDEX idx_books_stock (stock), ALGORITHM=INPLACE, LOCK=NONE;
+ALTER TABLE books ADD INDEX idx_books_reorder_point (reorder_point), ALGORITHM=INPLACE, LOCK=NONE;
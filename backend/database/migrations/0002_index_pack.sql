@@ -0,0 +1,52 @@
+-- ================================================================
+--  0002: secondary indexes matching the filters and sort orders
+--  used by backend/api and backend/reports.
+--
+--  Every index is built online (ALGORITHM=INPLACE, LOCK=NONE), so this
+--  can run against a live database. InnoDB appends the primary key to
+--  each secondary index, so (col) also serves the keyset ORDER BY col, pk
+--  used by paged listings.
+-- ================================================================
+
+-- ----------------------------
+-- BOOKS: get_all/search sort by title, price, created_at
+-- ----------------------------
+ALTER TABLE books ADD INDEX idx_books_title (title), ALGORITHM=INPLACE, LOCK=NONE;
+ALTER TABLE books ADD INDEX idx_books_price (price), ALGORITHM=INPLACE, LOCK=NONE;
+ALTER TABLE books ADD INDEX idx_books_created_at (created_at), ALGORITHM=INPLACE, LOCK=NONE;
+
+-- ----------------------------
+-- AUTHORS: listings sorted by full_name
+-- ----------------------------
+ALTER TABLE authors ADD INDEX idx_authors_full_name (full_name), ALGORITHM=INPLACE, LOCK=NONE;
+
+-- ----------------------------
+-- CUSTOMERS: sort by full_name / created_at, search by city / state
+-- ----------------------------
+ALTER TABLE customers ADD INDEX idx_customers_full_name (full_name), ALGORITHM=INPLACE, LOCK=NONE;
+ALTER TABLE customers ADD INDEX idx_customers_created_at (created_at), ALGORITHM=INPLACE, LOCK=NONE;
+ALTER TABLE customers ADD INDEX idx_customers_city_state (city, state), ALGORITHM=INPLACE, LOCK=NONE;
+
+-- ----------------------------
+-- ORDERS
+--   customer orders by date (replaces the implicit customer_id FK index),
+--   listings sorted by order_date / total_amount,
+--   sales reports filtered by status and date range
+-- ----------------------------
+ALTER TABLE orders ADD INDEX idx_orders_customer_date (customer_id, order_date), ALGORITHM=INPLACE, LOCK=NONE;
+ALTER TABLE orders ADD INDEX idx_orders_order_date (order_date), ALGORITHM=INPLACE, LOCK=NONE;
+ALTER TABLE orders ADD INDEX idx_orders_total_amount (total_amount), ALGORITHM=INPLACE, LOCK=NONE;
+ALTER TABLE orders ADD INDEX idx_orders_status_date (status, order_date), ALGORITHM=INPLACE, LOCK=NONE;
+
+-- ----------------------------
+-- ORDER ITEMS: items of a page of orders, read straight from the index
+-- (covers item_id via the primary key)
+-- ----------------------------
+ALTER TABLE order_items ADD INDEX idx_order_items_order_cover (order_id, book_id, quantity, price_each), ALGORITHM=INPLACE, LOCK=NONE;
+
+-- ----------------------------
+-- PAYMENTS: payments of an order by status (replaces the implicit
+-- order_id FK index), listings sorted by amount
+-- ----------------------------
+ALTER TABLE payments ADD INDEX idx_payments_order_status (order_id, payment_status), ALGORITHM=INPLACE, LOCK=NONE;
+ALTER TABLE payments ADD INDEX idx_payments_amount (amount), ALGORITHM=INPLACE, LOCK=NONE;
@@ -0,0 +1,275 @@
+# backend/database/slow_query.py
+#
+# Slow-query log. Pooled cursors (TrackedCursor in connection_pool.py) time
+# every statement; one taking SLOW_QUERY_MS milliseconds or more (default 200,
+# 0 = off) is written as a JSON line to logs/slow_queries.log:
+#
+#   {"event": "slow", "time", "ms", "fingerprint", "shape", "statement"}
+#
+# The shape is the statement with literals, placeholders, IN lists and
+# multi-row VALUES collapsed, so the variants a dynamic search builds group
+# together under one fingerprint. The first time a SELECT / UPDATE / DELETE
+# shape is slow its plan is captured (EXPLAIN FORMAT=JSON on MySQL,
+# EXPLAIN QUERY PLAN on SQLite) on a separate connection and logged once as
+#
+#   {"event": "plan", "fingerprint", "shape", "full_scans", "plan"}
+#
+# where full_scans lists the tables the plan reads without an index.
+#
+# Logging and EXPLAIN run on a background thread; the statement that was slow
+# only queues an entry. Parameter values are not logged unless
+# SLOW_QUERY_LOG_PARAMS=1. The file rotates at SLOW_QUERY_LOG_SIZE bytes
+# (default 5 MB), keeping SLOW_QUERY_LOG_BACKUPS old files (default 5).
+
+import hashlib
+import json
+import logging
+import os
+import queue
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+
+from backend.utils.logger import logger, LOG_DIR
+
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+LOG_PARAMS = os.getenv("SLOW_QUERY_LOG_PARAMS", "0") == "1"
+LOG_FILE = os.path.join(LOG_DIR, "slow_queries.log")
+LOG_SIZE = int(os.getenv("SLOW_QUERY_LOG_SIZE", str(5 * 1024 * 1024)))
+LOG_BACKUPS = int(os.getenv("SLOW_QUERY_LOG_BACKUPS", "5"))
+
+MAX_SHAPES = 1000        # plans remembered (least recently seen shapes are forgotten)
+QUEUE_SIZE = 1000        # entries waiting for the writer; more are dropped and counted
+MAX_STATEMENT = 4000     # characters of statement text logged
+
+# Seconds a statement must take to be logged (None = off)
+threshold = SLOW_QUERY_MS / 1000 if SLOW_QUERY_MS > 0 else None
+
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE")
+
+
+# -------------------------------------------------------------
+# QUERY SHAPES
+# -------------------------------------------------------------
+_STRING = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|\?")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.I)
+_ROW = r"\(\s*\?(?:\s*,\s*\?)*\s*\)"
+_VALUES_LIST = re.compile(rf"({_ROW})(?:\s*,\s*{_ROW})+")
+_SPACE = re.compile(r"\s+")
+
+
+def normalize(sql):
+    """
+    Statement text with values replaced by ?, IN lists and multi-row VALUES
+    collapsed and whitespace squeezed.
+    """
+    shape = _STRING.sub("?", sql)
+    shape = _NUMBER.sub("?", shape)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _IN_LIST.sub("IN (...)", shape)
+    shape = _VALUES_LIST.sub(r"\1, ...", shape)
+    return _SPACE.sub(" ", shape).strip()
+
+
+def fingerprint(shape):
+    return hashlib.sha1(shape.encode("utf-8")).hexdigest()[:12]
+
+
+def full_scans(plan):
+    """
+    Tables a captured plan reads without an index.
+    """
+    found = []
+    if isinstance(plan, list):            # SQLite: EXPLAIN QUERY PLAN detail lines
+        for detail in plan:
+            match = re.match(r"SCAN (?:TABLE )?(\w+)", detail)
+            if match and "USING" not in detail:
+                found.append(match.group(1))
+        return found
+
+    def walk(node):                       # MySQL: "table" objects with access_type ALL
+        if isinstance(node, dict):
+            if node.get("access_type") == "ALL" and "table_name" in node:
+                found.append(node["table_name"])
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+    walk(plan)
+    return found
+
+
+# -------------------------------------------------------------
+# SLOW QUERY LOG
+# -------------------------------------------------------------
+class SlowQueryLog:
+    """
+    Queues slow statements and writes them (plus one plan per shape) from a
+    daemon thread.
+    """
+
+    def __init__(self, path=LOG_FILE, max_bytes=LOG_SIZE, backups=LOG_BACKUPS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._queue = queue.Queue(QUEUE_SIZE)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._log = None
+        self._explained = OrderedDict()   # fingerprint -> None
+        self._stats = {
+            "logged": 0,
+            "plans": 0,
+            "explain_errors": 0,
+            "dropped": 0,
+        }
+
+    def record(self, sql, params, elapsed, explain=True):
+        """
+        Queues a statement that took elapsed seconds. Called on the query path,
+        so it only builds the entry.
+        """
+        if not isinstance(sql, str):
+            sql = sql.decode("utf-8", "replace") if isinstance(sql, (bytes, bytearray)) else str(sql)
+        entry = (datetime.now(), sql, params, elapsed, explain)
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            with self._lock:
+                self._stats["dropped"] += 1
+
+    def stats(self):
+        with self._lock:
+            data = dict(self._stats)
+            data["shapes"] = len(self._explained)
+        data["threshold_ms"] = threshold * 1000 if threshold else 0
+        data["pending"] = self._queue.qsize()
+        return data
+
+    def flush(self):
+        """
+        Blocks until every queued entry has been written.
+        """
+        self._queue.join()
+
+    # -------------------------------------------------------------
+    # WRITER THREAD
+    # -------------------------------------------------------------
+    def _ensure_worker(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name="slow-query-log", daemon=True)
+                thread.start()
+                self._thread = thread
+
+    def _run(self):
+        while True:
+            entry = self._queue.get()
+            try:
+                self._write(*entry)
+            except Exception as e:
+                logger.error("[SLOW_QUERY] Could not log slow statement: %s", e)
+            finally:
+                self._queue.task_done()
+
+    def _writer(self):
+        if self._log is None:
+            log = logging.getLogger("BookShopSlowQueries")
+            log.setLevel(logging.INFO)
+            log.propagate = False
+            handler = RotatingFileHandler(self.path, maxBytes=self.max_bytes,
+                                          backupCount=self.backups, encoding="utf-8", delay=True)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            log.addHandler(handler)
+            self._log = log
+        return self._log
+
+    def _write(self, when, sql, params, elapsed, explain):
+        keyword = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else ""
+        if keyword == "EXPLAIN":             # our own plan captures
+            return
+        shape = normalize(sql)
+        key = fingerprint(shape)
+        record = {
+            "event": "slow",
+            "time": when.isoformat(timespec="milliseconds"),
+            "ms": round(elapsed * 1000, 3),
+            "fingerprint": key,
+            "shape": shape,
+            "statement": _SPACE.sub(" ", sql).strip()[:MAX_STATEMENT],
+        }
+        if LOG_PARAMS and params is not None:
+            record["params"] = [_loggable(value) for value in params]
+        log = self._writer()
+        log.info(json.dumps(record, default=str))
+        with self._lock:
+            self._stats["logged"] += 1
+            first = key not in self._explained
+            self._explained[key] = None
+            self._explained.move_to_end(key)
+            while len(self._explained) > MAX_SHAPES:
+                self._explained.popitem(last=False)
+
+        if not (first and explain and keyword in _EXPLAINABLE):
+            return
+        try:
+            plan = explain_plan(sql, params)
+        except Exception as e:
+            with self._lock:
+                self._stats["explain_errors"] += 1
+            logger.warning("[SLOW_QUERY] EXPLAIN failed for %s: %s", key, e)
+            return
+        if plan is None:
+            return
+        log.info(json.dumps({
+            "event": "plan",
+            "time": datetime.now().isoformat(timespec="milliseconds"),
+            "fingerprint": key,
+            "shape": shape,
+            "full_scans": full_scans(plan),
+            "plan": plan,
+        }, default=str))
+        with self._lock:
+            self._stats["plans"] += 1
+
+
+def _loggable(value):
+    text = value if isinstance(value, str) else repr(value)
+    return text if len(text) <= 200 else text[:200] + "..."
+
+
+def explain_plan(sql, params):
+    """
+    Plan of sql on a connection of its own: the parsed EXPLAIN FORMAT=JSON
+    document on MySQL, the EXPLAIN QUERY PLAN detail lines on SQLite.
+    Returns None when no connection is available.
+    """
+    from backend.database import db_connection   # db_connection imports this module via the pool
+
+    conn = db_connection.get_connection()
+    if not conn:
+        return None
+    cursor = conn.cursor()
+    try:
+        if db_connection.ENGINE == "sqlite":
+            cursor.execute("EXPLAIN QUERY PLAN " + sql, params or ())
+            return [row[-1] for row in cursor.fetchall()]
+        cursor.execute("EXPLAIN FORMAT=JSON " + sql, params or ())
+        row = cursor.fetchone()
+        cursor.fetchall()
+        return json.loads(row[0]) if row else None
+    finally:
+        cursor.close()
+        conn.rollback()
+        conn.close()
+
+
+slow_query_log = SlowQueryLog()
@@ -0,0 +1,281 @@
+# backend/database/sqlite_engine.py
+#
+# Embedded SQLite engine, selected with DB_ENGINE=sqlite (file: DB_PATH).
+#
+# connect() returns a connection that behaves like the mysql.connector one the
+# API classes are written against: cursor(dictionary=..., buffered=...),
+# %s placeholders, lastrowid / rowcount, commit / rollback, in_transaction and
+# is_connected(), so the pool and every API class run unchanged. The MySQL
+# dialect they use is translated per statement (see translate()), and a new
+# database file gets init_database_sqlite.sql.
+#
+# Transactions follow MySQL's autocommit=0 behaviour: the first statement
+# opens one and it lasts until commit() / rollback(). SQLite has a single
+# writer, so a write or a SELECT ... FOR UPDATE takes the write lock (BEGIN
+# IMMEDIATE), waiting up to DB_LOCK_TIMEOUT seconds like a row-lock wait, and
+# holds it until the transaction ends. A transaction that has only read so far
+# is restarted on its first write, so it locks and writes against the latest
+# data, as a MySQL locking read would see it.
+
+import os
+import re
+import sqlite3
+import threading
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+
+SCHEMA_FILE = os.path.join(os.path.dirname(__file__), "init_database_sqlite.sql")
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_schema_lock = threading.Lock()
+
+
+# -------------------------------------------------------------
+# TYPES
+# -------------------------------------------------------------
+# Values are stored as MySQL would print them and read back as the types
+# mysql.connector returns (declared column types drive the conversion).
+def _to_decimal(raw):
+    try:
+        return Decimal(raw.decode()).quantize(Decimal("0.01"))
+    except InvalidOperation:
+        return Decimal(raw.decode())
+
+
+def _to_datetime(raw):
+    try:
+        return datetime.fromisoformat(raw.decode())
+    except ValueError:
+        return raw.decode()
+
+
+def _to_date(raw):
+    try:
+        return date.fromisoformat(raw.decode()[:10])
+    except ValueError:
+        return raw.decode()
+
+
+sqlite3.register_adapter(datetime, lambda value: value.strftime(TIMESTAMP_FORMAT))
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_adapter(Decimal, str)
+sqlite3.register_converter("DECIMAL", _to_decimal)       # every DECIMAL in the schema is (n, 2)
+sqlite3.register_converter("DATETIME", _to_datetime)
+sqlite3.register_converter("TIMESTAMP", _to_datetime)
+sqlite3.register_converter("DATE", _to_date)
+
+
+# -------------------------------------------------------------
+# DIALECT
+# -------------------------------------------------------------
+class Statement:
+    """
+    A MySQL statement translated for SQLite.
+
+    - sql: the SQLite text
+    - write: needs the write lock (DML, DDL, SELECT ... FOR UPDATE)
+    - insert: a plain INSERT (lastrowid is moved to the first row, as in MySQL)
+    - returns_id: an upsert whose id comes back through RETURNING
+    """
+
+    __slots__ = ("sql", "write", "insert", "returns_id")
+
+    def __init__(self, sql, write, insert, returns_id):
+        self.sql = sql
+        self.write = write
+        self.insert = insert
+        self.returns_id = returns_id
+
+
+_FOR_UPDATE = re.compile(r"\s+FOR\s+UPDATE\s*$", re.I)
+_INTERVAL = re.compile(r"(%s|\?|[\w.]+)\s*([+-])\s*INTERVAL\s+(\d+)\s+(DAY|HOUR|MINUTE|SECOND|MONTH|YEAR)\b", re.I)
+_ON_DUPLICATE = re.compile(r"\bON\s+DUPLICATE\s+KEY\s+UPDATE\b", re.I)
+_VALUES_REF = re.compile(r"\bVALUES\((\w+)\)", re.I)
+_LAST_INSERT_ID = re.compile(r"(\w+)\s*=\s*LAST_INSERT_ID\(\s*\1\s*\)", re.I)
+
+
+@lru_cache(maxsize=512)
+def translate(sql):
+    """
+    Rewrites the MySQL syntax the API classes use:
+
+    - %s placeholders                  -> ?
+    - SELECT ... FOR UPDATE            -> SELECT, run under the write lock
+    - x + INTERVAL n DAY               -> datetime(x, '+n day')
+    - ON DUPLICATE KEY UPDATE c = VALUES(c)
+                                       -> ON CONFLICT DO UPDATE SET c = excluded.c
+    - ... id = LAST_INSERT_ID(id)      -> ... id = id RETURNING id (lastrowid of an upsert)
+    """
+    text = sql.strip().rstrip(";")
+    keyword = text.split(None, 1)[0].upper() if text else ""
+
+    text = text.replace("%s", "?").replace("%%", "%")
+
+    locking = bool(_FOR_UPDATE.search(text))
+    if locking:
+        text = _FOR_UPDATE.sub("", text)
+
+    text = _INTERVAL.sub(lambda m: f"datetime({m.group(1)}, '{m.group(2)}{m.group(3)} {m.group(4).lower()}')", text)
+
+    returns_id = False
+    if _ON_DUPLICATE.search(text):
+        text = _ON_DUPLICATE.sub("ON CONFLICT DO UPDATE SET", text)
+        text = _VALUES_REF.sub(r"excluded.\1", text)
+        match = _LAST_INSERT_ID.search(text)
+        if match:
+            text = _LAST_INSERT_ID.sub(r"\1 = \1", text) + f" RETURNING {match.group(1)}"
+            returns_id = True
+
+    write = locking or keyword not in ("SELECT", "WITH", "SHOW", "EXPLAIN", "PRAGMA")
+    insert = keyword == "INSERT" and not returns_id
+    return Statement(text, write, insert, returns_id)
+
+
+# -------------------------------------------------------------
+# CONNECTION
+# -------------------------------------------------------------
+class SQLiteConnection:
+    """
+    mysql.connector-style connection over a sqlite3 database file.
+    """
+
+    def __init__(self, path, lock_timeout=50):
+        self._db = sqlite3.connect(
+            path,
+            timeout=lock_timeout,
+            isolation_level=None,            # transactions are opened by _begin()
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,         # the pool hands connections across threads
+            uri=True,
+        )
+        self._writing = False
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+
+    @property
+    def in_transaction(self):
+        return self._db.in_transaction
+
+    def is_connected(self):
+        try:
+            self._db.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def cursor(self, dictionary=False, buffered=None):
+        """
+        buffered is accepted for compatibility; SQLite cursors always step
+        through results as they are fetched.
+        """
+        return SQLiteCursor(self, dictionary)
+
+    def commit(self):
+        self._db.commit()
+        self._writing = False
+
+    def rollback(self):
+        self._db.rollback()
+        self._writing = False
+
+    def close(self):
+        self._db.close()
+
+    def _begin(self, write):
+        """
+        Opens the transaction a statement runs in, or upgrades a read-only one
+        to the write lock.
+        """
+        if self._db.in_transaction:
+            if not write or self._writing:
+                return
+            self._db.rollback()     # nothing written yet: restart as a writer
+        self._db.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+        self._writing = write
+
+
+class SQLiteCursor:
+    def __init__(self, conn, dictionary=False):
+        self._conn = conn
+        self._cur = conn._db.cursor()
+        self._dictionary = dictionary
+        self._names = None
+        self.lastrowid = None
+
+    def execute(self, sql, params=()):
+        statement = translate(sql)
+        self._conn._begin(statement.write)
+        self._cur.execute(statement.sql, tuple(params or ()))
+        self._names = [d[0] for d in self._cur.description] if self._cur.description else None
+
+        if statement.returns_id:
+            row = self._cur.fetchone()
+            self.lastrowid = row[0] if row else None
+            self._names = None
+        elif statement.insert:
+            # MySQL reports the first id of a multi-row INSERT, SQLite the last
+            self.lastrowid = self._cur.lastrowid - max(self._cur.rowcount, 1) + 1
+        elif statement.write:
+            self.lastrowid = self._cur.lastrowid
+
+    def executemany(self, sql, seq_of_params):
+        statement = translate(sql)
+        self._conn._begin(statement.write)
+        self._cur.executemany(statement.sql, [tuple(p) for p in seq_of_params])
+        self._names = None
+        self.lastrowid = self._cur.lastrowid
+
+    @property
+    def description(self):
+        return self._cur.description if self._names is not None else None
+
+    @property
+    def rowcount(self):
+        return self._cur.rowcount
+
+    def _wrap(self, rows):
+        if not self._dictionary:
+            return rows
+        names = self._names
+        return [dict(zip(names, row)) for row in rows]
+
+    def fetchone(self):
+        row = self._cur.fetchone()
+        if row is None or not self._dictionary:
+            return row
+        return dict(zip(self._names, row))
+
+    def fetchmany(self, size=1):
+        return self._wrap(self._cur.fetchmany(size))
+
+    def fetchall(self):
+        return self._wrap(self._cur.fetchall())
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def close(self):
+        self._cur.close()
+
+
+def ensure_schema(conn):
+    """
+    Creates the tables, indexes and triggers in a database that has none.
+    """
+    with _schema_lock:
+        found = conn._db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'books'").fetchone()
+        if found is None:
+            with open(SCHEMA_FILE, encoding="utf-8") as f:
+                conn._db.executescript(f.read())
+
+
+def connect(path, lock_timeout=50):
+    """
+    Opens a connection to the SQLite database at path (created if missing;
+    "file:...?mode=memory&cache=shared" URIs work too).
+    """
+    conn = SQLiteConnection(path, lock_timeout)
+    ensure_schema(conn)
+    return conn
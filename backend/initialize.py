@@ -11,7 +11,10 @@ from backend.api.customers import CustomersAPI
 from backend.api.reports import ReportsAPI
 
 from backend.utils.logger import logger
-from backend.database.db_connection import get_connection
+from backend.utils import metrics
+from backend.database.db_connection import get_connection, get_pool_stats
+from backend.cache.catalog_cache import catalog_cache
+from backend.database.slow_query import slow_query_log
 
 class Backend:
     """
@@ -42,6 +45,9 @@ class Backend:
 
         logger.info("All API modules initialized.")
 
+        # Periodic metrics dump (METRICS_DUMP_INTERVAL seconds, 0 = off)
+        metrics.start_dump()
+
     def health_check(self):
         """Simple system check for UI use."""
         conn = get_connection()
@@ -50,6 +56,10 @@ class Backend:
 
         return {
             "database": db_status,
+            "pool": get_pool_stats(),
+            "catalog_cache": catalog_cache.stats(),
+            "api_metrics": metrics.snapshot(),
+            "slow_queries": slow_query_log.stats(),
             "modules_loaded": [
                 "publishers", "staff", "authors", "books",
                 "orders", "payments", "categories", "customers", "reports"
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from typing import Optional
 
+from backend.models.records import Record, timestamp_or_now
+
 @dataclass
 class AuthorModel:
     author_id: Optional[int] = None
@@ -42,3 +44,15 @@ class AuthorModel:
             bio=row.get("bio"),
             created_at=row.get("created_at") if isinstance(row.get("created_at"), datetime) else datetime.now()
         )
+
+
+class AuthorRecord(Record):
+    """
+    Read-only author row with the keys of AuthorModel.to_dict(); see Record.
+    """
+
+    __slots__ = ()
+
+    FIELDS = ("author_id", "full_name", "country", "birth_year", "death_year", "bio", "created_at")
+    CONVERTERS = {"created_at": timestamp_or_now}
+    DEFAULTS = {"full_name": "Anonymous/Unknown", "country": "India"}
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+from backend.models.records import Record, to_float, timestamp_or_now
+
 @dataclass
 class BookModel:
     book_id: Optional[int] = None
@@ -19,6 +21,7 @@ class BookModel:
     publication_year: Optional[int] = None
     price: float = 0.0
     stock: int = 0
+    reorder_point: Optional[int] = None
     description: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
@@ -41,6 +44,7 @@ class BookModel:
             "publication_year": self.publication_year,
             "price": self.price,
             "stock": self.stock,
+            "reorder_point": self.reorder_point,
             "description": self.description,
             "created_at": self.created_at.strftime("%Y-%m-%d %H:%M:%S"),
             "updated_at": self.updated_at.strftime("%Y-%m-%d %H:%M:%S")
@@ -65,7 +69,30 @@ class BookModel:
             publication_year=row.get("publication_year"),
             price=float(row.get("price", 0.0)),
             stock=row.get("stock", 0),
+            reorder_point=row.get("reorder_point"),
             description=row.get("description"),
             created_at=row.get("created_at") if isinstance(row.get("created_at"), datetime) else datetime.now(),
             updated_at=row.get("updated_at") if isinstance(row.get("updated_at"), datetime) else datetime.now()
         )
+
+
+class BookRecord(Record):
+    """
+    Read-only book row with the keys of BookModel.to_dict(), built from a
+    tuple cursor over the books / authors / publishers / categories join.
+    Used by the BookAPI read paths and the catalog cache; see Record.
+    """
+
+    __slots__ = ()
+
+    FIELDS = (
+        "book_id", "title", "author_id", "author", "publisher_id", "publisher_name",
+        "category_id", "genre", "language", "isbn", "publication_year", "price",
+        "stock", "reorder_point", "description", "created_at", "updated_at"
+    )
+    SOURCES = {"author": "author_name"}
+    CONVERTERS = {"price": to_float, "created_at": timestamp_or_now, "updated_at": timestamp_or_now}
+    DEFAULTS = {
+        "title": "", "author_id": 0, "author": "", "publisher_name": "", "genre": "",
+        "language": "English", "price": 0.0, "stock": 0
+    }
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+from backend.models.records import Record, timestamp_or_now
+
 @dataclass
 class CustomerModel:
     customer_id: Optional[int] = None
@@ -51,3 +53,18 @@ class CustomerModel:
             postal_code=row.get("postal_code"),
             created_at=row.get("created_at") if isinstance(row.get("created_at"), datetime) else datetime.now()
         )
+
+
+class CustomerRecord(Record):
+    """
+    Read-only customer row with the keys of CustomerModel.to_dict(); see Record.
+    """
+
+    __slots__ = ()
+
+    FIELDS = (
+        "customer_id", "full_name", "email", "phone", "address", "city",
+        "state", "country", "postal_code", "created_at"
+    )
+    CONVERTERS = {"created_at": timestamp_or_now}
+    DEFAULTS = {"full_name": "", "country": "India"}
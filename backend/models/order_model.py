@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict
 
+from backend.models.records import Record, to_float, timestamp, to_dicts
+
 @dataclass
 class OrderItemModel:
     item_id: Optional[int] = None
@@ -68,3 +70,29 @@ class OrderModel:
             status=row.get("status", "Pending"),
             items=order_items
         )
+
+
+class OrderItemRecord(Record):
+    """
+    Read-only order item row with the keys of OrderItemModel.to_dict(); see Record.
+    """
+
+    __slots__ = ()
+
+    FIELDS = ("item_id", "book_id", "quantity", "price_each")
+    CONVERTERS = {"price_each": to_float}
+    DEFAULTS = {"book_id": 0, "quantity": 1, "price_each": 0.0}
+
+
+class OrderRecord(Record):
+    """
+    Read-only order row with the keys of OrderModel.to_dict(). Built from an
+    orders row with the order's list of OrderItemRecords appended as an
+    "items" column, held as plain item dicts; see Record.
+    """
+
+    __slots__ = ()
+
+    FIELDS = ("order_id", "customer_id", "order_date", "total_amount", "status", "items")
+    CONVERTERS = {"order_date": timestamp, "total_amount": to_float, "items": to_dicts}
+    DEFAULTS = {"customer_id": 0, "total_amount": 0.0, "status": "Pending", "items": ()}
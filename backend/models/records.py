@@ -0,0 +1,164 @@
+# backend/models/records.py
+
+from collections.abc import Mapping
+from datetime import datetime
+from operator import itemgetter
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+# -------------------------------------------------------------
+# CONVERTERS (applied when a record is built)
+# -------------------------------------------------------------
+def to_float(value):
+    return float(value) if value is not None else None
+
+
+def timestamp(value):
+    """
+    Formats a datetime; anything else (e.g. NULL) is returned as is.
+    """
+    return value.strftime(TIMESTAMP_FORMAT) if isinstance(value, datetime) else value
+
+
+def timestamp_or_now(value):
+    """
+    Formats a datetime, falling back to "now" like from_db_row() does.
+    """
+    return (value if isinstance(value, datetime) else datetime.now()).strftime(TIMESTAMP_FORMAT)
+
+
+def column_names(cursor):
+    """
+    Column names of the last query run on a cursor.
+    """
+    return [d[0] for d in cursor.description]
+
+
+class Record(Mapping):
+    """
+    Compact, read-only row for listing paths.
+
+    A record keeps one tuple of its field values, in FIELDS order, built
+    from the tuple the cursor returned with a layout shared by every row of
+    the query: one itemgetter picking the columns, then the few converters
+    (price -> float, timestamp formatting). Values are converted once, when
+    the record is built, so reading a field is a plain tuple lookup. A
+    record costs a single small object (no dict, no dataclass, no row.get()
+    calls).
+
+    Records stay inside the backend (listing paths, the catalog cache); API
+    methods return to_dict() copies, so responses are plain JSON-serializable
+    dicts.
+
+    Subclasses set:
+    - FIELDS: the keys, in to_dict() order
+    - SOURCES: {field: column name} where the query names it differently
+    - CONVERTERS: {field: function(value)} applied when the record is built
+    - DEFAULTS: {field: value} used when the query has no such column
+    """
+
+    __slots__ = ("_values",)
+
+    FIELDS = ()
+    SOURCES = {}
+    CONVERTERS = {}
+    DEFAULTS = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._index = {name: i for i, name in enumerate(cls.FIELDS)}
+        cls._layouts = {}   # column names -> layout, one per distinct query shape
+
+    @classmethod
+    def layout(cls, columns):
+        """
+        Returns (getter, defaults, conversions) for a query returning the
+        given column names. Cached: the column indexes are resolved once per
+        query shape, not per row.
+
+        - getter: itemgetter picking the FIELDS values from row + defaults
+        - defaults: values of the fields the query has no column for
+        - conversions: [(index, converter)] applied to the picked values
+        """
+        key = tuple(columns)
+        layout = cls._layouts.get(key)
+        if layout is None:
+            positions = {name: i for i, name in enumerate(key)}
+            picks, defaults = [], []
+            for name in cls.FIELDS:
+                pos = positions.get(cls.SOURCES.get(name, name))
+                if pos is None:
+                    pos = len(key) + len(defaults)
+                    defaults.append(cls.DEFAULTS.get(name))
+                picks.append(pos)
+            conversions = tuple(
+                (i, cls.CONVERTERS[name]) for i, name in enumerate(cls.FIELDS) if name in cls.CONVERTERS
+            )
+            layout = (itemgetter(*picks), tuple(defaults), conversions)
+            cls._layouts[key] = layout
+        return layout
+
+    @classmethod
+    def read_all(cls, cursor, rows=None):
+        """
+        Wraps rows (default: cursor.fetchall()) of a tuple cursor in records.
+        """
+        return cls.wrap(column_names(cursor), cursor.fetchall() if rows is None else rows)
+
+    @classmethod
+    def wrap(cls, columns, rows):
+        """
+        Wraps tuples whose values are the given columns in records.
+        """
+        getter, defaults, conversions = cls.layout(columns)
+        new = cls.__new__
+        records = []
+        for row in rows:
+            values = getter(tuple(row) + defaults if defaults else row)
+            if conversions:
+                values = list(values)
+                for i, convert in conversions:
+                    values[i] = convert(values[i])
+                values = tuple(values)
+            record = new(cls)
+            record._values = values
+            records.append(record)
+        return records
+
+    @classmethod
+    def read_one(cls, cursor):
+        row = cursor.fetchone()
+        return cls.read_all(cursor, [row])[0] if row is not None else None
+
+    # -------------------------------------------------------------
+    # MAPPING
+    # -------------------------------------------------------------
+    def __getitem__(self, key):
+        return self._values[self._index[key]]
+
+    def get(self, key, default=None):
+        i = self._index.get(key)
+        return self._values[i] if i is not None else default
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    def to_dict(self):
+        return dict(zip(self.FIELDS, self._values))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+def to_dicts(records):
+    """
+    Plain dict copies of records, e.g. for an API response.
+    """
+    return [record.to_dict() for record in records]
@@ -0,0 +1,101 @@
+# backend/reports/sales_rollup.py
+#
+# Maintenance command for the sales rollup tables (daily_sales, book_daily_sales).
+# The tables and their triggers come with init_database.sql, or with migration
+# 0003 on an existing database (python -m backend.database.migrate up).
+#
+#   python -m backend.reports.sales_rollup rebuild [--start YYYY-MM-DD] [--end YYYY-MM-DD]
+#       recompute the rollups from orders (all days, or an inclusive date range);
+#       without a range this also backfills freshly migrated tables
+
+import argparse
+import sys
+
+from backend.database.db_connection import get_connection
+from backend.utils.helpers import parse_date
+from backend.utils.logger import logger
+from backend.utils.metrics import timed
+
+# Rollup tables, each with the SQL that recomputes it from orders for a date range.
+# {where} filters on o.order_date.
+ROLLUPS = {
+    "daily_sales": """
+        INSERT INTO daily_sales (sale_date, status, num_orders, total_sales)
+        SELECT DATE(o.order_date), o.status, COUNT(*), SUM(o.total_amount)
+        FROM orders o
+        {where}
+        GROUP BY DATE(o.order_date), o.status
+    """,
+    "book_daily_sales": """
+        INSERT INTO book_daily_sales (sale_date, status, book_id, quantity, revenue)
+        SELECT DATE(o.order_date), o.status, oi.book_id, SUM(oi.quantity), SUM(oi.quantity * oi.price_each)
+        FROM orders o
+        JOIN order_items oi ON oi.order_id = o.order_id
+        {where}
+        GROUP BY DATE(o.order_date), o.status, oi.book_id
+    """,
+}
+
+
+@timed("sales_rollup.rebuild")
+def rebuild(start_date=None, end_date=None):
+    """
+    Recomputes the rollups from orders for the inclusive date range
+    (all days when no range is given), in a single transaction.
+    Returns the number of rollup rows written per table.
+    """
+    conn = get_connection()
+    if not conn:
+        return {"status": "error", "message": "DB connection failed"}
+
+    delete_where, order_where, params = [], [], []
+    if start_date:
+        delete_where.append("sale_date >= %s")
+        order_where.append("o.order_date >= %s")
+        params.append(start_date)
+    if end_date:
+        delete_where.append("sale_date <= %s")
+        order_where.append("o.order_date < %s + INTERVAL 1 DAY")
+        params.append(end_date)
+
+    def clause(where):
+        return ("WHERE " + " AND ".join(where)) if where else ""
+
+    cursor = conn.cursor()
+    try:
+        rows = {}
+        for table, insert_sql in ROLLUPS.items():
+            cursor.execute(f"DELETE FROM {table} {clause(delete_where)}", params)
+            cursor.execute(insert_sql.format(where=clause(order_where)), params)
+            rows[table] = cursor.rowcount
+        conn.commit()
+        logger.info("[SALES_ROLLUP] Rebuilt rollups (%s .. %s): %s", start_date or 'start', end_date or 'today', rows)
+        return {"status": "success", "message": "Sales rollups rebuilt", "data": rows}
+    except Exception as e:
+        conn.rollback()
+        logger.error("[SALES_ROLLUP] Rebuild failed: %s", e)
+        return {"status": "error", "message": str(e)}
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Maintain the sales rollup tables.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rebuild_parser = sub.add_parser("rebuild", help="recompute the rollup from orders")
+    rebuild_parser.add_argument("--start", help="first day to rebuild (YYYY-MM-DD)")
+    rebuild_parser.add_argument("--end", help="last day to rebuild (YYYY-MM-DD)")
+    args = parser.parse_args(argv)
+
+    for value in (args.start, args.end):
+        if value and not parse_date(value, "%Y-%m-%d"):
+            parser.error(f"Invalid date '{value}', expected YYYY-MM-DD")
+    result = rebuild(args.start, args.end)
+
+    print(result["message"])
+    return 0 if result["status"] == "success" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
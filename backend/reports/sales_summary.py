@@ -3,18 +3,39 @@
 from backend.database.db_connection import get_connection
 from backend.utils.helpers import format_date
 from backend.utils.logger import logger
+from backend.utils.metrics import instrumented
 from collections import defaultdict
+from datetime import date, timedelta
 
+@instrumented
 class SalesSummaryReport:
     """
     Generates sales summary reports for the bookshop.
     Headless: returns data only, GUI should handle visualization.
     """
 
-    def get_daily_sales(self):
+    # Order statuses that count as a sale
+    SALE_STATUSES = ('Confirmed', 'Shipped', 'Delivered')
+
+    # Rolling windows accepted by top_selling_books(): name -> days, today included
+    WINDOWS = {"last_7d": 7, "last_30d": 30}
+
+    def get_daily_sales(self, start_date=None, end_date=None):
         """
         Returns a dictionary with date -> total sales amount and number of orders.
+        start_date / end_date (YYYY-MM-DD, inclusive) optionally limit the range.
+        Reads the daily_sales rollup, so the cost depends on the number of days
+        asked for rather than on the number of orders ever placed.
         """
+        where = [f"status IN ({', '.join(['%s'] * len(self.SALE_STATUSES))})"]
+        params = list(self.SALE_STATUSES)
+        if start_date:
+            where.append("sale_date >= %s")
+            params.append(start_date)
+        if end_date:
+            where.append("sale_date <= %s")
+            params.append(end_date)
+
         conn = get_connection()
         if not conn:
             logger.error("DB connection failed in get_daily_sales()")
@@ -22,37 +43,41 @@ class SalesSummaryReport:
 
         cursor = conn.cursor(dictionary=True)
         try:
-            cursor.execute("""
-                SELECT DATE(order_date) AS order_day,
-                       COUNT(order_id) AS num_orders,
-                       SUM(total_amount) AS total_sales
-                FROM orders
-                WHERE status IN ('Confirmed', 'Shipped', 'Delivered')
-                GROUP BY DATE(order_date)
-                ORDER BY DATE(order_date) ASC
-            """)
+            cursor.execute(f"""
+                SELECT sale_date AS order_day,
+                       SUM(num_orders) AS num_orders,
+                       SUM(total_sales) AS total_sales
+                FROM daily_sales
+                WHERE {" AND ".join(where)}
+                GROUP BY sale_date
+                HAVING SUM(num_orders) > 0
+                ORDER BY sale_date ASC
+            """, params)
             rows = cursor.fetchall()
             daily_sales = {}
             for row in rows:
                 daily_sales[str(row['order_day'])] = {
-                    "num_orders": row['num_orders'],
+                    "num_orders": int(row['num_orders']),
                     "total_sales": float(row['total_sales'])
                 }
-            logger.info(f"Daily sales data fetched: {len(daily_sales)} days")
+            logger.info("Daily sales data fetched: %s days", len(daily_sales))
             return {"status": "success","message": "search results", "data":daily_sales}
         except Exception as e:
-            logger.error(f"Error fetching daily sales: {e}")
+            logger.error("Error fetching daily sales: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
             conn.close()
 
-    def get_daily_sales_plot_data(self):
+    def get_daily_sales_plot_data(self, start_date=None, end_date=None):
         """
         Returns data suitable for plotting: (dates list, sales list)
         Frontend can use these to plot charts.
         """
-        daily_sales = self.get_daily_sales()
+        result = self.get_daily_sales(start_date, end_date)
+        if result["status"] == "error":
+            return result
+        daily_sales = result["data"]
         if not daily_sales:
             return {"status": "error", "message": "No daily sales data"}
 
@@ -60,10 +85,29 @@ class SalesSummaryReport:
         sales = [daily_sales[date]['total_sales'] for date in dates]
         return {"status": "success","message": "search results", "data":[dates, sales]}
 
-    def top_selling_books(self, limit=10):
+    def top_selling_books(self, limit=10, start=None, end=None, window=None):
         """
         Returns top-selling books based on order_items quantity.
+        - start / end: inclusive YYYY-MM-DD bounds (optional)
+        - window: "last_7d" or "last_30d", counted back from today (overrides start/end)
+        Reads the book_daily_sales rollup, so a short range only touches the
+        pre-aggregated rows of those days.
         """
+        if window:
+            if window not in self.WINDOWS:
+                return {"status": "error", "message": f"Invalid window '{window}'"}
+            end = date.today()
+            start = end - timedelta(days=self.WINDOWS[window] - 1)
+
+        where = [f"s.status IN ({', '.join(['%s'] * len(self.SALE_STATUSES))})"]
+        params = list(self.SALE_STATUSES)
+        if start:
+            where.append("s.sale_date >= %s")
+            params.append(start)
+        if end:
+            where.append("s.sale_date <= %s")
+            params.append(end)
+
         conn = get_connection()
         if not conn:
             logger.error("DB connection failed in top_selling_books()")
@@ -71,22 +115,26 @@ class SalesSummaryReport:
 
         cursor = conn.cursor(dictionary=True)
         try:
-            cursor.execute("""
-                SELECT b.title, SUM(oi.quantity) AS total_sold, full_name as author_name, b.book_id
-                FROM order_items oi
-                JOIN books b ON oi.book_id = b.book_id
-                JOIN orders o ON oi.order_id = o.order_id
+            cursor.execute(f"""
+                SELECT b.title, top.total_sold, a.full_name AS author_name, b.book_id
+                FROM (
+                    SELECT s.book_id, SUM(s.quantity) AS total_sold
+                    FROM book_daily_sales s
+                    WHERE {" AND ".join(where)}
+                    GROUP BY s.book_id
+                    HAVING SUM(s.quantity) > 0
+                    ORDER BY total_sold DESC, s.book_id
+                    LIMIT %s
+                ) top
+                JOIN books b ON top.book_id = b.book_id
                 JOIN authors a ON b.author_id = a.author_id
-                WHERE o.status IN ('Confirmed', 'Shipped', 'Delivered')
-                GROUP BY b.book_id
-                ORDER BY total_sold DESC
-                LIMIT %s
-            """, (limit,))
+                ORDER BY top.total_sold DESC, b.book_id
+            """, params + [limit])
             rows = cursor.fetchall()
-            logger.info(f"Fetched top {limit} selling books")
+            logger.info("Fetched top %s selling books", limit)
             return {"status": "success","message": "search results", "data":[{"book_id": row['book_id'],"author_name": row['author_name'],"title": row['title'], "total_sold": int(row['total_sold'])} for row in rows]}
         except Exception as e:
-            logger.error(f"Error fetching top-selling books: {e}")
+            logger.error("Error fetching top-selling books: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
@@ -2,7 +2,9 @@
 
 from backend.database.db_connection import get_connection
 from backend.utils.logger import logger
+from backend.utils.metrics import instrumented
 
+@instrumented
 class StockReport:
     """
     Generates inventory/stock reports for the bookshop.
@@ -29,23 +31,73 @@ class StockReport:
                 ORDER BY b.title ASC
             """)
             rows = cursor.fetchall()
-            logger.info(f"Fetched stock info for {len(rows)} books")
+            logger.info("Fetched stock info for %s books", len(rows))
             return {"status": "success","message": "search results", "data":rows}
         except Exception as e:
-            logger.error(f"Error fetching stock info: {e}")
+            logger.error("Error fetching stock info: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
             conn.close()
 
-    def get_low_stock(self, threshold=10):
+    def get_low_stock(self, threshold=10, category_id=None, publisher_id=None, limit=None):
         """
-        Returns books where stock is below a threshold.
+        Returns books where stock is below their reorder point, or below
+        `threshold` for books without one, lowest stock first.
+        Optional category_id / publisher_id filters and a row limit.
         """
-        all_stock = self.get_current_stock().get("data", [])
-        low_stock_books = [book for book in all_stock if book['stock'] is not None and book['stock'] < threshold]
-        logger.info(f"Found {len(low_stock_books)} low stock books (threshold={threshold})")
-        return {"status": "success","message": "search results", "data":low_stock_books}
+        try:
+            threshold = int(threshold)
+            limit = int(limit) if limit is not None else None
+        except (ValueError, TypeError):
+            return {"status": "error", "message": "threshold and limit must be integers"}
+
+        conn = get_connection()
+        if not conn:
+            logger.error("DB connection failed in get_low_stock()")
+            return {"status": "error", "message": "DB connection failed"}
+
+        cursor = conn.cursor(dictionary=True)
+        try:
+            # Upper bound for the idx_books_stock range scan: no book can be low
+            # on stock above the larger of the threshold and any reorder point
+            # (MAX() is answered from idx_books_reorder_point).
+            cursor.execute("SELECT MAX(reorder_point) AS max_reorder_point FROM books")
+            max_reorder_point = cursor.fetchone()["max_reorder_point"]
+            bound = max(threshold, max_reorder_point or 0)
+
+            where = ["b.stock < %s", "b.stock < COALESCE(b.reorder_point, %s)"]
+            params = [bound, threshold]
+            if category_id is not None:
+                where.append("b.category_id = %s")
+                params.append(category_id)
+            if publisher_id is not None:
+                where.append("b.publisher_id = %s")
+                params.append(publisher_id)
+
+            sql = f"""
+                SELECT b.book_id, b.title, b.stock, b.reorder_point, c.name AS category,
+                       p.name AS publisher, b.price
+                FROM books b
+                LEFT JOIN categories c ON b.category_id = c.category_id
+                LEFT JOIN publishers p ON b.publisher_id = p.publisher_id
+                WHERE {" AND ".join(where)}
+                ORDER BY b.stock ASC, b.book_id ASC
+            """
+            if limit:
+                sql += " LIMIT %s"
+                params.append(limit)
+
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+            logger.info("Found %s low stock books (threshold=%s)", len(rows), threshold)
+            return {"status": "success","message": "search results", "data":rows}
+        except Exception as e:
+            logger.error("Error fetching low stock books: %s", e)
+            return {"status": "error", "message": str(e)}
+        finally:
+            cursor.close()
+            conn.close()
 
     def get_category_stock_summary(self):
         """
@@ -67,10 +119,10 @@ class StockReport:
                 ORDER BY total_stock DESC
             """)
             rows = cursor.fetchall()
-            logger.info(f"Fetched category-wise stock summary for {len(rows)} categories")
+            logger.info("Fetched category-wise stock summary for %s categories", len(rows))
             return {"status": "success","message": "search results", "data":[{"category": row['category'], "num_books": int(row['num_books']), "total_stock": int(row['total_stock'])} for row in rows]}
         except Exception as e:
-            logger.error(f"Error fetching category stock summary: {e}")
+            logger.error("Error fetching category stock summary: %s", e)
             return {"status": "error", "message": str(e)}
         finally:
             cursor.close()
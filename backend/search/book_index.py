@@ -0,0 +1,324 @@
+# backend/search/book_index.py
+
+import heapq
+import os
+import threading
+import time
+
+from backend.database.db_connection import get_connection
+from backend.search.inverted_index import InvertedIndex, tokenize
+from backend.utils.logger import logger
+
+# Rows fetched per round trip while building the index
+BUILD_BATCH_SIZE = 5000
+
+# Entity kinds linked to books: kind -> (table, id column, name column, score boost)
+ENTITIES = {
+    "author": ("authors", "author_id", "full_name", 2.0),
+    "publisher": ("publishers", "publisher_id", "name", 1.0),
+    "category": ("categories", "category_id", "name", 1.0),
+}
+# Boost for a term found in the book's own title / ISBN
+TITLE_BOOST = 3.0
+
+
+def _normalize_isbn(isbn):
+    return isbn.replace("-", "").replace(" ", "") if isbn else isbn
+
+
+class BookSearchIndex:
+    """
+    Ranked full-text search over the catalog, held in memory.
+
+    Book titles and ISBNs are indexed per book. Author, publisher and category
+    names are indexed once per entity and mapped to their books, so renaming an
+    author touches one small index instead of every book by that author.
+
+    A query matches books where every term (or a prefix of a word) appears in
+    the title, ISBN, author, publisher or category name. Thread-safe.
+    """
+
+    def __init__(self, max_age=0):
+        self.max_age = max_age          # seconds before a rebuild; 0 = never
+        self.built_at = None
+        self._lock = threading.RLock()
+        self._building = False
+        self._pending = []              # changes that arrive during a rebuild
+        self._reset_state()
+
+    def _reset_state(self):
+        self.books = InvertedIndex({"title": 1.0, "isbn": 1.0})
+        self.entities = {kind: InvertedIndex({"name": 1.0}) for kind in ENTITIES}
+        self._refs = {}                                    # book_id -> {kind: entity_id}
+        self._books_by = {kind: {} for kind in ENTITIES}   # kind -> {entity_id: set(book_id)}
+
+    def is_ready(self):
+        if self.built_at is None:
+            return False
+        return not self.max_age or time.monotonic() - self.built_at < self.max_age
+
+    # -------------------------------------------------------------
+    # BUILD
+    # -------------------------------------------------------------
+    def build(self, conn):
+        """
+        (Re)builds the index from the database. Searches keep using the previous
+        index until the new one is swapped in.
+        """
+        with self._lock:
+            self._building = True
+            self._pending = []
+
+        start = time.perf_counter()
+        fresh = BookSearchIndex.__new__(BookSearchIndex)
+        fresh._reset_state()
+        cursor = conn.cursor(dictionary=True)
+        try:
+            for kind, (table, id_col, name_col, _) in ENTITIES.items():
+                cursor.execute(f"SELECT {id_col} AS id, {name_col} AS name FROM {table}")
+                fresh.entities[kind].add_many((r["id"], {"name": r["name"]}) for r in cursor.fetchall())
+
+            cursor.execute("""
+                SELECT book_id, title, isbn, author_id, publisher_id, category_id
+                FROM books
+            """)
+            docs = []
+            while True:
+                rows = cursor.fetchmany(BUILD_BATCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    fresh._link_book(row)
+                    docs.append((row["book_id"], {"title": row["title"], "isbn": _normalize_isbn(row["isbn"])}))
+            fresh.books.add_many(docs)
+        except Exception:
+            with self._lock:
+                self._building = False
+                self._pending = []
+            raise
+        finally:
+            cursor.close()
+
+        with self._lock:
+            self.books, self.entities = fresh.books, fresh.entities
+            self._refs, self._books_by = fresh._refs, fresh._books_by
+            self.built_at = time.monotonic()
+            self._building = False
+            pending, self._pending = self._pending, []
+            for method, args in pending:
+                method(*args)
+
+        logger.info("[SEARCH] Indexed %s books in %.0f ms", len(self.books), (time.perf_counter() - start) * 1000)
+
+    # -------------------------------------------------------------
+    # MAINTENANCE
+    # -------------------------------------------------------------
+    def index_book(self, row):
+        """
+        Adds or refreshes one book. row needs book_id, title, isbn and the
+        author_id / publisher_id / category_id foreign keys.
+        """
+        self._apply(self._index_book, row)
+
+    def remove_book(self, book_id):
+        self._apply(self._remove_book, book_id)
+
+    def index_entity(self, kind, entity_id, name):
+        """
+        Adds or renames an author / publisher / category.
+        """
+        self._apply(self._index_entity, kind, entity_id, name)
+
+    def remove_entity(self, kind, entity_id):
+        """
+        Drops an author / publisher / category. Deleting an author cascades to
+        their books; publishers and categories are only unlinked (SET NULL).
+        """
+        self._apply(self._remove_entity, kind, entity_id)
+
+    def invalidate(self):
+        """
+        Marks the index stale after a bulk change (e.g. a catalog import), so
+        it is rebuilt on next use instead of being patched book by book.
+        """
+        with self._lock:
+            self.built_at = None
+
+    def _apply(self, method, *args):
+        with self._lock:
+            if self._building:
+                self._pending.append((method, args))
+            elif self.built_at is not None:
+                method(*args)
+
+    def _index_book(self, row):
+        self._unlink_book(row["book_id"])
+        self._link_book(row)
+        self.books.add(row["book_id"], {"title": row.get("title"), "isbn": _normalize_isbn(row.get("isbn"))})
+
+    def _remove_book(self, book_id):
+        self._unlink_book(book_id)
+        self.books.remove(book_id)
+
+    def _index_entity(self, kind, entity_id, name):
+        self.entities[kind].add(entity_id, {"name": name})
+
+    def _remove_entity(self, kind, entity_id):
+        self.entities[kind].remove(entity_id)
+        book_ids = self._books_by[kind].pop(entity_id, set())
+        for book_id in book_ids:
+            if kind == "author":
+                self._remove_book(book_id)
+            else:
+                self._refs.get(book_id, {}).pop(kind, None)
+
+    def _link_book(self, row):
+        refs = {}
+        for kind in ENTITIES:
+            entity_id = row.get(f"{kind}_id")
+            if entity_id is not None:
+                refs[kind] = entity_id
+                self._books_by[kind].setdefault(entity_id, set()).add(row["book_id"])
+        self._refs[row["book_id"]] = refs
+
+    def _unlink_book(self, book_id):
+        for kind, entity_id in self._refs.pop(book_id, {}).items():
+            books = self._books_by[kind].get(entity_id)
+            if books is not None:
+                books.discard(book_id)
+                if not books:
+                    del self._books_by[kind][entity_id]
+
+    # -------------------------------------------------------------
+    # SEARCH
+    # -------------------------------------------------------------
+    def search(self, query, limit=None, after=None):
+        """
+        Returns ([(book_id, score)], total_hits) for books matching every term
+        of query, best match first (ties broken by book_id).
+
+        - limit: return only the best `limit` hits
+        - after: (score, book_id) of the last hit already seen; only hits
+          ranked below it are returned
+        """
+        terms = tokenize(query)
+        if not terms:
+            return [], 0
+
+        with self._lock:
+            total = None
+            for term in terms:
+                scores = {book_id: s * TITLE_BOOST for book_id, s in self.books.term_scores(term).items()}
+                for kind, (_, _, _, boost) in ENTITIES.items():
+                    books_by = self._books_by[kind]
+                    for entity_id, s in self.entities[kind].term_scores(term).items():
+                        for book_id in books_by.get(entity_id, ()):
+                            scores[book_id] = scores.get(book_id, 0.0) + s * boost
+
+                if total is None:
+                    total = scores
+                else:
+                    total = {book_id: total[book_id] + s for book_id, s in scores.items() if book_id in total}
+                if not total:
+                    return [], 0
+
+        return _rank(total, limit, after)
+
+    def is_exhaustive(self, query, kind=None):
+        """
+        True if every term of query was expanded to all of its completions by
+        search() (or search_entities(kind)), so the hits of a query extending
+        those terms are a subset of its hits. False for terms shorter than
+        MIN_PREFIX_LENGTH and for prefixes with too many completions.
+        """
+        indexes = [self.entities[kind]] if kind else [self.books, *self.entities.values()]
+        with self._lock:
+            return all(index.is_exhaustive(term) for term in tokenize(query) for index in indexes)
+
+    def search_entities(self, kind, query, limit=None, after=None):
+        """
+        Returns ([(entity_id, score)], total_hits) for the authors / publishers /
+        categories whose name matches every term of query (words may be
+        prefixes). Ranked and paged like search().
+        """
+        with self._lock:
+            scores = dict(self.entities[kind].search(query))
+        return _rank(scores, limit, after)
+
+
+def _rank(scores, limit=None, after=None):
+    """
+    Orders {id: score} best first (ties by id); see BookSearchIndex.search.
+    """
+    hits = scores.items()
+    if after is not None:
+        after_key = (-after[0], after[1])
+        hits = [(i, s) for i, s in hits if (-s, i) > after_key]
+    rank = lambda kv: (-kv[1], kv[0])
+    if limit:
+        return heapq.nsmallest(limit, hits, key=rank), len(scores)
+    return sorted(hits, key=rank), len(scores)
+
+
+# -------------------------------------------------------------
+# PROCESS-WIDE INDEX
+# -------------------------------------------------------------
+# Rebuilt after SEARCH_INDEX_MAX_AGE seconds (default 300) so books added or
+# renamed by other processes become searchable; 0 never rebuilds.
+INDEX_MAX_AGE = float(os.getenv("SEARCH_INDEX_MAX_AGE", "300"))
+
+book_index = BookSearchIndex(max_age=INDEX_MAX_AGE)
+_build_lock = threading.Lock()
+
+
+def _build():
+    """
+    Builds the shared index from the database. Caller holds _build_lock.
+    Returns False if it could not be built.
+    """
+    conn = get_connection()
+    if not conn:
+        return False
+    try:
+        book_index.build(conn)
+        return True
+    except Exception as e:
+        logger.error("[SEARCH] Could not build search index: %s", e)
+        return False
+    finally:
+        conn.close()
+
+
+def _refresh_in_background():
+    """
+    Rebuilds a stale index on a daemon thread, unless a build is running.
+    """
+    if not _build_lock.acquire(blocking=False):
+        return
+
+    def run():
+        try:
+            _build()
+        finally:
+            _build_lock.release()
+
+    threading.Thread(target=run, name="search-index-refresh", daemon=True).start()
+
+
+def get_book_index():
+    """
+    Returns the shared index, building it from the database on first use.
+    Once older than SEARCH_INDEX_MAX_AGE seconds it keeps answering searches
+    while a background thread rebuilds it.
+    Returns None if the index could not be built.
+    """
+    if book_index.is_ready():
+        return book_index
+    if book_index.built_at is not None:
+        _refresh_in_background()
+        return book_index
+
+    with _build_lock:
+        if book_index.built_at is None and not _build():
+            return None
+    return book_index
@@ -0,0 +1,181 @@
+# backend/search/inverted_index.py
+
+import math
+import re
+from bisect import bisect_left, bisect_right, insort
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Query terms shorter than this only match whole tokens
+MIN_PREFIX_LENGTH = 2
+# Completions considered per prefix term (the most common ones win)
+MAX_EXPANSIONS = 50
+# Completions scanned before picking the most common MAX_EXPANSIONS
+MAX_EXPANSION_SCAN = 1000
+# Score multiplier for a prefix completion relative to an exact token match
+PREFIX_PENALTY = 0.8
+
+
+def tokenize(text):
+    """
+    Splits text into lower-case word tokens.
+    """
+    if not text:
+        return []
+    return _TOKEN_RE.findall(str(text).lower())
+
+
+class InvertedIndex:
+    """
+    In-memory inverted index over small text fields.
+
+    Documents are dicts of {field: text}; each field carries a weight that is
+    added to a token's term frequency. Supports exact and prefix term lookups
+    ranked with a tf-idf style score. Not thread-safe: callers synchronize.
+    """
+
+    def __init__(self, field_weights):
+        self.field_weights = dict(field_weights)
+        self._postings = {}    # token -> {doc_id: weighted term frequency}
+        self._doc_tokens = {}  # doc_id -> tuple of tokens, for removal
+        self._vocab = []       # sorted tokens, for prefix lookups
+
+    def __len__(self):
+        return len(self._doc_tokens)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._doc_tokens
+
+    # -------------------------------------------------------------
+    # MAINTENANCE
+    # -------------------------------------------------------------
+    def add(self, doc_id, fields):
+        """
+        Indexes a document, replacing any previous version of it.
+        """
+        if doc_id in self._doc_tokens:
+            self.remove(doc_id)
+        for token in self._index_doc(doc_id, fields):
+            insort(self._vocab, token)
+
+    def add_many(self, docs):
+        """
+        Bulk-indexes an iterable of (doc_id, fields) and sorts the vocabulary once.
+        """
+        for doc_id, fields in docs:
+            if doc_id in self._doc_tokens:
+                self.remove(doc_id)
+            self._index_doc(doc_id, fields)
+        self._vocab = sorted(self._postings)
+
+    def remove(self, doc_id):
+        """
+        Drops a document from the index. Unknown ids are ignored.
+        """
+        for token in self._doc_tokens.pop(doc_id, ()):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[token]
+                i = bisect_left(self._vocab, token)
+                if i < len(self._vocab) and self._vocab[i] == token:
+                    del self._vocab[i]
+
+    def _index_doc(self, doc_id, fields):
+        """
+        Adds postings for one document; returns tokens new to the index.
+        """
+        weights = {}
+        for field, weight in self.field_weights.items():
+            for token in tokenize(fields.get(field)):
+                weights[token] = weights.get(token, 0) + weight
+
+        new_tokens = []
+        for token, weight in weights.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                new_tokens.append(token)
+            postings[doc_id] = weight
+        self._doc_tokens[doc_id] = tuple(weights)
+        return new_tokens
+
+    # -------------------------------------------------------------
+    # LOOKUPS
+    # -------------------------------------------------------------
+    def expand(self, term, prefix=True):
+        """
+        Returns [(token, is_exact)] for the vocabulary tokens matching term:
+        the token itself plus, for prefix lookups, its most common completions.
+        """
+        matches = [(term, True)] if term in self._postings else []
+        if not prefix or len(term) < MIN_PREFIX_LENGTH:
+            return matches
+
+        completions = []
+        i = bisect_left(self._vocab, term)
+        while i < len(self._vocab) and len(completions) < MAX_EXPANSION_SCAN:
+            token = self._vocab[i]
+            if not token.startswith(term):
+                break
+            if token != term:
+                completions.append(token)
+            i += 1
+
+        if len(completions) > MAX_EXPANSIONS:
+            completions.sort(key=lambda t: len(self._postings[t]), reverse=True)
+            completions = completions[:MAX_EXPANSIONS]
+        return matches + [(token, False) for token in completions]
+
+    def is_exhaustive(self, term, prefix=True):
+        """
+        True if expand(term) returns every vocabulary token starting with term,
+        i.e. term is long enough to be expanded and its completions were not
+        cut off at MAX_EXPANSIONS. Only then does a longer term match a subset
+        of the documents term matches.
+        """
+        if not prefix:
+            return True
+        if len(term) < MIN_PREFIX_LENGTH:
+            return False
+        first = bisect_left(self._vocab, term)
+        last = bisect_right(self._vocab, term + "\U0010ffff")
+        completions = last - first - (term in self._postings)
+        return completions <= MAX_EXPANSIONS
+
+    def term_scores(self, term, prefix=True):
+        """
+        Returns {doc_id: score} for documents containing term (or a completion of it).
+        A document matched by several completions keeps its best score.
+        """
+        scores = {}
+        total_docs = len(self._doc_tokens) or 1
+        for token, exact in self.expand(term, prefix):
+            postings = self._postings[token]
+            idf = math.log(1 + total_docs / len(postings))
+            factor = idf if exact else idf * PREFIX_PENALTY
+            for doc_id, weight in postings.items():
+                score = weight * factor
+                if score > scores.get(doc_id, 0.0):
+                    scores[doc_id] = score
+        return scores
+
+    def search(self, query, prefix=True):
+        """
+        Returns [(doc_id, score)] for documents matching every query term,
+        best match first.
+        """
+        total = None
+        for term in tokenize(query):
+            scores = self.term_scores(term, prefix)
+            if total is None:
+                total = scores
+            else:
+                total = {doc_id: total[doc_id] + s for doc_id, s in scores.items() if doc_id in total}
+            if not total:
+                return []
+        if not total:
+            return []
+        return sorted(total.items(), key=lambda kv: (-kv[1], kv[0]))
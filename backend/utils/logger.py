@@ -1,7 +1,30 @@
 # backend/utils/logger.py
+#
+# Backend logging. Callers only put records on a queue (QueueHandler); a
+# QueueListener thread formats them and does the file and console I/O, so API
+# calls never wait on the disk.
+#
+#   backend.log  -> one JSON object per line (time, level, logger, module,
+#                   thread, message, exc), rotated at LOG_MAX_BYTES (default
+#                   10 MB) keeping LOG_BACKUPS old files (default 5);
+#                   LOG_FORMAT=text writes the old plain-text lines instead
+#   console      -> plain text (LOG_CONSOLE=0 turns it off)
+#
+# Levels: LOG_LEVEL (default INFO) for everything, overridden per module with
+# LOG_LEVELS, e.g. "backend.api.orders=DEBUG,backend.database=WARNING" (the
+# longest matching module prefix wins), or at runtime with set_level().
+#
+# Pass values as arguments (logger.info("Fetched %s books", n)) rather than
+# formatting them into the message: the text is then only built, on the
+# listener thread, for records that are actually written.
 
+import atexit
+import json
 import logging
 import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # Ensure a logs directory exists
 LOG_DIR = os.path.join(os.path.dirname(__file__), "../logs")
@@ -10,23 +33,197 @@ os.makedirs(LOG_DIR, exist_ok=True)
 # Log file path
 LOG_FILE = os.path.join(LOG_DIR, "backend.log")
 
-# Configure logging
-logging.basicConfig(
-    filename=LOG_FILE,
-    level=logging.INFO,  # Change to DEBUG for more verbosity
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S"
-)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+LOG_BACKUPS = int(os.getenv("LOG_BACKUPS", "5"))
+LOG_CONSOLE = os.getenv("LOG_CONSOLE", "1") != "0"
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# -------------------------------------------------------------
+# FORMATTING
+# -------------------------------------------------------------
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per record.
+    """
+
+    def format(self, record):
+        data = {
+            "time": self.formatTime(record, DATE_FORMAT),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": getattr(record, "source_module", record.module),
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exc"] = record.exc_text
+        return json.dumps(data, default=str, ensure_ascii=False)
+
+
+# -------------------------------------------------------------
+# PER-MODULE LEVELS
+# -------------------------------------------------------------
+def _parse_level(name):
+    level = logging.getLevelName(name.strip().upper())
+    if not isinstance(level, int):
+        raise ValueError(f"Unknown log level '{name}'")
+    return level
+
+
+class ModuleLevelFilter(logging.Filter):
+    """
+    Drops records below the level configured for the module that logged them
+    (dotted path of the source file, e.g. backend.api.orders). Runs on the
+    calling thread, after the logger's own level check.
+    """
+
+    def __init__(self, default, levels=None):
+        super().__init__()
+        self.default = default
+        self.levels = dict(levels or {})
+        self._modules = {}     # pathname -> dotted module
+        self._resolved = {}    # dotted module -> level
+
+    def module_for(self, record):
+        module = self._modules.get(record.pathname)
+        if module is None:
+            path = os.path.abspath(record.pathname)
+            if path.startswith(_ROOT + os.sep):
+                module = os.path.splitext(os.path.relpath(path, _ROOT))[0].replace(os.sep, ".")
+            else:
+                module = record.module
+            self._modules[record.pathname] = module
+        return module
+
+    def level_for(self, module):
+        level = self._resolved.get(module)
+        if level is None:
+            level, best = self.default, -1
+            for prefix, configured in self.levels.items():
+                if (module == prefix or module.startswith(prefix + ".")) and len(prefix) > best:
+                    level, best = configured, len(prefix)
+            self._resolved[module] = level
+        return level
+
+    def set_level(self, module, level):
+        if module is None:
+            self.default = level
+        else:
+            self.levels[module] = level
+        self._resolved = {}
+
+    def lowest(self):
+        return min([self.default, *self.levels.values()])
+
+    def filter(self, record):
+        module = self.module_for(record)
+        record.source_module = module
+        return record.levelno >= self.level_for(module)
+
+
+def _parse_levels(spec):
+    levels = {}
+    for item in spec.split(","):
+        if item.strip():
+            module, _, level = item.partition("=")
+            levels[module.strip()] = _parse_level(level)
+    return levels
+
+
+# -------------------------------------------------------------
+# QUEUE PIPELINE
+# -------------------------------------------------------------
+_SNAPSHOT_TYPES = (dict, list, set, bytearray)
+
+
+def _snapshot(value):
+    return str(value) if isinstance(value, _SNAPSHOT_TYPES) else value
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves message formatting to the listener thread.
+    Containers passed as arguments are rendered now, since the caller may
+    change them before the record is written.
+    """
+
+    def prepare(self, record):
+        args = record.args
+        if isinstance(args, dict):
+            record.args = {key: _snapshot(value) for key, value in args.items()}
+        elif args:
+            record.args = tuple(_snapshot(value) for value in args)
+        return record
+
+
+def _file_handler():
+    handler = RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8")
+    if LOG_FORMAT == "text":
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT, datefmt=DATE_FORMAT))
+    else:
+        handler.setFormatter(JsonFormatter())
+    return handler
+
 
 # Create a named logger for the backend
 logger = logging.getLogger("BookShopBackend")
+logger.propagate = False
+
+level_filter = ModuleLevelFilter(_parse_level(LOG_LEVEL), _parse_levels(LOG_LEVELS))
+logger.addFilter(level_filter)
+logger.setLevel(level_filter.lowest())
+
+_queue = queue.SimpleQueue()
+_handlers = [_file_handler()]
+if LOG_CONSOLE:
+    # Optional console output for development
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    _handlers.append(console_handler)
+
+logger.addHandler(LazyQueueHandler(_queue))
+listener = QueueListener(_queue, *_handlers, respect_handler_level=True)
+listener.start()
+
+_stop_lock = threading.Lock()
+
+
+def set_level(level, module=None):
+    """
+    Changes the level of one module (dotted path, e.g. "backend.api.books")
+    or, without module, the default level. level is a name or a number.
+    """
+    if isinstance(level, str):
+        level = _parse_level(level)
+    level_filter.set_level(module, level)
+    logger.setLevel(level_filter.lowest())
+
+
+def shutdown():
+    """
+    Writes out queued records and stops the listener thread. Safe to call
+    more than once; runs at interpreter exit.
+    """
+    global listener
+    with _stop_lock:
+        if listener is not None:
+            listener.stop()
+            listener = None
+            for handler in _handlers:
+                handler.close()
+
 
-# Optional console output for development
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
+atexit.register(shutdown)
 
 # Example usage for testing
 if __name__ == "__main__":
@@ -0,0 +1,326 @@
+# backend/utils/metrics.py
+#
+# Per-call metrics for the API and report classes.
+#
+# @instrumented wraps every public method of a class; each call records
+#
+#   wall_ms     -> time spent in the method
+#   db_ms       -> time spent executing statements and fetching rows
+#   statements  -> statements executed
+#   rows        -> rows fetched
+#   bytes       -> approximate size of the fetched values
+#
+# into per-method histograms (see Histogram). The DB figures come from the
+# cursors of pooled connections (see TrackedCursor in connection_pool.py),
+# which report to every call running on the current thread, so a method
+# that calls another instrumented method includes its work as well.
+#
+# snapshot() feeds Backend.health_check(); with METRICS_DUMP_INTERVAL set
+# (seconds, 0 = off) a background thread appends a snapshot to
+# logs/metrics.jsonl at that interval. METRICS_ENABLED=0 turns recording off.
+
+import functools
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from backend.utils.logger import logger, LOG_DIR
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") != "0"
+DUMP_INTERVAL = float(os.getenv("METRICS_DUMP_INTERVAL", "0"))
+DUMP_FILE = os.path.join(LOG_DIR, "metrics.jsonl")
+
+# Upper bucket bounds; values above the last one land in an overflow bucket
+TIME_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 50, 100, 1000, 10000, 100000, 1000000)
+BYTE_BUCKETS = (0, 1024, 8192, 65536, 524288, 4194304, 33554432, 268435456)
+
+FIELDS = (
+    ("wall_ms", TIME_BUCKETS),
+    ("db_ms", TIME_BUCKETS),
+    ("statements", COUNT_BUCKETS),
+    ("rows", COUNT_BUCKETS),
+    ("bytes", BYTE_BUCKETS),
+)
+
+_local = threading.local()
+
+
+# -------------------------------------------------------------
+# HISTOGRAMS
+# -------------------------------------------------------------
+class Histogram:
+    """
+    Fixed-bucket histogram. Percentiles are estimated as the upper bound of
+    the bucket they fall in (capped at the largest value seen).
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, value):
+        index = 0
+        for bound in self.bounds:
+            if value <= bound:
+                break
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q):
+        if not self.count:
+            return 0
+        rank = q * self.count
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                bound = self.bounds[index] if index < len(self.bounds) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self, buckets=False):
+        data = {
+            "mean": round(self.total / self.count, 3) if self.count else 0,
+            "p50": round(self.percentile(0.50), 3),
+            "p95": round(self.percentile(0.95), 3),
+            "p99": round(self.percentile(0.99), 3),
+            "max": round(self.max, 3),
+            "total": round(self.total, 3),
+        }
+        if buckets:
+            labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+            data["buckets"] = {label: n for label, n in zip(labels, self.counts) if n}
+        return data
+
+
+class MethodStats:
+    __slots__ = ("calls", "errors", "histograms")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.histograms = {name: Histogram(bounds) for name, bounds in FIELDS}
+
+
+class _Call:
+    """
+    Counters of one running call; cursors add to them.
+    """
+
+    __slots__ = ("db_time", "statements", "rows", "bytes")
+
+    def __init__(self):
+        self.db_time = 0.0
+        self.statements = 0
+        self.rows = 0
+        self.bytes = 0
+
+
+# -------------------------------------------------------------
+# REGISTRY
+# -------------------------------------------------------------
+class MetricsRegistry:
+    """
+    Thread-safe map of method name -> MethodStats.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._methods = {}
+        self._started = datetime.now()
+
+    def record(self, name, wall_time, call, failed):
+        with self._lock:
+            stats = self._methods.get(name)
+            if stats is None:
+                stats = self._methods[name] = MethodStats()
+            stats.calls += 1
+            if failed:
+                stats.errors += 1
+            histograms = stats.histograms
+            histograms["wall_ms"].add(wall_time * 1000)
+            histograms["db_ms"].add(call.db_time * 1000)
+            histograms["statements"].add(call.statements)
+            histograms["rows"].add(call.rows)
+            histograms["bytes"].add(call.bytes)
+
+    def snapshot(self, buckets=False):
+        """
+        {method: {"calls", "errors", "wall_ms": {...}, "db_ms": {...}, ...}},
+        slowest (by total wall time) first.
+        """
+        with self._lock:
+            data = {}
+            for name, stats in self._methods.items():
+                entry = {"calls": stats.calls, "errors": stats.errors}
+                for field, histogram in stats.histograms.items():
+                    entry[field] = histogram.snapshot(buckets)
+                data[name] = entry
+        return dict(sorted(data.items(), key=lambda item: item[1]["wall_ms"]["total"], reverse=True))
+
+    def reset(self):
+        with self._lock:
+            self._methods.clear()
+            self._started = datetime.now()
+
+    @property
+    def started(self):
+        return self._started
+
+
+registry = MetricsRegistry()
+
+
+# -------------------------------------------------------------
+# RECORDING
+# -------------------------------------------------------------
+def _active_calls():
+    return getattr(_local, "calls", None)
+
+
+def record_statement(elapsed):
+    """
+    Called by cursors after each execute(); elapsed in seconds.
+    """
+    calls = _active_calls()
+    if calls:
+        for call in calls:
+            call.statements += 1
+            call.db_time += elapsed
+
+
+def record_fetch(elapsed, rows):
+    """
+    Called by cursors after each fetch with the rows it returned.
+    """
+    calls = _active_calls()
+    if not calls:
+        return
+    size = 0
+    for row in rows:
+        for value in (row.values() if isinstance(row, dict) else row):
+            size += len(value) if isinstance(value, (str, bytes, bytearray)) else 8
+    for call in calls:
+        call.db_time += elapsed
+        call.rows += len(rows)
+        call.bytes += size
+
+
+def tracking():
+    """
+    True while an instrumented call runs on this thread (cursors skip the
+    bookkeeping otherwise).
+    """
+    return bool(_active_calls())
+
+
+def _failed(result):
+    return isinstance(result, dict) and result.get("status") == "error"
+
+
+def timed(name):
+    """
+    Decorator recording calls of a function under name.
+    """
+    def decorator(func):
+        if not METRICS_ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            calls = _active_calls()
+            if calls is None:
+                calls = _local.calls = []
+            call = _Call()
+            calls.append(call)
+            failed = True
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+                failed = _failed(result)
+                return result
+            finally:
+                wall_time = time.perf_counter() - start
+                calls.pop()
+                registry.record(name, wall_time, call, failed)
+        return wrapper
+    return decorator
+
+
+def instrumented(cls):
+    """
+    Class decorator applying timed() to every public method defined on cls,
+    recorded as "ClassName.method".
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not callable(value) or isinstance(value, (staticmethod, classmethod, type)):
+            continue
+        setattr(cls, attr, timed(f"{cls.__name__}.{attr}")(value))
+    return cls
+
+
+def snapshot(buckets=False):
+    return registry.snapshot(buckets)
+
+
+def reset():
+    registry.reset()
+
+
+# -------------------------------------------------------------
+# PERIODIC DUMP
+# -------------------------------------------------------------
+_dump_thread = None
+_dump_stop = threading.Event()
+
+
+def dump(path=DUMP_FILE):
+    """
+    Appends one JSON line {"time", "since", "methods"} to path.
+    """
+    line = json.dumps({
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "since": registry.started.isoformat(timespec="seconds"),
+        "methods": registry.snapshot(buckets=True),
+    })
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
+def start_dump(interval=DUMP_INTERVAL, path=DUMP_FILE):
+    """
+    Starts a daemon thread calling dump(path) every interval seconds.
+    Does nothing when interval is 0 or a dump thread is already running.
+    """
+    global _dump_thread
+    if not interval or (_dump_thread is not None and _dump_thread.is_alive()):
+        return False
+
+    def run():
+        while not _dump_stop.wait(interval):
+            try:
+                dump(path)
+            except OSError as e:
+                logger.error("[METRICS] Could not write %s: %s", path, e)
+
+    _dump_stop.clear()
+    _dump_thread = threading.Thread(target=run, name="metrics-dump", daemon=True)
+    _dump_thread.start()
+    logger.info("[METRICS] Dumping API metrics to %s every %ss", path, interval)
+    return True
+
+
+def stop_dump():
+    _dump_stop.set()
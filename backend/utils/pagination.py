@@ -0,0 +1,152 @@
+# backend/utils/pagination.py
+
+import base64
+import json
+
+# Largest page a caller may request; bigger values are clamped.
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(values):
+    """
+    Encodes the keyset values of the last row on a page into an opaque token.
+    """
+    raw = json.dumps(list(values), default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(token):
+    """
+    Decodes a token produced by encode_cursor().
+    Raises ValueError if the token is malformed.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8"))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or not values:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def normalize_limit(limit):
+    """
+    Returns None (no paging) or a page size clamped to MAX_PAGE_SIZE.
+    Raises ValueError for non-positive or non-numeric limits.
+    """
+    if limit is None:
+        return None
+    try:
+        limit = int(limit)
+    except (ValueError, TypeError):
+        raise ValueError("limit must be a positive integer")
+    if limit <= 0:
+        raise ValueError("limit must be a positive integer")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def build_keyset_query(base_sql, where_clauses, params, pk_column,
+                       limit=None, after=None, sort_column=None, descending=False):
+    """
+    Appends keyset WHERE / ORDER BY / LIMIT clauses to base_sql.
+
+    - pk_column: unique tie-breaker, e.g. "b.book_id"
+    - sort_column: optional NOT NULL column to sort by before the primary key
+    - after: cursor token from a previous page's next_cursor
+
+    One extra row is requested so the caller can tell whether more pages exist.
+    Returns (sql, params).
+    """
+    where = list(where_clauses)
+    params = list(params)
+    op = "<" if descending else ">"
+
+    if after:
+        values = decode_cursor(after)
+        if sort_column:
+            if len(values) != 2:
+                raise ValueError("Invalid cursor")
+            where.append(f"{sort_column} {op} %s OR ({sort_column} = %s AND {pk_column} {op} %s)")
+            params += [values[0], values[0], values[1]]
+        else:
+            where.append(f"{pk_column} {op} %s")
+            params.append(values[0])
+
+    sql = base_sql
+    if where:
+        sql += " WHERE " + " AND ".join(f"({w})" for w in where)
+
+    direction = "DESC" if descending else "ASC"
+    order = [f"{sort_column} {direction}"] if sort_column else []
+    order.append(f"{pk_column} {direction}")
+    sql += " ORDER BY " + ", ".join(order)
+
+    if limit:
+        sql += " LIMIT %s"
+        params.append(limit + 1)
+    return sql, params
+
+
+def keyset_query(base_sql, where_clauses, params, pk_field, pk_column=None,
+                 sort_columns=None, limit=None, after=None, order_by=None, descending=False):
+    """
+    Validates the paging arguments of a listing endpoint and builds its query.
+
+    - pk_field / pk_column: primary key as it appears in result rows / in SQL
+      (pk_column defaults to pk_field)
+    - sort_columns: {order_by name: SQL column} the endpoint allows sorting by
+
+    Returns (sql, params, limit, key_fields) for use with page_rows().
+    Raises ValueError on a bad limit, cursor or sort column.
+    """
+    sort_columns = sort_columns or {}
+    if order_by and order_by not in sort_columns:
+        raise ValueError(f"Invalid sort column '{order_by}'")
+    limit = normalize_limit(limit)
+    sql, params = build_keyset_query(
+        base_sql, where_clauses, params, pk_column or pk_field,
+        limit=limit, after=after,
+        sort_column=sort_columns.get(order_by), descending=descending
+    )
+    key_fields = [order_by, pk_field] if order_by else [pk_field]
+    return sql, params, limit, key_fields
+
+
+def page_rows(rows, limit, key_fields):
+    """
+    Trims the look-ahead row fetched by build_keyset_query().
+    key_fields are the row keys the cursor is built from, in keyset order.
+    Returns (rows, next_cursor, has_more).
+    """
+    if not limit:
+        return rows, None, False
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(rows[-1][f] for f in key_fields) if has_more else None
+    return rows, next_cursor, has_more
+
+
+def ranked_page(search, limit=None, after=None):
+    """
+    Pages through a relevance-ranked search (see backend/search).
+
+    - search(limit, after_key): returns (hits, total) with hits as
+      [(id, score)] best first, ranked below after_key = (score, id)
+    - after: cursor token from a previous page's next_cursor
+
+    Returns (hits, total, next_cursor, has_more).
+    Raises ValueError on a bad limit or cursor.
+    """
+    limit = normalize_limit(limit)
+    after_key = None
+    if after:
+        values = decode_cursor(after)
+        if len(values) != 2 or not isinstance(values[0], (int, float)):
+            raise ValueError("Invalid cursor")
+        after_key = (float(values[0]), values[1])
+
+    hits, total = search(limit + 1 if limit else None, after_key)
+    has_more = bool(limit) and len(hits) > limit
+    hits = hits[:limit] if limit else hits
+    next_cursor = encode_cursor([hits[-1][1], hits[-1][0]]) if has_more else None
+    return hits, total, next_cursor, has_more
@@ -0,0 +1,82 @@
+# backend/utils/passwords.py
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+from backend.utils.logger import logger
+
+# bcrypt cost factor for new hashes (2^rounds iterations). Raising it makes
+# existing hashes get upgraded on the next successful login.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# Hashing threads; bcrypt releases the GIL, so these run in parallel
+HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+
+_ROUNDS_RE = re.compile(r"^\$2[abxy]?\$(\d{2})\$")
+
+if not 4 <= BCRYPT_ROUNDS <= 31:
+    raise ValueError(f"BCRYPT_ROUNDS must be between 4 and 31, got {BCRYPT_ROUNDS}")
+
+
+def hash_password(password, rounds=None):
+    """
+    Returns the bcrypt hash of password as a str.
+    """
+    salt = bcrypt.gensalt(rounds or BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def check_password(password, password_hash):
+    """
+    True if password matches password_hash. Malformed hashes never match.
+    """
+    try:
+        return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+    except ValueError:
+        logger.warning("[PASSWORDS] Malformed password hash")
+        return False
+
+
+def hash_rounds(password_hash):
+    """
+    Returns the cost factor stored in a bcrypt hash, or None if unreadable.
+    """
+    match = _ROUNDS_RE.match(password_hash or "")
+    return int(match.group(1)) if match else None
+
+
+def needs_rehash(password_hash, rounds=None):
+    """
+    True if password_hash was made with a different cost than the configured one.
+    """
+    return hash_rounds(password_hash) != (rounds or BCRYPT_ROUNDS)
+
+
+# -------------------------------------------------------------
+# WORKER POOL
+# -------------------------------------------------------------
+_pool = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="password-hash")
+
+
+def submit(func, *args, callback=None):
+    """
+    Runs func(*args) on the password hashing pool and returns its Future.
+
+    func is expected to return an API response dict. If it raises, the Future
+    resolves to an error response instead. callback, if given, is called with
+    the response on the worker thread (GUI code must hand it back to its own
+    thread, e.g. by polling the Future with after()).
+    """
+    def run():
+        try:
+            return func(*args)
+        except Exception as e:
+            logger.error("[PASSWORDS] %s failed: %s", getattr(func, '__name__', func), e)
+            return {"status": "error", "message": str(e)}
+
+    future = _pool.submit(run)
+    if callback:
+        future.add_done_callback(lambda f: callback(f.result()))
+    return future
@@ -0,0 +1,33 @@
+# backend/utils/projection.py
+
+
+def check_fields(fields, columns):
+    """
+    Raises ValueError for a field the endpoint does not know.
+    """
+    unknown = [f for f in fields if f not in columns]
+    if unknown:
+        raise ValueError(f"Invalid field '{unknown[0]}'")
+
+
+def select_list(fields, columns, key_fields=()):
+    """
+    Builds the SELECT list of a projected query.
+
+    - fields: record keys the caller wants
+    - columns: {record key: SQL expression} the endpoint can select
+    - key_fields: keys that are always selected (primary key, sort column),
+      since paging builds its cursor from them
+
+    Raises ValueError for a field the endpoint does not know.
+    """
+    check_fields(fields, columns)
+    selected = list(dict.fromkeys(list(key_fields) + list(fields)))
+    return ", ".join(columns[f] for f in selected)
+
+
+def pick(record, fields):
+    """
+    Returns only the given keys of an already built record dict.
+    """
+    return {f: record.get(f) for f in fields}
@@ -0,0 +1,59 @@
+# backend/utils/sessions.py
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import time
+
+# Seconds a session token stays valid
+SESSION_TTL = int(os.getenv("SESSION_TTL", "28800"))
+# Signing key. Without SESSION_SECRET a random key is used, so tokens only
+# verify in the process that issued them and expire when the app restarts.
+_SECRET = os.getenv("SESSION_SECRET", "").encode("utf-8") or secrets.token_bytes(32)
+
+
+def _b64encode(raw):
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text):
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _sign(payload):
+    return hmac.new(_SECRET, payload.encode("ascii"), hashlib.sha256).digest()
+
+
+def issue_token(staff_id, username, role, ttl=None):
+    """
+    Returns a signed token carrying the staff member's id, username, role and
+    expiry time. The token is not encrypted: claims are readable, not forgeable.
+    """
+    claims = {
+        "staff_id": staff_id,
+        "username": username,
+        "role": role,
+        "exp": int(time.time()) + (ttl or SESSION_TTL),
+    }
+    payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+    return f"{payload}.{_b64encode(_sign(payload))}"
+
+
+def verify_token(token):
+    """
+    Returns the token's claims, or None if it is malformed, was not signed
+    with this key or has expired. No database access.
+    """
+    try:
+        payload, signature = token.split(".")
+        if not hmac.compare_digest(_b64decode(signature), _sign(payload)):
+            return None
+        claims = json.loads(_b64decode(payload).decode("utf-8"))
+    except Exception:
+        return None
+    if not isinstance(claims, dict) or claims.get("exp", 0) <= time.time():
+        return None
+    return claims
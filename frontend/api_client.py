@@ -1,15 +1,22 @@
 # frontend/api_client.py
+from collections.abc import Mapping
+
 from backend.api import books, staff, authors, categories, publishers, customers, orders, payments, reports
 
 # -----------------------------
 # Helper to normalize API responses
 # -----------------------------
-def handle_response(func, *args, fields=None, **kwargs):
+def handle_response(func, *args, fields=None, push_down=False, **kwargs):
     """
     Call a backend API function.
     - Returns only 'data' if success, else None.
     - Filters fields if 'fields' is provided.
+    - With push_down=True, 'fields' is passed to the backend instead, which
+      then selects only those columns (see BookAPI.get_all); nothing is
+      filtered afterwards.
     """
+    if push_down:
+        kwargs["fields"], fields = fields, None
     try:
         resp = func(*args, **kwargs)
         if resp.get("status") == "error":
@@ -20,7 +27,7 @@ def handle_response(func, *args, fields=None, **kwargs):
         if fields:
             if isinstance(data, list):
                 data = [{k: v for k, v in item.items() if k in fields} for item in data]
-            elif isinstance(data, dict):
+            elif isinstance(data, Mapping):
                 data = {k: v for k, v in data.items() if k in fields}
         return data
     except Exception as e:
@@ -28,6 +35,30 @@ def handle_response(func, *args, fields=None, **kwargs):
         return None
 
 
+def handle_page(func, *args, fields=None, push_down=False, **kwargs):
+    """
+    Like handle_response, for paged listings: returns
+    {"rows": [...], "next_cursor": str|None, "has_more": bool, "exhaustive": bool},
+    or None on error. exhaustive is False when a ranked search cut off the
+    completions of a prefix term (see BookSearchIndex.is_exhaustive).
+    """
+    if push_down:
+        kwargs["fields"], fields = fields, None
+    try:
+        resp = func(*args, **kwargs)
+        if resp.get("status") == "error":
+            print(f"API error: {resp.get('message')}")
+            return None
+        rows = resp.get("data") or []
+        if fields:
+            rows = [{k: v for k, v in item.items() if k in fields} for item in rows]
+        return {"rows": rows, "next_cursor": resp.get("next_cursor"), "has_more": resp.get("has_more", False),
+                "exhaustive": resp.get("exhaustive", True)}
+    except Exception as e:
+        print(f"API exception: {e}")
+        return None
+
+
 # -----------------------------
 # Staff / Authentication
 # -----------------------------
@@ -71,17 +102,31 @@ class StaffClient:
 class BooksClient:
     def __init__(self):
         self.api = books.BookAPI()
-        self.fields = ["book_id", "title", "description", "author", "publisher_name", "stock", "price", "genre"]
+        # Listing columns, selected by the backend (no description)
+        self.fields = ["book_id", "title", "author", "publisher_name", "stock", "price", "genre", "isbn"]
+        # Single book, for the details popup and edit form
+        self.detail_fields = self.fields + [
+            "author_id", "publisher_id", "category_id", "language", "publication_year", "description"
+        ]
 
     def get_all(self):
-        return handle_response(self.api.get_all, fields=self.fields)
+        return handle_response(self.api.get_all, fields=self.fields, push_down=True)
 
     def get_by_id(self, book_id):
-        fields = self.fields + ["description"]
-        return handle_response(self.api.get_by_id, book_id, fields=fields)
+        return handle_response(self.api.get_by_id, book_id, fields=self.detail_fields, push_down=True)
 
     def search_by(self, field, query):
-        return handle_response(self.api.search, field, query, fields=self.fields)
+        return handle_response(self.api.search, field, query, fields=self.fields, push_down=True)
+
+    # Paged variants: one page per call, see handle_page()
+    def get_page(self, limit, after=None, order_by=None, descending=False):
+        return handle_page(self.api.get_all, limit, after, order_by, descending,
+                           fields=self.fields, push_down=True)
+
+    def search_page(self, field, query, limit, after=None, order_by=None, descending=False):
+        return handle_page(self.api.search, field, query, limit, after, order_by, descending,
+                           fields=self.fields, push_down=True)
+
     # --- inside frontend/api_client.py, in BooksClient class ---
 
     def add(self, book_data):
@@ -114,18 +159,28 @@ class BooksClient:
 class AuthorsClient:
     def __init__(self):
         self.api = authors.AuthorsAPI()
-        self.fields = ["author_id", "full_name", "country", "birth_year", "bio", "email"]
+        # Listing columns, selected by the backend (no bio)
+        self.fields = ["author_id", "full_name", "country", "birth_year"]
+        self.detail_fields = self.fields + ["death_year", "bio"]
 
     def get_all(self):
-        """Return list of authors (filtered to UI fields) or None."""
-        return handle_response(self.api.get_all, fields=self.fields)
+        """Return list of authors (UI fields only) or None."""
+        return handle_response(self.api.get_all, fields=self.fields, push_down=True)
 
     def get_by_id(self, author_id):
         """Return single author dict or None."""
-        return handle_response(self.api.get_by_id, author_id, fields=self.fields)
+        return handle_response(self.api.get_by_id, author_id, fields=self.detail_fields)
     
     def search_by(self, field, query):
-        return handle_response(self.api.search, field, query, fields=self.fields)
+        return handle_response(self.api.search, field, query, fields=self.fields, push_down=True)
+
+    def get_page(self, limit, after=None, order_by=None, descending=False):
+        return handle_page(self.api.get_all, limit, after, order_by, descending,
+                           fields=self.fields, push_down=True)
+
+    def search_page(self, field, query, limit, after=None, order_by=None, descending=False):
+        return handle_page(self.api.search, field, query, limit, after, order_by, descending,
+                           fields=self.fields, push_down=True)
 
     def add(self, author_data):
         """
@@ -203,6 +258,12 @@ class PublishersClient:
     def search_by(self, field, query):
         return handle_response(self.api.search_by, field, query, fields=self.fields)
 
+    def get_page(self, limit, after=None, order_by=None, descending=False):
+        return handle_page(self.api.get_all, limit, after, order_by, descending, fields=self.fields)
+
+    def search_page(self, field, query, limit, after=None, order_by=None, descending=False):
+        return handle_page(self.api.search_by, field, query, limit, after, order_by, descending, fields=self.fields)
+
 
 # -----------------------------
 # Customers
@@ -275,17 +336,27 @@ class PaymentsClient:
 # Users
 # -----------------------------
 class UsersClient:
+    """
+    The logged-in staff member's own account. Every call takes the session
+    token returned at login (StaffClient.authenticate()["token"]).
+    """
     def __init__(self):
         self.api = staff.StaffAPI()
 
-    def get_profile(self, username):
-        return handle_response(self.api.get_profile, full_name=username)
+    def get_session(self, token):
+        return handle_response(self.api.get_session, token)
+
+    def get_profile(self, token):
+        return handle_response(self.api.get_profile, token)
 
-    def update_profile(self, user_id, fields):
-        return handle_response(self.api.update_profile, user_id, fields)
+    def update_profile(self, token, fields):
+        return handle_response(self.api.update_profile, token, fields)
 
-    def change_password(self, user_id, old, new):
-        return handle_response(self.api.change_password, user_id, old, new)
+    def change_password(self, token, old, new):
+        session = self.get_session(token)
+        if session is None:
+            return None
+        return handle_response(self.api.change_password, session["staff_id"], old, new)
 
 
 # -----------------------------
@@ -303,20 +374,25 @@ class ReportsClient:
         # returns list of {book_id, title, author, publisher, stock, price, ...}
         return handle_response(self.api.get_current_stock, fields=None)
 
-    def get_low_stock(self, threshold=10):
-        return handle_response(self.api.get_low_stock, threshold, fields=None)
+    def get_low_stock(self, threshold=10, category_id=None, publisher_id=None, limit=None):
+        return handle_response(self.api.get_low_stock, threshold, category_id, publisher_id, limit, fields=None)
 
-    def get_top_books(self):
-        return handle_response(self.api.get_top_selling_books, fields=None)
+    def get_top_books(self, limit=10, start=None, end=None, window=None):
+        return handle_response(self.api.get_top_selling_books, limit, start, end, window, fields=None)
     
     def get_summary(self):
         return handle_response(self.api.get_category_stock_summary, fields=None)
 
-    def get_total_sales(self, date=None):
-        return handle_response(self.api.get_daily_sales_plot_data, date, fields=None)
+    def get_total_sales(self, date=None, start_date=None, end_date=None):
+        # a single date means that one day
+        if date:
+            start_date = end_date = date
+        return handle_response(self.api.get_daily_sales_plot_data, start_date, end_date, fields=None)
 
-    def get_daily_sales_report(self, date=None):
-        return handle_response(self.api.get_daily_sales, date, fields=None)
+    def get_daily_sales_report(self, date=None, start_date=None, end_date=None):
+        if date:
+            start_date = end_date = date
+        return handle_response(self.api.get_daily_sales, start_date, end_date, fields=None)
 
 
 # -----------------------------
@@ -0,0 +1,173 @@
+# frontend/background.py
+
+import os
+import queue
+import time
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+
+# Threads running API client calls for the views
+WORKERS = int(os.getenv("UI_WORKERS", "4"))
+# How often the Tk thread checks for finished calls while any are running
+POLL_INTERVAL_MS = 16
+# Time the Tk thread may spend per check handing out results (under one 60 fps frame)
+FRAME_BUDGET = 0.010
+
+
+class Task:
+    """
+    Handle for one background call. cancel() drops its result; a call that
+    has not started yet is not run at all.
+    """
+
+    def __init__(self, runner, widget, slot, on_done, on_error, indicator):
+        self.runner = runner
+        self.widget = widget
+        self.slot = slot
+        self.on_done = on_done
+        self.on_error = on_error
+        self.indicator = indicator
+        self.future = None
+        self.cancelled = False
+        self.finished = False
+
+    def cancel(self):
+        self.runner.cancel(self)
+
+
+class BackgroundRunner:
+    """
+    Runs frontend/api_client calls on a shared thread pool and hands the
+    results back on the Tk thread.
+
+    Calls are keyed per widget: submitting a new call with the same widget
+    and key cancels the previous one, so a slow answer to an old request
+    (e.g. the previous entity in a search screen) never overwrites a newer
+    one. Results for destroyed widgets are dropped.
+
+    All methods except the worker side must be called from the Tk thread.
+    """
+
+    def __init__(self, workers=WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ui-call")
+        self._results = queue.Queue()
+        self._latest = {}       # (widget path, key) -> Task
+        self._outstanding = 0   # submitted calls whose result has not been collected
+        self._root = None       # Tk root being polled, None when idle
+
+    def submit(self, widget, key, func, *args, on_done=None, on_error=None, indicator=None, **kwargs):
+        """
+        Runs func(*args, **kwargs) in the background and calls on_done(result)
+        (or on_error(exception)) on the Tk thread. indicator, if given, is
+        started now and stopped when the call finishes or is cancelled.
+        Returns the Task.
+        """
+        slot = (str(widget), key)
+        previous = self._latest.get(slot)
+        if previous is not None:
+            self.cancel(previous)
+
+        task = Task(self, widget, slot, on_done, on_error, indicator)
+        self._latest[slot] = task
+        if indicator is not None:
+            indicator.start()
+
+        self._outstanding += 1
+        task.future = self._executor.submit(self._run, task, func, args, kwargs)
+        self._start_polling(widget)
+        return task
+
+    def cancel_for(self, widget, key):
+        """
+        Cancels the call last submitted for (widget, key), if still running.
+        """
+        task = self._latest.get((str(widget), key))
+        if task is not None:
+            self.cancel(task)
+
+    def cancel(self, task):
+        if task.cancelled or task.finished:
+            return
+        task.cancelled = True
+        self._finish(task)
+        if task.future.cancel():
+            self._outstanding -= 1   # never ran, so it will not report back
+
+    # -------------------------------------------------------------
+    # WORKER SIDE
+    # -------------------------------------------------------------
+    def _run(self, task, func, args, kwargs):
+        if task.cancelled:
+            self._results.put((task, None, None))
+            return
+        try:
+            self._results.put((task, func(*args, **kwargs), None))
+        except Exception as e:
+            self._results.put((task, None, e))
+
+    # -------------------------------------------------------------
+    # TK SIDE
+    # -------------------------------------------------------------
+    def _start_polling(self, widget):
+        if self._root is None:
+            self._root = widget._root()
+            self._root.after(POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        deadline = time.perf_counter() + FRAME_BUDGET
+        while time.perf_counter() < deadline:
+            try:
+                task, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._outstanding -= 1
+            self._deliver(task, result, error)
+
+        if self._outstanding > 0:
+            try:
+                self._root.after(POLL_INTERVAL_MS, self._poll)
+                return
+            except tk.TclError:
+                pass  # application closed
+        self._root = None
+
+    def _deliver(self, task, result, error):
+        if task.cancelled:
+            return
+        self._finish(task)
+        if not self._alive(task.widget):
+            return
+        if error is not None:
+            if task.on_error:
+                task.on_error(error)
+            else:
+                print(f"Background call failed: {error}")
+        elif task.on_done:
+            task.on_done(result)
+
+    def _finish(self, task):
+        task.finished = True
+        if self._latest.get(task.slot) is task:
+            del self._latest[task.slot]
+        if task.indicator is not None and self._alive(task.indicator):
+            task.indicator.stop()
+
+    @staticmethod
+    def _alive(widget):
+        try:
+            return bool(widget.winfo_exists())
+        except tk.TclError:
+            return False
+
+
+# -------------------------------------------------------------
+# SHARED RUNNER
+# -------------------------------------------------------------
+background = BackgroundRunner()
+
+
+def run_in_background(widget, key, func, *args, **kwargs):
+    """
+    Shortcut for background.submit(); see BackgroundRunner.submit.
+    """
+    return background.submit(widget, key, func, *args, **kwargs)
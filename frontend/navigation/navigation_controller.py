@@ -2,6 +2,7 @@
 
 import tkinter as tk
 
+from frontend.app_state import AppState
 from frontend.views.login_view import LoginView
 from frontend.views.home_search_view import HomeSearchView
 from frontend.views.profile_view import ProfileView
@@ -58,10 +59,12 @@ class NavigationController:
         user_object contains: user_id, username, role, privileges...
         """
         self.user = user_object
+        AppState.get_instance().current_user = user_object
         self.show_home()
 
     def logout(self):
         self.user = None
+        AppState.get_instance().current_user = None
         self.show_login()
 
     def show_home(self):
@@ -4,7 +4,9 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 
 from frontend.api_client import AuthorsClient
+from frontend.background import run_in_background
 from frontend.views.details_popup import DetailsPopup  # optional; show on double click
+from frontend.views.components.loading_indicator import LoadingIndicator
 
 class AuthorFormDialog(simpledialog.Dialog):
     """
@@ -81,6 +83,7 @@ class ManageAuthorsView(tk.Frame):
         self.pack(fill="both", expand=True)
         self._row_map = {}
         self.build_ui()
+        self.loading = LoadingIndicator(self)
         self.load_authors()
 
     def build_ui(self):
@@ -114,10 +117,13 @@ class ManageAuthorsView(tk.Frame):
         self.tree.configure(yscrollcommand=sy.set)
 
     def load_authors(self):
+        run_in_background(self, "records", self.client.get_all,
+                          on_done=self.show_authors, indicator=self.loading)
+
+    def show_authors(self, authors):
         self.tree.delete(*self.tree.get_children())
         self._row_map.clear()
-        authors = self.client.get_all() or []
-        for a in authors:
+        for a in authors or []:
             vals = (
                 a.get("author_id"),
                 a.get("full_name", ""),
@@ -149,6 +155,11 @@ class ManageAuthorsView(tk.Frame):
         iid, record = self.get_selected()
         if not record:
             return
+        # Listing rows leave out the bio; load the whole author
+        run_in_background(self, "details", self.client.get_by_id, record.get("author_id"),
+                          on_done=lambda full: self.open_edit_form(full or record), indicator=self.loading)
+
+    def open_edit_form(self, record):
         initial = {
             "name": record.get("name"),
             "country": record.get("country"),
@@ -185,6 +196,10 @@ class ManageAuthorsView(tk.Frame):
         record = self._row_map.get(iid)
         if not record:
             return
+        run_in_background(self, "details", self.client.get_by_id, record.get("author_id"),
+                          on_done=lambda full: self.show_details(full or record), indicator=self.loading)
+
+    def show_details(self, record):
         # show details popup if available
         try:
             DetailsPopup(self, "Authors", record)
@@ -4,7 +4,9 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 
 from frontend.api_client import BooksClient
+from frontend.background import run_in_background
 from frontend.utils import format_currency, truncate_text
+from frontend.views.components.virtual_table import VirtualTable
 
 class BookFormDialog(simpledialog.Dialog):
     """
@@ -110,39 +112,23 @@ class ManageBooksView(tk.Frame):
         if self.go_back:
             tk.Button(btn_frame, text="Back", command=self.go_back).pack(side="left", padx=5)
 
-        # Table
-        cols = ("book_id", "title", "author_name", "publisher_name", "price", "stock")
-        self.tree = ttk.Treeview(self, columns=cols, show="headings")
-        for c in cols:
-            self.tree.heading(c, text=c.replace("_", " ").title())
-            self.tree.column(c, width=140, anchor="w")
-        self.tree.pack(fill="both", expand=True, padx=10, pady=(0,10))
+        # Table: only the visible rows are materialized, pages load on scroll
+        cols = ("book_id", "title", "author", "publisher_name", "price", "stock")
+        self.table = VirtualTable(self, columns=cols, formatters={
+            "title": lambda v: truncate_text(v or "", 60),
+            "price": lambda v: format_currency(v or 0),
+        })
+        self.table.pack(fill="both", expand=True, padx=10, pady=(0,10))
+        self.tree = self.table.tree
 
-        # store row mapping
-        self._row_map = {}
+        # store row mapping (rows on screen)
+        self._row_map = self.table.row_data
 
         # double click opens details (reuse existing detail popup if you have it)
         self.tree.bind("<Double-1>", self.on_double)
 
-        # Scrollbars
-        sy = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
-        sy.place(relx=0.985, rely=0.12, relheight=0.75)
-        self.tree.configure(yscrollcommand=sy.set)
-
     def load_books(self):
-        self.tree.delete(*self.tree.get_children())
-        books = self.client.get_all() or []
-        for b in books:
-            vals = (
-                b.get("book_id"),
-                truncate_text(b.get("title", ""), 60),
-                b.get("author_name", ""),
-                b.get("publisher_name", ""),
-                format_currency(b.get("price", 0)),
-                b.get("copies_available", 0)
-            )
-            iid = self.tree.insert("", "end", values=vals)
-            self._row_map[iid] = b
+        self.table.load(self.client.get_page, {"title": "title", "price": "price"})
 
     def get_selected_record(self):
         sel = self.tree.selection()
@@ -166,6 +152,11 @@ class ManageBooksView(tk.Frame):
         iid, record = self.get_selected_record()
         if not record:
             return
+        # Listing rows leave out the description and ids; load the whole book
+        run_in_background(self, "details", self.client.get_by_id, record.get("book_id"),
+                          on_done=lambda full: self.open_edit_form(full or record), indicator=self.table.loading)
+
+    def open_edit_form(self, record):
         # Provide initial data shaped for the form
         initial = {
             "title": record.get("title"),
@@ -208,6 +199,10 @@ class ManageBooksView(tk.Frame):
         record = self._row_map.get(iid)
         if not record:
             return
+        run_in_background(self, "details", self.client.get_by_id, record.get("book_id"),
+                          on_done=lambda full: self.show_details(full or record), indicator=self.table.loading)
+
+    def show_details(self, record):
         # if you have DetailsPopup, show it; else open edit form
         try:
             from frontend.views.details_popup import DetailsPopup
@@ -4,7 +4,9 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 
 from frontend.api_client import CategoriesClient
+from frontend.background import run_in_background
 from frontend.views.details_popup import DetailsPopup  # optional popup
+from frontend.views.components.loading_indicator import LoadingIndicator
 
 
 class CategoryFormDialog(simpledialog.Dialog):
@@ -54,6 +56,7 @@ class ManageCategoriesView(tk.Frame):
         self._row_map = {}
 
         self.build_ui()
+        self.loading = LoadingIndicator(self)
         self.load_categories()
 
     def build_ui(self):
@@ -89,11 +92,14 @@ class ManageCategoriesView(tk.Frame):
         self.tree.configure(yscrollcommand=sy.set)
 
     def load_categories(self):
+        run_in_background(self, "records", self.client.get_all,
+                          on_done=self.show_categories, indicator=self.loading)
+
+    def show_categories(self, cats):
         self.tree.delete(*self.tree.get_children())
         self._row_map.clear()
 
-        cats = self.client.get_all() or []
-        for c in cats:
+        for c in cats or []:
             vals = (c.get("category_id"), c.get("name", ""), c.get("description", ""))
             iid = self.tree.insert("", "end", values=vals)
             self._row_map[iid] = c
@@ -4,7 +4,9 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 
 from frontend.api_client import CustomersClient
+from frontend.background import run_in_background
 from frontend.views.details_popup import DetailsPopup
+from frontend.views.components.loading_indicator import LoadingIndicator
 
 
 class CustomerFormDialog(simpledialog.Dialog):
@@ -68,6 +70,7 @@ class ManageCustomersView(tk.Frame):
         self._row_map = {}
 
         self.build_ui()
+        self.loading = LoadingIndicator(self)
         self.load_customers()
 
     def build_ui(self):
@@ -102,11 +105,14 @@ class ManageCustomersView(tk.Frame):
         self.tree.configure(yscrollcommand=scrollbar.set)
 
     def load_customers(self):
+        run_in_background(self, "records", self.client.get_all,
+                          on_done=self.show_customers, indicator=self.loading)
+
+    def show_customers(self, customers):
         self.tree.delete(*self.tree.get_children())
         self._row_map.clear()
 
-        customers = self.client.get_all() or []
-        for c in customers:
+        for c in customers or []:
             vals = (
                 c.get("customer_id"),
                 c.get("name", ""),
@@ -4,7 +4,9 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 
 from frontend.api_client import BooksClient, ReportsClient
+from frontend.background import run_in_background
 from frontend.utils import format_currency
+from frontend.views.components.loading_indicator import LoadingIndicator
 from frontend.views.details_popup import DetailsPopup
 
 
@@ -81,6 +83,7 @@ class ManageInventoryView(tk.Frame):
         self.tree.column("price", width=80, anchor="e")
 
         self.tree.pack(fill="both", expand=True)
+        self.loading = LoadingIndicator(table_frame)
 
         # Events
         self.tree.bind("<Double-1>", self.on_double_click)
@@ -90,25 +93,8 @@ class ManageInventoryView(tk.Frame):
     # ----------------------------------------------------------------------
     def load_stock(self):
         """Load full inventory using ReportsAPI."""
-        self.tree.delete(*self.tree.get_children())
-        self._row_map.clear()
-
-        items = self.reports.get_current_stock() or []
-
-        for item in items:
-            iid = self.tree.insert(
-                "",
-                "end",
-                values=(
-                    item["book_id"],
-                    item["title"],
-                    item.get("category", ""),
-                    item.get("publisher", ""),
-                    item.get("stock", ""),
-                    format_currency(item.get("price", 0)),
-                )
-            )
-            self._row_map[iid] = item
+        run_in_background(self, "stock", self.reports.get_current_stock,
+                          on_done=self.show_items, indicator=self.loading)
 
     def show_low_stock(self):
         """Display only low-stock items using ReportsAPI."""
@@ -121,12 +107,15 @@ class ManageInventoryView(tk.Frame):
         if threshold is None:
             return
 
+        # Same key as load_stock: whichever was asked for last wins
+        run_in_background(self, "stock", self.reports.get_low_stock, threshold,
+                          on_done=self.show_items, indicator=self.loading)
+
+    def show_items(self, items):
         self.tree.delete(*self.tree.get_children())
         self._row_map.clear()
 
-        items = self.reports.get_low_stock(threshold) or []
-
-        for item in items:
+        for item in items or []:
             iid = self.tree.insert(
                 "",
                 "end",
@@ -4,7 +4,9 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 
 from frontend.api_client import PublishersClient
+from frontend.background import run_in_background
 from frontend.views.details_popup import DetailsPopup  # optional: show details on double-click
+from frontend.views.components.loading_indicator import LoadingIndicator
 
 
 class PublisherFormDialog(simpledialog.Dialog):
@@ -74,6 +76,7 @@ class ManagePublishersView(tk.Frame):
         self.pack(fill="both", expand=True)
         self._row_map = {}
         self.build_ui()
+        self.loading = LoadingIndicator(self)
         self.load_publishers()
 
     def build_ui(self):
@@ -107,10 +110,13 @@ class ManagePublishersView(tk.Frame):
         self.tree.configure(yscrollcommand=sy.set)
 
     def load_publishers(self):
+        run_in_background(self, "records", self.client.get_all,
+                          on_done=self.show_publishers, indicator=self.loading)
+
+    def show_publishers(self, pubs):
         self.tree.delete(*self.tree.get_children())
         self._row_map.clear()
-        pubs = self.client.get_all() or []
-        for p in pubs:
+        for p in pubs or []:
             vals = (
                 p.get("publisher_id"),
                 p.get("name", ""),
@@ -190,7 +196,9 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 
 from frontend.api_client import PublishersClient
+from frontend.background import run_in_background
 from frontend.views.details_popup import DetailsPopup  # optional: show details on double-click
+from frontend.views.components.loading_indicator import LoadingIndicator
 
 
 class PublisherFormDialog(simpledialog.Dialog):
@@ -260,6 +268,7 @@ class ManagePublishersView(tk.Frame):
         self.pack(fill="both", expand=True)
         self._row_map = {}
         self.build_ui()
+        self.loading = LoadingIndicator(self)
         self.load_publishers()
 
     def build_ui(self):
@@ -293,10 +302,13 @@ class ManagePublishersView(tk.Frame):
         self.tree.configure(yscrollcommand=sy.set)
 
     def load_publishers(self):
+        run_in_background(self, "records", self.client.get_all,
+                          on_done=self.show_publishers, indicator=self.loading)
+
+    def show_publishers(self, pubs):
         self.tree.delete(*self.tree.get_children())
         self._row_map.clear()
-        pubs = self.client.get_all() or []
-        for p in pubs:
+        for p in pubs or []:
             vals = (
                 p.get("publisher_id"),
                 p.get("name", ""),
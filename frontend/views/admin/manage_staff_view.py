@@ -4,7 +4,9 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 
 from frontend.api_client import StaffClient
+from frontend.background import run_in_background
 from frontend.views.details_popup import DetailsPopup
+from frontend.views.components.loading_indicator import LoadingIndicator
 
 
 ROLES = ["Admin", "Manager", "Sales", "Staff", "Clerk", "Support"]
@@ -115,6 +117,7 @@ class ManageStaffView(tk.Frame):
 
         self.pack(fill="both", expand=True)
         self.build_ui()
+        self.loading = LoadingIndicator(self)
         self.load_data()
 
     def build_ui(self):
@@ -147,11 +150,14 @@ class ManageStaffView(tk.Frame):
         sb.place(relx=0.985, rely=0.13, relheight=0.75)
 
     def load_data(self):
+        run_in_background(self, "records", self.client.get_all,
+                          on_done=self.show_data, indicator=self.loading)
+
+    def show_data(self, records):
         self.tree.delete(*self.tree.get_children())
         self._row_map.clear()
 
-        records = self.client.get_all() or []
-        for rec in records:
+        for rec in records or []:
             vals = (
                 rec.get("staff_id"),
                 rec.get("username"),
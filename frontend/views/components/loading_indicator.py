@@ -0,0 +1,38 @@
+# frontend/views/components/loading_indicator.py
+
+import tkinter as tk
+from tkinter import ttk
+
+
+class LoadingIndicator(tk.Frame):
+
+    def __init__(self, master, text="Loading..."):
+        """
+        master -> widget to overlay; the indicator sits in its top-right corner
+        text -> label shown next to the progress bar
+
+        start()/stop() calls nest: it stays visible until every start() has
+        been matched by a stop(). Placed with place(), so it works whatever
+        geometry manager the master uses.
+        """
+        super().__init__(master, bd=1, relief="solid", padx=6, pady=3)
+        self._active = 0
+
+        tk.Label(self, text=text, font=("Arial", 9)).pack(side="left", padx=(0, 6))
+        self.bar = ttk.Progressbar(self, mode="indeterminate", length=80)
+        self.bar.pack(side="left")
+
+    def start(self):
+        self._active += 1
+        if self._active == 1:
+            self.place(relx=1.0, rely=0.0, x=-8, y=8, anchor="ne")
+            self.lift()
+            self.bar.start(15)
+
+    def stop(self):
+        if self._active == 0:
+            return
+        self._active -= 1
+        if self._active == 0:
+            self.bar.stop()
+            self.place_forget()
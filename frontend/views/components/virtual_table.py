@@ -0,0 +1,277 @@
+# frontend/views/components/virtual_table.py
+
+import tkinter as tk
+from tkinter import ttk
+
+from frontend.background import background, run_in_background
+from frontend.views.components.loading_indicator import LoadingIndicator
+
+
+class VirtualTable(tk.Frame):
+
+    def __init__(self, master, columns=(), formatters=None, page_size=200, prefetch=50):
+        """
+        master -> parent frame
+        columns -> record keys shown as columns
+        formatters -> optional {column: function(value) -> display text}
+        page_size -> rows fetched per backend call
+        prefetch -> fetch the next page when the view is this close to the end
+
+        A Treeview that only holds the rows on screen. Records live in a
+        Python list; scrolling re-fills the same few Treeview items instead of
+        inserting one item per record. Pages are fetched in the background as
+        the user scrolls, and clicking a sortable heading re-queries the
+        backend in that order.
+
+        row_data maps the Treeview item ids on screen to their records, so
+        double-click handlers can use tree.identify_row() as with a plain
+        Treeview.
+        """
+        super().__init__(master)
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.page_size = page_size
+        self.prefetch = prefetch
+
+        self.tree = ttk.Treeview(self, columns=[], show="headings", selectmode="browse")
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.loading = LoadingIndicator(self)
+
+        self.records = []       # every record loaded so far
+        self.row_data = {}      # item id on screen -> record
+        self.offset = 0         # index of the first record on screen
+        self.visible = 20       # rows that fit on screen
+        self._selected = None   # index of the selected record
+
+        self._columns = []
+        self._formatters = {}
+        self._fetch = None      # fetch_page(limit, after, order_by, descending)
+        self._cursor = None
+        self._has_more = False
+        self._fetching = False
+        self._complete = False
+        self._sortable = {}     # column -> backend order_by field
+        self._order_by = None
+        self._descending = False
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self._on_wheel)
+        self.tree.bind("<Up>", lambda e: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda e: self._move_selection(-self.visible))
+        self.tree.bind("<Next>", lambda e: self._move_selection(self.visible))
+
+        if columns:
+            self.set_columns(columns, formatters=formatters)
+
+    # -------------------------------------------------------------
+    # SETUP
+    # -------------------------------------------------------------
+    def set_columns(self, columns, width=140, formatters=None):
+        self._columns = list(columns)
+        self._formatters = dict(formatters or {})
+        self.tree.delete(*self.tree.get_children())
+        self.tree.configure(columns=self._columns)
+        for col in self._columns:
+            self.tree.column(col, width=width, anchor="w")
+        self._update_headings()
+        self._render()
+
+    def load(self, fetch_page, sortable=None):
+        """
+        Shows the records returned by fetch_page(limit, after, order_by, descending),
+        which returns {"rows", "next_cursor", "has_more"} or None on error.
+        sortable maps columns to the order_by values the backend accepts.
+        """
+        self._fetch = fetch_page
+        self._sortable = dict(sortable or {})
+        if self._order_by not in self._sortable.values():
+            self._order_by, self._descending = None, False
+        self._restart()
+
+    def load_records(self, records):
+        """
+        Shows a list that is already complete (no paging, no server-side sort).
+        Cancels any page still being fetched.
+        """
+        self._fetch = None
+        self._sortable = {}
+        self._order_by, self._descending = None, False
+        self._reset(records or [])
+        self._has_more = False
+        self._complete = True
+        # A page still in flight must not land on top of these records
+        background.cancel_for(self, "page")
+        self._render()
+
+    def sort_by(self, column):
+        field = self._sortable.get(column)
+        if field is None:
+            return
+        self._descending = not self._descending if field == self._order_by else False
+        self._order_by = field
+        self._restart()
+
+    def is_complete(self):
+        """True when every record of the current listing is loaded."""
+        return self._complete
+
+    def identify_record(self, y):
+        return self.row_data.get(self.tree.identify_row(y))
+
+    def selected_record(self):
+        if self._selected is None or self._selected >= len(self.records):
+            return None
+        return self.records[self._selected]
+
+    # -------------------------------------------------------------
+    # PAGING
+    # -------------------------------------------------------------
+    def _reset(self, records):
+        self.records = list(records)
+        self.offset = 0
+        self._selected = None
+        self._cursor = None
+        self._fetching = False
+        self._complete = False
+
+    def _restart(self):
+        self._reset([])
+        self._has_more = self._fetch is not None
+        self._update_headings()
+        self._render()
+        self._fetch_next()
+
+    def _fetch_next(self):
+        if self._fetching or not self._has_more:
+            return
+        self._fetching = True
+        run_in_background(
+            self, "page", self._fetch, self.page_size, self._cursor, self._order_by, self._descending,
+            on_done=self._on_page, indicator=self.loading
+        )
+
+    def _on_page(self, page):
+        self._fetching = False
+        if not page:
+            self._has_more = False
+        else:
+            self.records.extend(page["rows"])
+            self._cursor = page["next_cursor"]
+            self._has_more = page["has_more"]
+            self._complete = not self._has_more
+        self._render()
+        self._prefetch()
+
+    def _prefetch(self):
+        if self.offset + self.visible + self.prefetch >= len(self.records):
+            self._fetch_next()
+
+    # -------------------------------------------------------------
+    # RENDERING
+    # -------------------------------------------------------------
+    def _render(self):
+        self.offset = max(0, min(self.offset, len(self.records) - self.visible))
+        window = self.records[self.offset:self.offset + self.visible]
+
+        items = self.tree.get_children()
+        if len(items) > len(window):
+            self.tree.delete(*items[len(window):])
+
+        self.row_data.clear()
+        selected_item = None
+        for i, record in enumerate(window):
+            values = [self._format(col, record.get(col, "")) for col in self._columns]
+            if i < len(items):
+                item = items[i]
+                self.tree.item(item, values=values)
+            else:
+                item = self.tree.insert("", "end", values=values)
+            self.row_data[item] = record
+            if self.offset + i == self._selected:
+                selected_item = item
+
+        # Items are reused for other records, so the selection follows the record
+        if selected_item:
+            self.tree.selection_set(selected_item)
+        else:
+            self.tree.selection_remove(self.tree.selection())
+        self._update_scrollbar()
+
+    def _format(self, col, value):
+        formatter = self._formatters.get(col)
+        return formatter(value) if formatter else value
+
+    def _update_headings(self):
+        for col in self._columns:
+            text = col.replace("_", " ").title()
+            field = self._sortable.get(col)
+            if field is not None and field == self._order_by:
+                text += " ▼" if self._descending else " ▲"
+            command = (lambda c=col: self.sort_by(c)) if field is not None else ""
+            self.tree.heading(col, text=text, command=command)
+
+    def _update_scrollbar(self):
+        # Unloaded pages count as one more page, so the thumb never hits the end early
+        total = len(self.records) + (self.page_size if self._has_more else 0)
+        if total <= self.visible:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self.visible) / total))
+
+    # -------------------------------------------------------------
+    # EVENTS
+    # -------------------------------------------------------------
+    def yview(self, *args):
+        """
+        Scrollbar command: ("moveto", fraction) or ("scroll", n, "units" | "pages").
+        """
+        if args[0] == "moveto":
+            total = len(self.records) + (self.page_size if self._has_more else 0)
+            self.offset = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = self.visible if args[2] == "pages" else 1
+            self.offset += int(args[1]) * step
+        self._render()
+        self._prefetch()
+
+    def _on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.yview("scroll", -3, "units")
+        else:
+            self.yview("scroll", 3, "units")
+        return "break"
+
+    def _on_resize(self, event):
+        style = ttk.Style()
+        row_height = int(style.lookup("Treeview", "rowheight") or 20)
+        # One row's worth of space is taken by the headings
+        visible = max(1, event.height // row_height - 1)
+        if visible != self.visible:
+            self.visible = visible
+            self._render()
+            self._prefetch()
+
+    def _on_select(self, event):
+        selection = self.tree.selection()
+        items = self.tree.get_children()
+        if selection and selection[0] in items:
+            self._selected = self.offset + items.index(selection[0])
+
+    def _move_selection(self, step):
+        if not self.records:
+            return "break"
+        current = self._selected if self._selected is not None else self.offset - (1 if step > 0 else 0)
+        self._selected = max(0, min(len(self.records) - 1, current + step))
+        if self._selected < self.offset:
+            self.offset = self._selected
+        elif self._selected >= self.offset + self.visible:
+            self.offset = self._selected - self.visible + 1
+        self._render()
+        self._prefetch()
+        return "break"
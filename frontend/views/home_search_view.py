@@ -1,15 +1,40 @@
 # frontend/views/home_search_view.py
 
 import tkinter as tk
+from functools import partial
 from tkinter import ttk
 
+from backend.search.inverted_index import MIN_PREFIX_LENGTH, tokenize
 from frontend.api_client import (
     BooksClient, AuthorsClient, PublishersClient
 )
+from frontend.background import run_in_background
 
 from frontend.views.components.side_menu import SideMenu
+from frontend.views.components.virtual_table import VirtualTable
 from frontend.views.details_popup import DetailsPopup
 
+# Pause in typing before a live search runs
+SEARCH_DEBOUNCE_MS = 150
+# "any" searches the in-memory prefix index instead of one column
+ANY_FIELD = "any"
+
+
+def can_refine_prefix_search(previous, query, exhaustive):
+    """
+    True if the hits of a prefix-index search for query are exactly the hits
+    of previous that still match, so they can be filtered locally: previous
+    was exhaustive (no prefix expansion cut off) and query only lengthens its
+    terms, each at least MIN_PREFIX_LENGTH long. Shorter terms only match
+    whole words, and a new word may have its own expansion cut off.
+    """
+    if not exhaustive:
+        return False
+    old, new = tokenize(previous), tokenize(query)
+    return len(old) == len(new) and all(
+        len(o) >= MIN_PREFIX_LENGTH and n.startswith(o) for o, n in zip(old, new)
+    )
+
 
 class HomeSearchView(tk.Frame):
     """
@@ -29,7 +54,7 @@ class HomeSearchView(tk.Frame):
         self.authors = AuthorsClient()
         self.publishers = PublishersClient()
 
-        # Full-record map: item_id → dict(record)
+        # Full-record map: item_id → dict(record), for the rows on screen
         self._row_data = {}
 
         # Layout
@@ -53,20 +78,48 @@ class HomeSearchView(tk.Frame):
 
         # Search fields per entity type
         self.search_fields = {
-    "Books": ["title", "isbn", "genre", "language",
+    "Books": [ANY_FIELD, "title", "isbn", "genre", "language",
               "price", "description", "author", "publisher_name"],
-    "Authors": ["full_name", "bio", "country"],
-    "Publishers": ["name", "location", "contact_email", "phone"]
+    "Authors": [ANY_FIELD, "full_name", "bio", "country"],
+    "Publishers": [ANY_FIELD, "name", "location", "contact_email", "phone"]
 }
 
+        # Backend field of an ANY_FIELD search (None: the free-text book search)
+        self.index_search_field = {
+            "Books": None,
+            "Authors": "name_prefix",
+            "Publishers": "name_prefix"
+        }
+
+        # Record text matched by an ANY_FIELD search, for refining results locally
+        self.index_fields = {
+            "Books": ["title", "isbn", "author", "publisher_name", "genre"],
+            "Authors": ["full_name"],
+            "Publishers": ["name"]
+        }
+
 
         # Table columns per entity type
         self.table_columns = {
-            "Books": ["book_id", "title", "description", "author", "publisher_name", "genre", "price", "stock"],
+            "Books": ["book_id", "title", "author", "publisher_name", "genre", "price", "stock"],
             "Authors": ["author_id", "full_name", "country", "birth_year"],
             "Publishers": ["publisher_id", "name", "location", "contact_email"]
         }
 
+        # Columns the backend can sort by (column → order_by)
+        self.sort_fields = {
+            "Books": {"title": "title", "price": "price"},
+            "Authors": {"full_name": "full_name"},
+            "Publishers": {"name": "name"}
+        }
+
+        # API client per entity type (get_page / search_page)
+        self.clients = {
+            "Books": self.books,
+            "Authors": self.authors,
+            "Publishers": self.publishers
+        }
+
         # Build UI
         self.build_header()
         self.build_search_panel()
@@ -114,31 +167,29 @@ class HomeSearchView(tk.Frame):
             state="readonly", width=18
         )
         self.search_by_menu.grid(row=0, column=3, padx=5)
+        self.search_by_menu.bind("<<ComboboxSelected>>", lambda e: self.perform_search())
 
-        # Search query input
+        # Search query input: results follow the text as it is typed
         self.search_entry = ttk.Entry(panel, width=30)
         self.search_entry.grid(row=0, column=4, padx=5)
+        self.search_entry.bind("<KeyRelease>", self.on_search_key)
+        self.search_entry.bind("<Return>", lambda e: self.perform_search(force=True))
+        self._debounce = None
+        self._last_search = None   # (entity, field, query) the table shows
+        self._exhaustive = {}      # loaded from the prefix index with every expansion complete
 
         # Search button
-        ttk.Button(panel, text="Search", command=self.perform_search).grid(row=0, column=5, padx=5)
+        ttk.Button(panel, text="Search", command=lambda: self.perform_search(force=True)).grid(row=0, column=5, padx=5)
 
     # ----------------------------------------------------
     # TABLE
     # ----------------------------------------------------
     def build_table(self):
-        container = tk.Frame(self.main_area)
-        container.grid(row=2, column=0, sticky="nsew")
-        container.columnconfigure(0, weight=1)
-        container.rowconfigure(0, weight=1)
-
-        # Treeview
-        self.tree = ttk.Treeview(container, columns=[], show="headings")
-        self.tree.grid(row=0, column=0, sticky="nsew")
-
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(container, orient="vertical", command=self.tree.yview)
-        scrollbar.grid(row=0, column=1, sticky="ns")
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        # Only the visible rows are materialized; pages load as the user scrolls
+        self.table = VirtualTable(self.main_area)
+        self.table.grid(row=2, column=0, sticky="nsew")
+        self.tree = self.table.tree
+        self._row_data = self.table.row_data
 
         # Double-click → Details popup
         self.tree.bind("<Double-1>", self.on_row_double_click)
@@ -156,8 +207,8 @@ class HomeSearchView(tk.Frame):
         # Update table columns
         self.setup_table_columns(entity)
 
-        # Load default listing
-        self.load_default()
+        # Load default listing (or the results for the text already typed)
+        self.perform_search(force=True)
 
     # ----------------------------------------------------
     # SET TABLE COLUMNS
@@ -166,45 +217,15 @@ class HomeSearchView(tk.Frame):
         if not hasattr(self, "tree") or not self.tree:
             return  # safety check
 
-        cols = self.table_columns[entity]
-        self.tree.configure(columns=cols)
-
-        for col in cols:
-            self.tree.heading(col, text=col.replace("_", " ").title())
-            self.tree.column(col, width=140, anchor="w")
+        self.table.set_columns(self.table_columns[entity])
 
     # ----------------------------------------------------
     # LOAD DEFAULT LIST (Books by default)
     # ----------------------------------------------------
     def load_default(self):
         entity = self.search_for_var.get()
-
-        if entity == "Books":
-            data = self.books.get_all()
-        elif entity == "Authors":
-            data = self.authors.get_all()
-        else:
-            data = self.publishers.get_all()
-
-        self.populate_table(data, entity)
-
-    # ----------------------------------------------------
-    # POPULATE TREEVIEW
-    # ----------------------------------------------------
-    def populate_table(self, records, entity):
-        self._row_data.clear()
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-
-        if not records:
-            return
-
-        cols = self.table_columns[entity]
-
-        for rec in records:
-            values = [rec.get(col, "") for col in cols]
-            iid = self.tree.insert("", "end", values=values)
-            self._row_data[iid] = rec
+        # Loading another listing (e.g. switching entity mid-load) cancels this one
+        self.table.load(self.clients[entity].get_page, self.sort_fields[entity])
 
     # ----------------------------------------------------
     # DOUBLE-CLICK → DETAILS POPUP
@@ -218,25 +239,93 @@ class HomeSearchView(tk.Frame):
         if not record:
             return
 
+        # Listing rows hold the table columns only; the popup shows the full record
         entity = self.search_for_var.get()
-        DetailsPopup(self, entity, record)
+        record_id = record.get(self.table_columns[entity][0])
+        run_in_background(self, "details", self.clients[entity].get_by_id, record_id,
+                          on_done=lambda full: DetailsPopup(self, entity, full or record))
 
     # ----------------------------------------------------
     # PERFORM SEARCH
     # ----------------------------------------------------
-    def perform_search(self):
+    def on_search_key(self, event):
+        """Restarts the debounce timer on every keystroke."""
+        if self._debounce is not None:
+            self.after_cancel(self._debounce)
+        self._debounce = self.after(SEARCH_DEBOUNCE_MS, self.perform_search)
+
+    def perform_search(self, force=False):
+        if self._debounce is not None:
+            self.after_cancel(self._debounce)
+            self._debounce = None
+
         entity = self.search_for_var.get()
         field = self.search_by_var.get()
         query = self.search_entry.get().strip()
 
-        if entity == "Books":
-            data = self.books.search_by(field, query)
-        elif entity == "Authors":
-            data = self.authors.search_by(field, query)
+        search = (entity, field, query)
+        previous, self._last_search = self._last_search, search
+        if search == previous and not force:
+            return  # e.g. arrow keys: nothing changed
+        previous_exhaustive, self._exhaustive = self._exhaustive, {"value": True}
+
+        if not query:
+            self.load_default()
+            return
+
+        # Typing more letters only narrows the results: filter what is loaded
+        if (previous and previous[:2] == (entity, field) and previous[2]
+                and query.startswith(previous[2]) and not force and self.table.is_complete()
+                and (field != ANY_FIELD
+                     or can_refine_prefix_search(previous[2], query, previous_exhaustive["value"]))):
+            records = self.refine(self.table.records, entity, field, query)
+            if records is not None:
+                self.table.load_records(records)
+                return
+
+        # A new load supersedes the query still in flight
+        if field == ANY_FIELD:
+            # Ranked by relevance, so no column sorting
+            self.table.load(partial(self.search_index_page, self.clients[entity],
+                                    self.index_search_field[entity], query, self._exhaustive))
         else:
-            data = self.publishers.search_by(field, query)
+            self.table.load(partial(self.clients[entity].search_page, field, query), self.sort_fields[entity])
 
-        self.populate_table(data, entity)
+    @staticmethod
+    def search_index_page(client, field, query, exhaustive, limit, after=None, order_by=None, descending=False):
+        """
+        Fetches one page of a prefix-index search (on a worker thread) and
+        notes in exhaustive["value"] whether any prefix expansion was cut off.
+        """
+        page = client.search_page(field, query, limit, after, order_by, descending)
+        if page is not None and not page["exhaustive"]:
+            exhaustive["value"] = False
+        return page
+
+    def refine(self, records, entity, field, query):
+        """
+        Filters records already matching a shorter query down to those matching
+        query, the way the backend would. Returns None if that cannot be done
+        locally (non-text field, or a column the listing does not load).
+        """
+        if field == ANY_FIELD:
+            # Every word must start some word of the indexed fields
+            terms = tokenize(query)
+            matched = []
+            for rec in records:
+                text = " ".join(str(rec.get(f) or "") for f in self.index_fields[entity])
+                words = tokenize(text + " " + str(rec.get("isbn") or "").replace("-", ""))
+                if all(any(w.startswith(t) for w in words) for t in terms):
+                    matched.append(rec)
+            return matched
+
+        # Column search is a case-insensitive substring match (SQL LIKE)
+        if field not in self.clients[entity].fields:
+            return None
+        if any(rec.get(field) is not None and not isinstance(rec.get(field), str) for rec in records):
+            return None
+        needle = query.lower()
+        return [rec for rec in records if needle in (rec.get(field) or "").lower()]
 
     # ----------------------------------------------------
     # HANDLE PAGE SWITCH (from side menu)
@@ -3,6 +3,8 @@ import tkinter as tk
 from tkinter import ttk
 from frontend.utils import show_error
 from frontend.api_client import StaffClient
+from frontend.background import run_in_background
+from frontend.views.components.loading_indicator import LoadingIndicator
 
 
 class LoginView(tk.Frame):
@@ -18,6 +20,7 @@ class LoginView(tk.Frame):
         self.staff_client = StaffClient()
 
         self.build_ui()
+        self.loading = LoadingIndicator(self, text="Logging in...")
 
     # -----------------------------------------------------
     # UI
@@ -50,7 +53,8 @@ class LoginView(tk.Frame):
         )
 
         # Login button
-        ttk.Button(container, text="Login", command=self.login).grid(
+        self.login_button = ttk.Button(container, text="Login", command=self.login)
+        self.login_button.grid(
             row=3, column=0, columnspan=2, pady=(12, 5)
         )
 
@@ -65,7 +69,14 @@ class LoginView(tk.Frame):
             show_error("Login Failed", "Please enter both username and password.")
             return
 
-        user_data = self.staff_client.authenticate(username, password)
+        # Password checking is slow on purpose; keep the UI responsive meanwhile
+        self.login_button.config(state="disabled", text="Logging in...")
+        run_in_background(self, "login", self.staff_client.authenticate, username, password,
+                          on_done=self.on_authenticated, on_error=lambda e: self.on_authenticated(None),
+                          indicator=self.loading)
+
+    def on_authenticated(self, user_data):
+        self.login_button.config(state="normal", text="Login")
 
         if user_data is None:
             show_error("Login Failed", "Invalid username or password.")
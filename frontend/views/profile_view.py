@@ -4,6 +4,9 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 
 from frontend.api_client import UsersClient
+from frontend.app_state import AppState
+from frontend.background import run_in_background
+from frontend.views.components.loading_indicator import LoadingIndicator
 
 
 class ProfileView(tk.Frame):
@@ -16,10 +19,14 @@ class ProfileView(tk.Frame):
         super().__init__(root)
 
         self.root = root
-        self.user = user             # dict from login: {user_id, username, role, ...}
+        self.user = user             # dict from login: {staff_id, username, role, token, ...}
         self.go_back = go_back       # function from navigation controller
         self.users = UsersClient()   # API client
 
+        # Session token issued at login; identifies the user for every call below
+        current = AppState.get_instance().current_user or {}
+        self.token = self.user.get("token") or current.get("token")
+
         self.grid(row=0, column=0, sticky="nsew")
         self.columnconfigure(0, weight=1)
         self.rowconfigure(1, weight=1)
@@ -27,6 +34,7 @@ class ProfileView(tk.Frame):
         self.build_header()
         self.build_profile_form()
         self.build_password_form()
+        self.loading = LoadingIndicator(self)
 
         # Load profile details from backend
         self.load_profile()
@@ -118,7 +126,8 @@ class ProfileView(tk.Frame):
             row=2, column=1, padx=10, pady=8, sticky="ew"
         )
 
-        ttk.Button(frame, text="Update Password", command=self.change_password).grid(
+        self.password_button = ttk.Button(frame, text="Update Password", command=self.change_password)
+        self.password_button.grid(
             row=3, column=0, columnspan=2, pady=10
         )
 
@@ -127,26 +136,34 @@ class ProfileView(tk.Frame):
     # -------------------------------------------------------------------
     def load_profile(self):
         """Fetch profile details from backend."""
-        data = self.users.get_profile(self.user["username"])
-        if not data:
-            messagebox.showerror("Error", "Failed to load profile.")
+        if not self.token:
+            self.show_profile(None)
+            return
+        run_in_background(self, "profile", self.users.get_profile, self.token,
+                          on_done=self.show_profile, indicator=self.loading)
+
+    def show_profile(self, user):
+        if not user:
+            messagebox.showerror("Error", "Failed to load profile. Please log in again.")
             return
-        for user in data:
-            self.user_id.set(user.get("staff_id", ""))
-            self.name_var.set(user.get("full_name", ""))
-            self.email_var.set(user.get("email", ""))
-            self.role_var.set(user.get("role",""))
+        self.user_id.set(user.get("staff_id", ""))
+        self.name_var.set(user.get("full_name") or "")
+        self.email_var.set(user.get("email") or "")
+        self.role_var.set(user.get("role") or "")
 
     # -------------------------------------------------------------------
     # SAVE PROFILE
     # -------------------------------------------------------------------
     def save_profile(self):
         updated = {
-            "name": self.name_var.get().strip(),
+            "full_name": self.name_var.get().strip(),
             "email": self.email_var.get().strip(),
         }
 
-        ok = self.users.update_profile(self.user_id, updated)
+        run_in_background(self, "save", self.users.update_profile, self.token, updated,
+                          on_done=self.on_profile_saved, indicator=self.loading)
+
+    def on_profile_saved(self, ok):
         if ok:
             messagebox.showinfo("Success", "Profile updated.")
         else:
@@ -168,7 +185,13 @@ class ProfileView(tk.Frame):
             messagebox.showwarning("Mismatch", "New passwords do not match.")
             return
 
-        ok = self.users.change_password(self.user_id, old, new)
+        self.password_button.config(state="disabled")
+        run_in_background(self, "password", self.users.change_password, self.token, old, new,
+                          on_done=self.on_password_changed, on_error=lambda e: self.on_password_changed(None),
+                          indicator=self.loading)
+
+    def on_password_changed(self, ok):
+        self.password_button.config(state="normal")
         if ok:
             messagebox.showinfo("Success", "Password changed.")
             self.old_pw_var.set("")
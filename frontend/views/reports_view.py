@@ -11,6 +11,8 @@ from frontend.api_client import (
     BooksClient,
     SalesClient
 )
+from frontend.background import run_in_background
+from frontend.views.components.loading_indicator import LoadingIndicator
 
 
 class ReportsView(tk.Frame):
@@ -49,6 +51,7 @@ class ReportsView(tk.Frame):
         self.build_summary_cards()
         self.build_charts()
         self.build_tables()
+        self.loading = LoadingIndicator(self)
 
         # Load dynamic data
         self.load_reports()
@@ -153,9 +156,14 @@ class ReportsView(tk.Frame):
     #  LOAD ALL DATA
     # ==========================================================
     def load_reports(self):
-        # Load summary metrics
-        summary = self.reports.get_summary()
+        # Both queries run in the background, side by side
+        run_in_background(self, "summary", self.reports.get_summary,
+                          on_done=self.show_summary, indicator=self.loading)
+        run_in_background(self, "top_books", self.reports.get_top_books,
+                          on_done=self.show_top_books, indicator=self.loading)
 
+    def show_summary(self, summary):
+        # Load summary metrics
         if not summary:
             messagebox.showerror("Error", "Failed to load report summary.")
             return
@@ -164,11 +172,13 @@ class ReportsView(tk.Frame):
             for data in summary:
                 lbl.config(text=data.get(key, "0") )
 
+    def show_top_books(self, top_books):
+        top_books = top_books or []
+
         # Load charts
-        self.draw_sales_chart()
+        self.draw_sales_chart(top_books)
 
         # Load tables
-        top_books = self.reports.get_top_books()
         self.populate_table(
             self.top_books_tree,
             ["book_id", "title", "author_name", "total_sold"],
@@ -179,11 +189,11 @@ class ReportsView(tk.Frame):
     # ==========================================================
     #  CHART GENERATORS
     # ==========================================================
-    def draw_sales_chart(self):
+    def draw_sales_chart(self, top_books):
         """
         Bar chart: Top 5 selling books.
         """
-        data = self.reports.get_top_books()[:5]
+        data = top_books[:5]
 
         titles = [d["title"] for d in data]
         units = [d["total_sold"] for d in data]
@@ -4,6 +4,7 @@ import tkinter as tk
 from backend.initialize import Backend
 from backend.utils.logger import logger
 
+from frontend.app_state import AppState
 from frontend.views.login_view import LoginView
 from frontend.views.home_search_view import HomeSearchView
 from frontend.splash_screen import SplashScreen
@@ -67,8 +68,10 @@ class App(tk.Tk):
     def on_login_success(self, user_data):
         """
         Called from LoginView after successful login.
-        user_data should contain 'role' and 'full_name'.
+        user_data should contain 'role' and 'full_name', plus the session 'token'.
         """
+        self.user_info = user_data
+        AppState.get_instance().current_user = user_data
         role = user_data.get("role", "customer")
         full_name = user_data.get("full_name") or "Customer"
         self.show_home(role, full_name)
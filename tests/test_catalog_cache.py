@@ -0,0 +1,200 @@
+# tests/test_catalog_cache.py
+#
+# Pins the book cache behind BooksAPI: LRU eviction, TTL expiry, which
+# listings are kept, and the invalidation paths writes go through.
+# Run from the project root: python -m pytest -q
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from backend.cache import catalog_cache as catalog_cache_module
+from backend.cache.catalog_cache import CatalogCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(catalog_cache_module.time, "monotonic", clock)
+    return clock
+
+
+def book(book_id, author_id=1, publisher_id=None, category_id=None):
+    return {"book_id": book_id, "title": f"Book {book_id}", "author_id": author_id,
+            "publisher_id": publisher_id, "category_id": category_id}
+
+
+def cached_ids(cache, book_ids):
+    found, _ = cache.get_many(book_ids)
+    return sorted(found)
+
+
+# -------------------------------------------------------------
+# eviction
+# -------------------------------------------------------------
+def test_least_recently_used_row_is_evicted():
+    cache = CatalogCache(max_rows=3)
+    cache.put_many([book(1), book(2), book(3)])
+    cache.get(1)                      # 2 is now the oldest
+    cache.put(book(4))
+
+    assert cached_ids(cache, [1, 2, 3, 4]) == [1, 3, 4]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_evicted_row_leaves_the_link_maps():
+    cache = CatalogCache(max_rows=1)
+    cache.put(book(1, author_id=7))
+    cache.put(book(2, author_id=8))
+    assert 7 not in cache._by_link["author_id"]
+
+
+def test_least_recently_used_listing_is_evicted():
+    cache = CatalogCache(max_listings=2)
+    cache.put_listing("a", [1], None, False)
+    cache.put_listing("b", [2], None, False)
+    cache.get_listing("a")
+    cache.put_listing("c", [3], None, False)
+
+    assert cache.get_listing("b") is None
+    assert cache.get_listing("a") == ((1,), None, False)
+    assert cache.get_listing("c") == ((3,), None, False)
+
+
+def test_oversize_listing_is_not_cached():
+    cache = CatalogCache(max_rows=2)
+    cache.put_listing("all", [1, 2, 3], None, False)
+    cache.put_listing("page", [1, 2], "cursor", True)
+
+    assert cache.get_listing("all") is None
+    assert cache.get_listing("page") == ((1, 2), "cursor", True)
+
+
+# -------------------------------------------------------------
+# ttl
+# -------------------------------------------------------------
+def test_entries_expire_after_ttl(clock):
+    cache = CatalogCache(ttl=60)
+    cache.put(book(1))
+    cache.put_listing("all", [1], None, False)
+
+    clock.now += 59
+    assert cache.get(1) is not None
+    assert cache.get_listing("all") is not None
+
+    clock.now += 1
+    assert cache.get(1) is None
+    assert cache.get_listing("all") is None
+    assert cache.stats()["rows"] == 0 and cache.stats()["listings"] == 0
+
+
+def test_zero_ttl_never_expires(clock):
+    cache = CatalogCache(ttl=0)
+    cache.put(book(1))
+    clock.now += 10 ** 6
+    assert cache.get(1) is not None
+
+
+@pytest.mark.parametrize("setting, ttl", [(None, 60.0), ("0", 0.0)])
+def test_process_cache_ttl_setting(setting, ttl):
+    # Read at import time, so check it in a fresh interpreter
+    env = {k: v for k, v in os.environ.items() if k != "CATALOG_CACHE_TTL"}
+    if setting is not None:
+        env["CATALOG_CACHE_TTL"] = setting
+    result = subprocess.run(
+        [sys.executable, "-c", "from backend.cache.catalog_cache import catalog_cache; print(catalog_cache.ttl)"],
+        env=env, capture_output=True, text=True, check=True
+    )
+    assert float(result.stdout) == ttl
+
+
+# -------------------------------------------------------------
+# invalidation
+# -------------------------------------------------------------
+def test_invalidate_books_keeps_listings_unless_asked():
+    cache = CatalogCache()
+    cache.put_many([book(1), book(2)])
+    cache.put_listing("all", [1, 2], None, False)
+
+    cache.invalidate_books([1])
+    assert cached_ids(cache, [1, 2]) == [2]
+    assert cache.get_listing("all") is not None
+
+    cache.invalidate_books([], listings=True)
+    assert cache.get_listing("all") is None
+
+
+@pytest.mark.parametrize("link", ["author_id", "publisher_id", "category_id"])
+def test_invalidate_link_drops_only_linked_books(link):
+    cache = CatalogCache()
+    cache.put_many([
+        book(1, author_id=1, publisher_id=1, category_id=1),
+        book(2, author_id=1, publisher_id=2, category_id=2),
+        book(3, author_id=2, publisher_id=1, category_id=1),
+    ])
+    cache.invalidate_link(link, 1)
+
+    linked = {"author_id": [1, 2], "publisher_id": [1, 3], "category_id": [1, 3]}[link]
+    assert cached_ids(cache, [1, 2, 3]) == sorted({1, 2, 3} - set(linked))
+    assert 1 not in cache._by_link[link]
+
+
+def test_invalidate_link_follows_a_book_moved_to_another_author():
+    cache = CatalogCache()
+    cache.put(book(1, author_id=1))
+    cache.put(book(1, author_id=2))
+
+    cache.invalidate_link("author_id", 1)
+    assert cache.get(1) is not None
+    cache.invalidate_link("author_id", 2)
+    assert cache.get(1) is None
+
+
+def test_invalidate_link_for_unknown_entity_still_bumps_the_generation():
+    cache = CatalogCache()
+    generation = cache.generation
+    cache.invalidate_link("publisher_id", 42, listings=True)
+    assert cache.generation == generation + 1
+
+
+# -------------------------------------------------------------
+# generation counter
+# -------------------------------------------------------------
+def test_fill_read_before_an_invalidation_is_dropped():
+    cache = CatalogCache()
+    generation = cache.generation          # a reader starts its query
+    cache.invalidate_books([1], listings=True)   # a writer commits meanwhile
+
+    cache.put(book(1), generation)
+    cache.put_listing("all", [1], None, False, generation)
+    assert cache.get(1) is None
+    assert cache.get_listing("all") is None
+
+    generation = cache.generation
+    cache.put(book(1), generation)
+    cache.put_listing("all", [1], None, False, generation)
+    assert cache.get(1) is not None
+    assert cache.get_listing("all") is not None
+
+
+def test_clear_drops_everything_and_bumps_the_generation():
+    cache = CatalogCache()
+    cache.put(book(1))
+    cache.put_listing("all", [1], None, False)
+    generation = cache.generation
+
+    cache.clear()
+    assert cache.generation == generation + 1
+    assert cache.get(1) is None and cache.get_listing("all") is None
+    assert all(not ids for ids in cache._by_link.values())
+    assert cache.stats()["invalidations"] == 1
@@ -0,0 +1,206 @@
+# tests/test_inverted_index.py
+#
+# Pins the search index: tokenizer, prefix expansion, ranking, paging and the
+# incremental maintenance the API classes rely on.
+# Run from the project root: python -m pytest -q
+
+import pytest
+
+from backend.search import inverted_index
+from backend.search.book_index import BookSearchIndex
+from backend.search.inverted_index import InvertedIndex, tokenize
+
+
+def make_index(docs):
+    index = InvertedIndex({"title": 1.0})
+    index.add_many((doc_id, {"title": title}) for doc_id, title in docs.items())
+    return index
+
+
+@pytest.fixture
+def book_index():
+    """
+    A built BookSearchIndex without a database: authors 1-2, publisher 1,
+    books 10-13.
+    """
+    index = BookSearchIndex()
+    index.entities["author"].add_many([(1, {"name": "J. K. Rowling"}), (2, {"name": "J. R. R. Tolkien"})])
+    index.entities["publisher"].add_many([(1, {"name": "Bloomsbury"})])
+    for row in (
+        {"book_id": 10, "title": "Harry Potter and the Philosopher's Stone", "isbn": "978-0-7475-3269-9",
+         "author_id": 1, "publisher_id": 1},
+        {"book_id": 11, "title": "Harry Potter and the Chamber of Secrets", "isbn": None,
+         "author_id": 1, "publisher_id": 1},
+        {"book_id": 12, "title": "The Hobbit", "isbn": None, "author_id": 2},
+        {"book_id": 13, "title": "The Silmarillion", "isbn": None, "author_id": 2},
+    ):
+        index._link_book(row)
+        index.books.add(row["book_id"], {"title": row["title"], "isbn": row["isbn"]})
+    index.built_at = 0.0
+    return index
+
+
+def ids(hits):
+    return [doc_id for doc_id, _ in hits]
+
+
+# -------------------------------------------------------------
+# TOKENIZER
+# -------------------------------------------------------------
+@pytest.mark.parametrize("text, tokens", [
+    ("Harry Potter", ["harry", "potter"]),
+    ("The Philosopher's Stone!", ["the", "philosopher", "s", "stone"]),
+    ("978-0-7475", ["978", "0", "7475"]),
+    ("Éclair  naïve", ["éclair", "naïve"]),
+    ("", []),
+    (None, []),
+    (1984, ["1984"]),
+])
+def test_tokenize(text, tokens):
+    assert tokenize(text) == tokens
+
+
+# -------------------------------------------------------------
+# PREFIX EXPANSION
+# -------------------------------------------------------------
+def test_expand_returns_exact_token_and_completions():
+    index = make_index({1: "harry", 2: "hare", 3: "harbour", 4: "hobbit"})
+    assert index.expand("har") == [("harbour", False), ("hare", False), ("harry", False)]
+    assert index.expand("hare") == [("hare", True)]
+    assert index.expand("hare", prefix=False) == [("hare", True)]
+
+
+def test_short_terms_only_match_whole_tokens():
+    index = make_index({1: "a harry", 2: "h"})
+    assert index.expand("h") == [("h", True)]
+    assert index.expand("a") == [("a", True)]
+    assert not index.is_exhaustive("h")
+
+
+def test_expansion_keeps_the_most_common_completions(monkeypatch):
+    monkeypatch.setattr(inverted_index, "MAX_EXPANSIONS", 2)
+    index = make_index({1: "hat", 2: "hat ham", 3: "hat ham hay", 4: "hall"})
+    assert index.expand("ha") == [("hat", False), ("ham", False)]
+    assert not index.is_exhaustive("ha")
+    assert index.is_exhaustive("hat")
+    assert index.is_exhaustive("hatch")
+
+
+def test_exact_lookup_is_exhaustive():
+    index = make_index({1: "h"})
+    assert index.is_exhaustive("h", prefix=False)
+
+
+# -------------------------------------------------------------
+# RANKING
+# -------------------------------------------------------------
+def test_every_term_must_match():
+    index = make_index({1: "harry potter", 2: "harry hole", 3: "potter"})
+    assert sorted(ids(index.search("harry potter"))) == [1]
+    assert index.search("harry nobody") == []
+    assert index.search("") == []
+
+
+def test_exact_match_ranks_above_prefix_match():
+    index = make_index({1: "hobbits", 2: "hobbit"})
+    assert ids(index.search("hobbit")) == [2, 1]
+
+
+def test_rarer_terms_and_field_weights_score_higher():
+    index = InvertedIndex({"title": 2.0, "isbn": 1.0})
+    index.add_many([
+        (1, {"title": "potter", "isbn": "x"}),
+        (2, {"title": "x", "isbn": "potter"}),
+    ])
+    assert ids(index.search("potter")) == [1, 2]
+
+
+def test_ties_are_ordered_by_id():
+    index = make_index({3: "hobbit", 1: "hobbit", 2: "hobbit"})
+    assert ids(index.search("hobbit")) == [1, 2, 3]
+
+
+# -------------------------------------------------------------
+# MAINTENANCE
+# -------------------------------------------------------------
+def test_add_replaces_and_remove_drops_tokens():
+    index = make_index({1: "harry potter"})
+    index.add(1, {"title": "hobbit"})
+    assert index.search("harry") == []
+    assert ids(index.search("hob")) == [1]
+    assert len(index) == 1 and 1 in index
+
+    index.remove(1)
+    index.remove(99)
+    assert index.search("hob") == []
+    assert index.expand("hob") == []
+    assert len(index) == 0 and 1 not in index
+
+
+# -------------------------------------------------------------
+# BOOK INDEX
+# -------------------------------------------------------------
+def test_books_match_through_author_and_publisher_names(book_index):
+    hits, total = book_index.search("rowling")
+    assert sorted(ids(hits)) == [10, 11] and total == 2
+    assert ids(book_index.search("tolk hob")[0]) == [12]
+    assert ids(book_index.search("bloomsbury chamber")[0]) == [11]
+
+
+def test_isbn_is_searched_without_dashes(book_index):
+    book_index.index_book({"book_id": 10, "title": "Harry Potter and the Philosopher's Stone",
+                           "isbn": "978-0-7475-3269-9", "author_id": 1, "publisher_id": 1})
+    assert ids(book_index.search("9780747532699")[0]) == [10]
+
+
+def test_title_match_ranks_above_entity_match(book_index):
+    book_index.index_book({"book_id": 14, "title": "Tolkien: A Biography", "isbn": None, "author_id": 1})
+    assert ids(book_index.search("tolkien")[0])[0] == 14
+
+
+def test_cursor_pages_continue_below_the_last_hit(book_index):
+    everything, total = book_index.search("the")
+    assert total == 4
+
+    first, _ = book_index.search("the", limit=2)
+    assert first == everything[:2]
+    score, book_id = first[-1][1], first[-1][0]
+    rest, total = book_index.search("the", limit=2, after=(score, book_id))
+    assert rest == everything[2:4]
+    assert total == 4
+
+
+def test_index_entity_renames_for_all_books(book_index):
+    book_index.index_entity("author", 1, "Robert Galbraith")
+    assert book_index.search("rowling") == ([], 0)
+    assert sorted(ids(book_index.search("galbraith")[0])) == [10, 11]
+
+
+def test_remove_author_drops_their_books(book_index):
+    book_index.remove_entity("author", 2)
+    assert book_index.search("hobbit") == ([], 0)
+    assert 12 not in book_index.books
+
+
+def test_remove_publisher_only_unlinks_books(book_index):
+    book_index.remove_entity("publisher", 1)
+    assert book_index.search("bloomsbury") == ([], 0)
+    assert sorted(ids(book_index.search("potter")[0])) == [10, 11]
+
+
+def test_changes_during_a_rebuild_are_replayed(book_index):
+    book_index._building = True
+    book_index.remove_book(12)
+    assert 12 in book_index.books
+    book_index._building = False
+    for method, args in book_index._pending:
+        method(*args)
+    assert 12 not in book_index.books
+
+
+def test_search_entities_ranks_names(book_index):
+    # single letters match the initials as whole words only
+    hits, total = book_index.search_entities("author", "j r")
+    assert ids(hits) == [2] and total == 1
+    hits, total = book_index.search_entities("author", "tol")
+    assert ids(hits) == [2] and total == 1
@@ -0,0 +1,65 @@
+# tests/test_live_search.py
+#
+# Live search on the home screen filters loaded results locally only when the
+# prefix index answered the previous query exhaustively.
+# Run from the project root: python -m pytest -q
+
+import pytest
+
+from backend.database.sqlite_engine import connect
+from backend.search import inverted_index
+from backend.search.book_index import BookSearchIndex
+from frontend.views.home_search_view import can_refine_prefix_search
+
+
+@pytest.fixture
+def index(tmp_path):
+    conn = connect(str(tmp_path / "shop.db"))
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO authors (full_name) VALUES (%s), (%s)", ("J. K. Rowling", "J. R. R. Tolkien"))
+    cursor.execute(
+        "INSERT INTO books (title, author_id, price) VALUES (%s, %s, %s), (%s, %s, %s)",
+        ("Harry Potter", 1, 399, "The Hobbit", 2, 299)
+    )
+    conn.commit()
+    index = BookSearchIndex()
+    index.build(conn)
+    conn.close()
+    return index
+
+
+def titles(index, query):
+    hits, _ = index.search(query)
+    return sorted(index.books._doc_tokens[book_id] for book_id, _ in hits)
+
+
+def test_single_letter_only_matches_whole_words(index):
+    assert index.search("h") == ([], 0)
+    assert not index.is_exhaustive("h")
+
+
+def test_h_then_ha_queries_the_index_again(index):
+    # "h" came back empty but not exhaustive: "ha" must not be filtered from it
+    assert not can_refine_prefix_search("h", "ha", index.is_exhaustive("h"))
+    assert titles(index, "ha") == [("harry", "potter")]
+
+
+def test_longer_prefix_is_refined_from_exhaustive_results(index):
+    assert index.is_exhaustive("ha")
+    assert can_refine_prefix_search("ha", "har", True)
+    assert can_refine_prefix_search("ha po", "har pot", True)
+
+
+def test_new_word_queries_the_index_again(index):
+    assert not can_refine_prefix_search("harry", "harry p", index.is_exhaustive("harry"))
+    assert not can_refine_prefix_search("harry", "harry po", True)
+
+
+def test_truncated_expansion_is_not_exhaustive(monkeypatch, index):
+    monkeypatch.setattr(inverted_index, "MAX_EXPANSIONS", 1)
+    # "ha" now completes to "harry" and "harbour", "harr" only to "harry"
+    index.books.add(99, {"title": "Hidden Harbour"})
+    assert not index.books.is_exhaustive("ha")
+    assert not index.is_exhaustive("ha")
+    assert not can_refine_prefix_search("ha", "har", index.is_exhaustive("ha"))
+    assert index.books.is_exhaustive("harr")
@@ -0,0 +1,55 @@
+# tests/test_migrations.py
+#
+# Migrations must bring an existing database to what init_database.sql
+# creates for a new one.
+# Run from the project root: python -m pytest -q
+
+import os
+
+from backend.database.migrate import MIGRATIONS_DIR, discover, split_statements
+
+SCHEMA_FILE = os.path.join(MIGRATIONS_DIR, "..", "init_database.sql")
+
+
+def schema_statements():
+    with open(SCHEMA_FILE, encoding="utf-8") as f:
+        return split_statements(f.read())
+
+
+def test_versions_are_numbered_in_order():
+    versions = [m.version for m in discover()]
+    assert versions == list(range(1, len(versions) + 1))
+
+
+def test_split_statements_honours_delimiter_blocks():
+    statements = split_statements("""
+        CREATE TABLE t (x INT);
+        -- a comment
+        DELIMITER //
+        CREATE TRIGGER t_ai AFTER INSERT ON t FOR EACH ROW
+        BEGIN
+            SET @s = 'a;b';
+        END;
+        //
+        DELIMITER ;
+        SELECT 1;
+    """)
+    assert len(statements) == 3
+    assert statements[0] == "CREATE TABLE t (x INT)"
+    assert statements[1].startswith("CREATE TRIGGER t_ai") and statements[1].endswith("END;")
+    assert statements[2] == "SELECT 1"
+
+
+def test_rollup_migration_matches_init_schema():
+    migration = next(m for m in discover() if m.name == "daily_sales_rollup")
+    statements = migration.statements()
+    schema = schema_statements()
+
+    for statement in statements:
+        assert statement in schema
+
+    tables = [s.split()[5] for s in statements if s.startswith("CREATE TABLE")]
+    assert tables == ["daily_sales", "book_daily_sales"]
+    rollup_triggers = [s.split()[2] for s in schema
+                       if s.startswith("CREATE TRIGGER") and "daily_sales" in s.split()[2]]
+    assert [s.split()[2] for s in statements if s.startswith("CREATE TRIGGER")] == rollup_triggers
@@ -0,0 +1,182 @@
+# tests/test_pagination.py
+#
+# Pins the keyset paging helpers every listing endpoint shares: cursor
+# tokens, the limit+1 look-ahead and the tie-break on the primary key.
+# Run from the project root: python -m pytest -q
+
+import pytest
+
+from backend.database.sqlite_engine import connect
+from backend.utils.pagination import (
+    MAX_PAGE_SIZE, decode_cursor, encode_cursor, keyset_query, normalize_limit, page_rows, ranked_page
+)
+
+SORT_COLUMNS = {"price": "price", "title": "title"}
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = connect(str(tmp_path / "shop.db"))
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO authors (full_name) VALUES (%s)", ("Anon",))
+    # Several books share a price so sorting by it needs the book_id tie-break
+    for title, price in [("A", 300), ("B", 100), ("C", 300), ("D", 200), ("E", 300), ("F", 100), ("G", 300)]:
+        cursor.execute("INSERT INTO books (title, author_id, price) VALUES (%s, 1, %s)", (title, price))
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def fetch_all_pages(conn, limit, order_by=None, descending=False):
+    """Walks every page of the books listing and returns the titles in order."""
+    titles, after, pages = [], None, 0
+    while True:
+        sql, params, page_limit, key_fields = keyset_query(
+            "SELECT book_id, title, price FROM books", [], [], "book_id",
+            sort_columns=SORT_COLUMNS, limit=limit, after=after,
+            order_by=order_by, descending=descending
+        )
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(sql, params)
+        rows, after, has_more = page_rows(cursor.fetchall(), page_limit, key_fields)
+        titles += [r["title"] for r in rows]
+        pages += 1
+        assert len(rows) <= limit
+        assert has_more == (after is not None)
+        if not has_more:
+            return titles, pages
+
+
+# -------------------------------------------------------------
+# cursors
+# -------------------------------------------------------------
+@pytest.mark.parametrize("values", [[7], [2.5, 11], ["Dune", 3], ["2024-01-31 10:00:00", 9]])
+def test_cursor_round_trip(values):
+    token = encode_cursor(values)
+    assert isinstance(token, str)
+    assert decode_cursor(token) == values
+
+
+@pytest.mark.parametrize("token", ["", "not a cursor", "!!!!", encode_cursor([])[:-1], "e30=", "W10="])
+def test_bad_cursor_raises_value_error(token):
+    with pytest.raises(ValueError):
+        decode_cursor(token)
+
+
+@pytest.mark.parametrize("limit, expected", [(None, None), (1, 1), ("25", 25), (MAX_PAGE_SIZE + 1, MAX_PAGE_SIZE)])
+def test_normalize_limit(limit, expected):
+    assert normalize_limit(limit) == expected
+
+
+@pytest.mark.parametrize("limit", [0, -5, "ten", 2.5j])
+def test_bad_limit_raises_value_error(limit):
+    with pytest.raises(ValueError):
+        normalize_limit(limit)
+
+
+# -------------------------------------------------------------
+# keyset_query()
+# -------------------------------------------------------------
+def test_first_page_asks_for_one_extra_row():
+    sql, params, limit, key_fields = keyset_query(
+        "SELECT * FROM books b", ["b.stock > %s"], [0], "book_id", pk_column="b.book_id", limit=20
+    )
+    assert sql == "SELECT * FROM books b WHERE (b.stock > %s) ORDER BY b.book_id ASC LIMIT %s"
+    assert params == [0, 21]
+    assert limit == 20
+    assert key_fields == ["book_id"]
+
+
+def test_no_limit_means_no_limit_clause():
+    sql, params, limit, _ = keyset_query("SELECT * FROM books", [], [], "book_id")
+    assert sql == "SELECT * FROM books ORDER BY book_id ASC"
+    assert params == [] and limit is None
+
+
+def test_descending_sort_breaks_ties_on_the_id():
+    sql, params, _, key_fields = keyset_query(
+        "SELECT * FROM books", [], [], "book_id", sort_columns=SORT_COLUMNS,
+        limit=2, after=encode_cursor([300, 5]), order_by="price", descending=True
+    )
+    assert sql == (
+        "SELECT * FROM books WHERE (price < %s OR (price = %s AND book_id < %s)) "
+        "ORDER BY price DESC, book_id DESC LIMIT %s"
+    )
+    assert params == [300, 300, 5, 3]
+    assert key_fields == ["price", "book_id"]
+
+
+def test_unknown_sort_column_raises_value_error():
+    with pytest.raises(ValueError, match="sort column"):
+        keyset_query("SELECT * FROM books", [], [], "book_id", sort_columns=SORT_COLUMNS, order_by="stock")
+
+
+@pytest.mark.parametrize("after", ["garbage", encode_cursor([1])])
+def test_bad_cursor_for_sorted_listing_raises_value_error(after):
+    with pytest.raises(ValueError, match="cursor"):
+        keyset_query("SELECT * FROM books", [], [], "book_id", sort_columns=SORT_COLUMNS,
+                     limit=2, after=after, order_by="price")
+
+
+# -------------------------------------------------------------
+# page_rows()
+# -------------------------------------------------------------
+def test_look_ahead_row_is_trimmed():
+    rows = [{"book_id": 1}, {"book_id": 2}, {"book_id": 3}]
+    page, next_cursor, has_more = page_rows(rows, 2, ["book_id"])
+    assert page == rows[:2]
+    assert has_more
+    assert decode_cursor(next_cursor) == [2]
+
+
+def test_last_page_has_no_cursor():
+    rows = [{"book_id": 1}, {"book_id": 2}]
+    assert page_rows(rows, 2, ["book_id"]) == (rows, None, False)
+    assert page_rows(rows, None, ["book_id"]) == (rows, None, False)
+
+
+@pytest.mark.parametrize("order_by, descending, expected", [
+    (None, False, list("ABCDEFG")),
+    (None, True, list("GFEDCBA")),
+    ("price", False, list("BFDACEG")),
+    ("price", True, list("GECADFB")),
+])
+@pytest.mark.parametrize("limit", [1, 2, 3, 7])
+def test_paging_visits_every_row_once(conn, limit, order_by, descending, expected):
+    titles, pages = fetch_all_pages(conn, limit, order_by, descending)
+    assert titles == expected
+    # a full last page is recognised by the look-ahead row, not by an empty page
+    assert pages == -(-len(expected) // limit)
+
+
+# -------------------------------------------------------------
+# ranked_page()
+# -------------------------------------------------------------
+HITS = [(4, 3.0), (1, 2.0), (2, 2.0), (7, 2.0), (3, 0.5)]
+
+
+def fake_search(limit, after):
+    hits = [h for h in HITS if after is None or (-h[1], h[0]) > (-after[0], after[1])]
+    return (hits[:limit] if limit else hits), len(HITS)
+
+
+def test_ranked_pages_continue_through_ties():
+    seen, after = [], None
+    while True:
+        hits, total, after, has_more = ranked_page(fake_search, limit=2, after=after)
+        assert total == len(HITS)
+        seen += hits
+        if not has_more:
+            break
+    assert seen == HITS
+    assert after is None
+
+
+def test_ranked_page_without_limit_returns_everything():
+    assert ranked_page(fake_search) == (HITS, len(HITS), None, False)
+
+
+@pytest.mark.parametrize("after", ["garbage", encode_cursor([1]), encode_cursor(["high", 1])])
+def test_bad_ranked_cursor_raises_value_error(after):
+    with pytest.raises(ValueError):
+        ranked_page(fake_search, limit=2, after=after)
@@ -0,0 +1,104 @@
+# tests/test_sessions.py
+#
+# Pins the signed session tokens staff log in with: claims round-trip, expiry,
+# and that a token altered or signed with another key is rejected.
+# Run from the project root: python -m pytest -q
+
+import json
+
+import pytest
+
+from backend.utils import sessions
+from backend.utils.sessions import issue_token, verify_token
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = {"now": 1_700_000_000.0}
+    monkeypatch.setattr(sessions.time, "time", lambda: clock["now"])
+    return clock
+
+
+def split(token):
+    payload, signature = token.split(".")
+    return json.loads(sessions._b64decode(payload)), signature
+
+
+def forge(claims, signature):
+    payload = sessions._b64encode(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+    return f"{payload}.{signature}"
+
+
+# -------------------------------------------------------------
+# issue / verify
+# -------------------------------------------------------------
+def test_claims_round_trip(now):
+    claims = verify_token(issue_token(7, "asha", "cashier"))
+    assert claims == {
+        "staff_id": 7,
+        "username": "asha",
+        "role": "cashier",
+        "exp": int(now["now"]) + sessions.SESSION_TTL,
+    }
+
+
+def test_token_is_url_safe():
+    token = issue_token(1, "ünïcode user", "admin")
+    assert token.isascii()
+    assert "=" not in token and "+" not in token and "/" not in token
+    assert verify_token(token)["username"] == "ünïcode user"
+
+
+# -------------------------------------------------------------
+# expiry
+# -------------------------------------------------------------
+def test_token_expires_after_its_ttl(now):
+    token = issue_token(7, "asha", "cashier", ttl=60)
+    now["now"] += 59
+    assert verify_token(token) is not None
+    now["now"] += 1
+    assert verify_token(token) is None
+
+
+def test_default_ttl_is_session_ttl(now):
+    token = issue_token(7, "asha", "cashier")
+    now["now"] += sessions.SESSION_TTL - 1
+    assert verify_token(token) is not None
+    now["now"] += 1
+    assert verify_token(token) is None
+
+
+# -------------------------------------------------------------
+# tampering
+# -------------------------------------------------------------
+def test_changed_claims_are_rejected():
+    claims, signature = split(issue_token(7, "asha", "cashier"))
+    assert verify_token(forge(dict(claims, role="admin"), signature)) is None
+    assert verify_token(forge(dict(claims, staff_id=1), signature)) is None
+    assert verify_token(forge(dict(claims, exp=claims["exp"] + 3600), signature)) is None
+
+
+def test_changed_signature_is_rejected():
+    token = issue_token(7, "asha", "cashier")
+    payload, signature = token.split(".")
+    flipped = ("A" if signature[0] != "A" else "B") + signature[1:]
+    assert verify_token(f"{payload}.{flipped}") is None
+    assert verify_token(f"{payload}.") is None
+    assert verify_token(f"{payload}.{signature[:-2]}") is None
+
+
+def test_token_signed_with_another_key_is_rejected(monkeypatch):
+    token = issue_token(7, "asha", "cashier")
+    monkeypatch.setattr(sessions, "_SECRET", b"another key")
+    assert verify_token(token) is None
+
+
+def test_signed_payload_must_be_an_object():
+    payload = sessions._b64encode(b'["admin"]')
+    token = f"{payload}.{sessions._b64encode(sessions._sign(payload))}"
+    assert verify_token(token) is None
+
+
+@pytest.mark.parametrize("token", [None, "", "abc", "a.b.c", "é.é", 42])
+def test_malformed_token_is_rejected(token):
+    assert verify_token(token) is None
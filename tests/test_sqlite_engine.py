@@ -0,0 +1,178 @@
+# tests/test_sqlite_engine.py
+#
+# Pins the MySQL -> SQLite rewrites of sqlite_engine.translate() and the
+# mysql.connector behaviour SQLiteConnection emulates (lastrowid, locking).
+# Run from the project root: python -m pytest -q
+
+import sqlite3
+
+import pytest
+
+from backend.database.sqlite_engine import connect, translate
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "shop.db")
+
+
+@pytest.fixture
+def conn(db_path):
+    conn = connect(db_path)
+    yield conn
+    conn.close()
+
+
+# -------------------------------------------------------------
+# translate()
+# -------------------------------------------------------------
+def test_placeholders_become_question_marks():
+    statement = translate("SELECT * FROM books WHERE title LIKE %s AND stock > %s")
+    assert statement.sql == "SELECT * FROM books WHERE title LIKE ? AND stock > ?"
+    assert not statement.write
+
+
+def test_escaped_percent_is_unescaped():
+    statement = translate("SELECT * FROM books WHERE title LIKE 'A%%' AND book_id = %s")
+    assert statement.sql == "SELECT * FROM books WHERE title LIKE 'A%' AND book_id = ?"
+
+
+def test_trailing_semicolon_is_dropped():
+    assert translate("SELECT 1;").sql == "SELECT 1"
+
+
+def test_for_update_is_stripped_and_takes_the_write_lock():
+    statement = translate("""
+        SELECT book_id, stock FROM books
+        WHERE book_id IN (%s, %s)
+        ORDER BY book_id
+        FOR UPDATE
+    """)
+    assert "FOR UPDATE" not in statement.sql.upper()
+    assert statement.sql.endswith("ORDER BY book_id")
+    assert statement.write
+    assert not statement.insert
+
+
+@pytest.mark.parametrize("mysql, sqlite", [
+    ("o.order_date < %s + INTERVAL 1 DAY", "o.order_date < datetime(?, '+1 day')"),
+    ("created_at > NOW - INTERVAL 30 MINUTE", "created_at > datetime(NOW, '-30 minute')"),
+    ("due < o.order_date + interval 2 month", "due < datetime(o.order_date, '+2 month')"),
+])
+def test_interval_arithmetic_becomes_datetime(mysql, sqlite):
+    assert translate(f"SELECT * FROM orders o WHERE {mysql}").sql == f"SELECT * FROM orders o WHERE {sqlite}"
+
+
+def test_on_duplicate_key_update_becomes_on_conflict():
+    statement = translate(
+        "INSERT INTO books (book_id, stock) VALUES (%s, %s) "
+        "ON DUPLICATE KEY UPDATE stock = VALUES(stock)"
+    )
+    assert statement.sql == (
+        "INSERT INTO books (book_id, stock) VALUES (?, ?) "
+        "ON CONFLICT DO UPDATE SET stock = excluded.stock"
+    )
+    assert statement.write
+    assert statement.insert
+    assert not statement.returns_id
+
+
+def test_last_insert_id_upsert_returns_the_id():
+    statement = translate(
+        "INSERT INTO publishers (name) VALUES (%s) "
+        "ON DUPLICATE KEY UPDATE publisher_id = LAST_INSERT_ID(publisher_id)"
+    )
+    assert statement.sql == (
+        "INSERT INTO publishers (name) VALUES (?) "
+        "ON CONFLICT DO UPDATE SET publisher_id = publisher_id RETURNING publisher_id"
+    )
+    assert statement.returns_id
+    assert not statement.insert
+
+
+@pytest.mark.parametrize("sql, write", [
+    ("SELECT 1", False),
+    ("WITH t AS (SELECT 1) SELECT * FROM t", False),
+    ("EXPLAIN QUERY PLAN SELECT 1", False),
+    ("PRAGMA table_info(books)", False),
+    ("UPDATE books SET stock = stock - 1 WHERE book_id = %s", True),
+    ("DELETE FROM books WHERE book_id = %s", True),
+    ("CREATE TABLE t (x INTEGER)", True),
+])
+def test_write_flag(sql, write):
+    assert translate(sql).write is write
+
+
+# -------------------------------------------------------------
+# lastrowid
+# -------------------------------------------------------------
+def test_multi_row_insert_reports_the_first_id(conn):
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO categories (name) VALUES (%s)", ("Poetry",))
+    first = cursor.lastrowid
+
+    cursor.execute("INSERT INTO categories (name) VALUES (%s), (%s), (%s)", ("Drama", "Essays", "History"))
+    assert cursor.lastrowid == first + 1
+
+    cursor.execute("SELECT category_id FROM categories WHERE name = %s", ("Drama",))
+    assert cursor.fetchone()[0] == first + 1
+    conn.commit()
+
+
+def test_upsert_reports_the_existing_id(conn):
+    sql = ("INSERT INTO publishers (name) VALUES (%s) "
+           "ON DUPLICATE KEY UPDATE publisher_id = LAST_INSERT_ID(publisher_id)")
+    cursor = conn.cursor()
+    cursor.execute(sql, ("Penguin",))
+    created = cursor.lastrowid
+    cursor.execute(sql, ("Rupa",))
+    cursor.execute(sql, ("Penguin",))
+    assert cursor.lastrowid == created
+
+    cursor.execute("SELECT COUNT(*) FROM publishers")
+    assert cursor.fetchone()[0] == 2
+    conn.commit()
+
+
+# -------------------------------------------------------------
+# transactions
+# -------------------------------------------------------------
+def test_read_transaction_is_restarted_as_writer_on_first_write(db_path, conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM categories")
+    assert cursor.fetchone()[0] == 0
+    assert conn.in_transaction and not conn._writing
+
+    # Another connection commits while the first one only holds a read snapshot
+    other = connect(db_path)
+    other.cursor().execute("INSERT INTO categories (name) VALUES (%s)", ("Poetry",))
+    other.commit()
+    other.close()
+
+    # Upgrading the stale snapshot would fail with SQLITE_BUSY_SNAPSHOT
+    cursor.execute("INSERT INTO categories (name) VALUES (%s)", ("Drama",))
+    assert conn._writing
+
+    cursor.execute("SELECT COUNT(*) FROM categories")
+    assert cursor.fetchone()[0] == 2
+    conn.commit()
+    assert not conn.in_transaction and not conn._writing
+
+
+def test_for_update_holds_the_write_lock_until_commit(db_path, conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT * FROM categories FOR UPDATE")
+    cursor.fetchall()
+    assert conn._writing
+
+    other = connect(db_path, lock_timeout=0.1)
+    try:
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            other.cursor().execute("INSERT INTO categories (name) VALUES (%s)", ("Poetry",))
+        other.rollback()
+
+        conn.commit()
+        other.cursor().execute("INSERT INTO categories (name) VALUES (%s)", ("Poetry",))
+        other.commit()
+    finally:
+        other.close()